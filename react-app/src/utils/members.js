@@ -3,6 +3,8 @@
  * Extracted from members.html for React migration
  */
 
+import strategyWeightsTable from './strategyWeights.json';
+
 // Crime data from Victoria Police (rates per 100,000 population)
 export const crimeData = {
     'Banyule': 8426.88,
@@ -26,21 +28,8 @@ export const crimeData = {
     '_default': 8500.00
 };
 
-// Strategy weights configuration
-export const strategyWeights = {
-    investment: {
-        aTiers: { tier1: 0.45, tier2: 0.30, tier3: 0.15, tier4: 0.10 },
-        bTiers: { tier1: 0.40, tier2: 0.23, tier3: 0.20, tier4: 0.12, tier5: 0.05 }
-    },
-    balanced: {
-        aTiers: { tier1: 0.30, tier2: 0.30, tier3: 0.20, tier4: 0.20 },
-        bTiers: { tier1: 0.28, tier2: 0.23, tier3: 0.26, tier4: 0.15, tier5: 0.08 }
-    },
-    lifestyle: {
-        aTiers: { tier1: 0.20, tier2: 0.35, tier3: 0.15, tier4: 0.30 },
-        bTiers: { tier1: 0.18, tier2: 0.23, tier3: 0.20, tier4: 0.20, tier5: 0.19 }
-    }
-};
+// Strategy weights configuration (shared with scripts/pipeline/scores.py)
+export const strategyWeights = strategyWeightsTable;
 
 // CSV Parser - handles quoted fields with commas
 function parseCSVLine(line) {
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+OCR Throughput and Accuracy Benchmark
+
+Runs the OCR pipeline of scripts/ocr-extract-suburb-data.py over a folder
+of screenshots that have ground-truth sidecars (see
+scripts/generate-synthetic-screenshots.py) and reports:
+
+- images/sec end to end
+- per-stage latency (preprocess, OCR, parse) median and p95
+- field-level accuracy of the parsed rows against ground truth,
+  overall and per noise level / JPEG quality
+- with --refine, how many low-confidence boxes the second OCR pass
+  re-read and improved (compare accuracy with a run without it)
+- with --crop-compare, pixels OCR'd and OCR time with and without the
+  table-region crop
+
+Usage:
+    python3 scripts/generate-synthetic-screenshots.py
+    python3 scripts/benchmark-ocr.py
+    python3 scripts/benchmark-ocr.py --images data/benchmarks/screenshots --limit 20
+    python3 scripts/benchmark-ocr.py --batch-size 8 --batch-workers 4
+    python3 scripts/benchmark-ocr.py --crop-compare --limit 20
+    python3 scripts/benchmark-ocr.py --refine 0.5
+
+Requirements:
+- Python packages: pip install easyocr pillow opencv-python pandas
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from pipeline import BASE_DIR, DATA_DIR
+from pipeline.loader import load_script
+from pipeline.ocr_batch import readtext_batched
+from pipeline.screenshots import load_truth, score_rows
+
+IMAGES_DIR = DATA_DIR / 'benchmarks' / 'screenshots'
+OUTPUT_JSON = DATA_DIR / 'benchmarks' / 'ocr-benchmark.json'
+
+STAGES = ['preprocess', 'ocr', 'parse']
+
+
+def format_percent(value) -> str:
+    """A fraction as a percentage, '-' when there was nothing to measure"""
+    if value is None:
+        return '-'
+    return f'{value * 100:.1f}%'
+
+
+def summarize_latency(samples: List[float]) -> Dict[str, float]:
+    values = np.array(samples) * 1000
+    return {
+        'median_ms': round(float(np.median(values)), 1),
+        'p95_ms': round(float(np.percentile(values, 95)), 1),
+        'total_s': round(float(values.sum() / 1000), 3),
+    }
+
+
+def accuracy_table(counts: Dict[str, Dict[str, int]]) -> Dict[str, float]:
+    return {field: round(c['correct'] / c['total'], 4) if c['total'] else None
+            for field, c in counts.items()}
+
+
+def add_counts(total: Dict, counts: Dict):
+    for field, c in counts.items():
+        total[field]['correct'] += c['correct']
+        total[field]['total'] += c['total']
+
+
+def compare_crop(ocr, images: List[Path]) -> Dict:
+    """OCR every image with and without the table crop; pixels and OCR time"""
+    totals = {mode: {'pixels': 0, 'ocr_s': 0.0} for mode in ['full', 'cropped']}
+    found_before = ocr.CROP_STATS['tables_found']
+    table_crop = ocr.TABLE_CROP
+    for i, path in enumerate(images, 1):
+        for mode, crop in [('full', False), ('cropped', True)]:
+            ocr.TABLE_CROP = crop
+            processed = ocr.preprocess_image(path)
+            if processed is None:
+                continue
+            start = time.perf_counter()
+            ocr.ocr_image(processed)
+            totals[mode]['ocr_s'] += time.perf_counter() - start
+            totals[mode]['pixels'] += processed.size
+        print(f"  [{i}/{len(images)}] {path.name}")
+    ocr.TABLE_CROP = table_crop
+
+    full, cropped = totals['full'], totals['cropped']
+    return {
+        'full_megapixels': round(full['pixels'] / 1e6, 2),
+        'cropped_megapixels': round(cropped['pixels'] / 1e6, 2),
+        'pixel_reduction': round(1 - cropped['pixels'] / full['pixels'], 4) if full['pixels'] else None,
+        'full_ocr_s': round(full['ocr_s'], 3),
+        'cropped_ocr_s': round(cropped['ocr_s'], 3),
+        'ocr_time_reduction': round(1 - cropped['ocr_s'] / full['ocr_s'], 4) if full['ocr_s'] else None,
+        'tables_found': ocr.CROP_STATS['tables_found'] - found_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR throughput and accuracy on labelled screenshots")
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR, help="folder of JPGs with .truth.json sidecars")
+    parser.add_argument('--limit', type=int, help="only process the first N images")
+    parser.add_argument('--output', type=Path, default=OUTPUT_JSON, help="where to write the results JSON")
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help="recognise size-bucketed images with readtext_batched (1 = per-image readtext)")
+    parser.add_argument('--batch-workers', type=int, default=0, help="EasyOCR DataLoader workers")
+    parser.add_argument('--chunk', type=int, default=32, help="images per batched call in batched mode")
+    parser.add_argument('--refine', type=float, default=0.0, metavar='CONFIDENCE',
+                        help="re-read boxes below this confidence in a second pass (0 = off)")
+    parser.add_argument('--crop-compare', action='store_true',
+                        help="also OCR each image without the table crop and report the savings")
+    args = parser.parse_args()
+
+    try:
+        ocr = load_script('ocr-extract-suburb-data')
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    improved = load_script('improved-ocr-extractor')
+    ocr.REFINE_CONFIDENCE = args.refine
+
+    images = [p for p in sorted(args.images.glob('*.jpg')) if load_truth(p) is not None]
+    if args.limit:
+        images = images[:args.limit]
+    if not images:
+        print(f"❌ No labelled JPGs in {args.images} - run generate-synthetic-screenshots.py first")
+        sys.exit(1)
+
+    # ocr-extract resolves data/ paths relative to the repo root
+    os.chdir(BASE_DIR)
+
+    print("⏱️  OCR Benchmark")
+    print("=" * 60)
+    print(f"📁 {len(images)} labelled screenshots in {args.images}")
+
+    # Reader start-up is reported separately; it is paid once per process
+    start = time.perf_counter()
+    reader = ocr.get_ocr_reader()
+    warmup_s = time.perf_counter() - start
+
+    latencies = defaultdict(list)
+    overall = defaultdict(lambda: {'correct': 0, 'total': 0})
+    by_condition = defaultdict(lambda: defaultdict(lambda: {'correct': 0, 'total': 0}))
+    per_image = []
+
+    # Per-image readtext works on one image at a time; batched mode groups
+    # a chunk of images so readtext_batched can fill its batches
+    chunk_size = args.chunk if args.batch_size > 1 else 1
+    run_start = time.perf_counter()
+    for chunk_start in range(0, len(images), chunk_size):
+        chunk = images[chunk_start:chunk_start + chunk_size]
+
+        processed = {}
+        for path in chunk:
+            t0 = time.perf_counter()
+            image = ocr.preprocess_image(path)
+            latencies['preprocess'].append(time.perf_counter() - t0)
+            if image is not None:
+                processed[path] = image
+
+        # A batched call is timed as a whole and attributed evenly per image
+        t0 = time.perf_counter()
+        if args.batch_size > 1:
+            ocr_results = readtext_batched(reader, processed, batch_size=args.batch_size,
+                                           workers=args.batch_workers)
+            ocr_results = {path: ocr.refine_low_confidence(processed[path], found)
+                           for path, found in ocr_results.items()}
+        else:
+            ocr_results = {path: ocr.ocr_image(image) for path, image in processed.items()}
+        latencies['ocr'].extend([(time.perf_counter() - t0) / len(chunk)] * len(chunk))
+
+        for i, path in enumerate(chunk, chunk_start + 1):
+            truth = load_truth(path)
+            t0 = time.perf_counter()
+            results = ocr_results.get(path, [])
+            text = ' '.join(text for _, text, _ in results if text.strip())
+            parsed = improved.extract_suburb_data_improved(text, path.name)
+            latencies['parse'].append(time.perf_counter() - t0)
+
+            counts = score_rows(parsed, truth['rows'])
+            add_counts(overall, counts)
+            add_counts(by_condition[f"noise={truth['noise']:.2f}"], counts)
+            add_counts(by_condition[f"quality={truth['quality']}"], counts)
+            add_counts(by_condition[f"width={truth['width']}"], counts)
+
+            found = counts['suburb_name']['correct']
+            per_image.append({'source_file': path.name, 'rows': len(truth['rows']), 'rows_found': found})
+            print(f"  [{i}/{len(images)}] {path.name}: {found}/{len(truth['rows'])} rows")
+    elapsed = time.perf_counter() - run_start
+
+    crop = None
+    if args.crop_compare:
+        print("\n✂️  Table crop comparison")
+        crop = compare_crop(ocr, images)
+
+    report = {
+        'created': datetime.now().isoformat(),
+        'images': len(images),
+        'images_per_second': round(len(images) / elapsed, 3),
+        'batch_size': args.batch_size,
+        'batch_workers': args.batch_workers,
+        'reader_warmup_s': round(warmup_s, 3),
+        'latency': {stage: summarize_latency(latencies[stage]) for stage in STAGES},
+        'accuracy': accuracy_table(overall),
+        'accuracy_by_condition': {name: accuracy_table(counts) for name, counts in sorted(by_condition.items())},
+        'refine': dict(ocr.REFINE_STATS, threshold=args.refine) if args.refine > 0 else None,
+        'table_crop': crop,
+        'per_image': per_image,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print("\n📊 THROUGHPUT")
+    print("=" * 60)
+    print(f"Images/sec: {report['images_per_second']:.2f} (reader warm-up {warmup_s:.1f} s not included)")
+    for stage in STAGES:
+        s = report['latency'][stage]
+        print(f"  {stage:12} median {s['median_ms']:8.1f} ms   p95 {s['p95_ms']:8.1f} ms")
+
+    print("\n🎯 FIELD ACCURACY")
+    print("=" * 60)
+    for field, value in report['accuracy'].items():
+        print(f"  {field:22} {format_percent(value):>6}")
+    print("\n  By condition (rows found / median price / yield):")
+    for name, table in report['accuracy_by_condition'].items():
+        print(f"    {name:14} {format_percent(table['suburb_name']):>6}  "
+              f"{format_percent(table['median_price']):>6}  {format_percent(table['rental_yield']):>6}")
+
+    if report['refine']:
+        refine = report['refine']
+        print(f"\n🔁 Second pass: re-read {refine['reread']}/{refine['boxes']} boxes, {refine['improved']} improved, "
+              f"{refine['reread_pixels'] / max(1, refine['image_pixels']) * 100:.1f}% of image pixels")
+
+    if crop:
+        print("\n✂️  TABLE CROP")
+        print("=" * 60)
+        print(f"  Pixels OCR'd: {crop['full_megapixels']:.1f} MP -> {crop['cropped_megapixels']:.1f} MP "
+              f"({format_percent(crop['pixel_reduction'])} fewer)")
+        print(f"  OCR time:     {crop['full_ocr_s']:.1f} s -> {crop['cropped_ocr_s']:.1f} s "
+              f"({format_percent(crop['ocr_time_reduction'])} less)")
+
+    print(f"\n💾 Saved results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Suburb Data Pipeline on Synthetic Inputs
+
+Times every text/table stage of the pipeline at 1x, 10x and 100x scale on
+generated inputs (scripts/pipeline/synthetic.py), so performance changes
+can be measured instead of guessed:
+
+    1x = 32 OCR documents x 10 rows, 400-row suburbs.csv
+         (improved-long: the same rows as 400-row documents;
+          improved-parallel: improved on one process per CPU)
+
+Results are written as JSON. When a baseline exists, any stage/scale that
+got slower than the baseline by more than --threshold is flagged and the
+script exits with status 1.
+
+Usage:
+    python3 scripts/benchmark-pipeline.py
+    python3 scripts/benchmark-pipeline.py --scales 1 10 --save-baseline
+    python3 scripts/benchmark-pipeline.py --stages improved final-clean --threshold 0.1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from pipeline import BASE_DIR, DATA_DIR
+from pipeline.loader import load_script
+from pipeline.row_hashes import SUBURBS_KEY
+from pipeline.synthetic import (load_vocabulary, synthetic_extracted_table, synthetic_ocr_corpus,
+                                synthetic_ocr_texts, synthetic_suburbs_table)
+from pipeline.suburbs_io import write_suburbs_csv
+from pipeline.table_diff import diff_tables
+
+BASELINE_JSON = DATA_DIR / 'benchmarks' / 'pipeline-baseline.json'
+RESULTS_JSON = DATA_DIR / 'benchmarks' / 'pipeline-latest.json'
+
+BASE_DOCUMENTS = 32
+ROWS_PER_DOCUMENT = 10
+BASE_SUBURBS = 400
+
+# improved-long: the same rows as one long scrolling capture per 400 rows
+LONG_DOCUMENT_ROWS = 400
+
+# Differences smaller than this are timer noise, whatever the ratio
+MIN_REGRESSION_SECONDS = 0.005
+
+
+class Inputs:
+    """Synthetic inputs for one scale, generated once and shared by all stages"""
+
+    def __init__(self, scale: int, vocabulary: pd.DataFrame, workdir: Path):
+        self.scale = scale
+        self.corpus = synthetic_ocr_corpus(BASE_DOCUMENTS * scale, ROWS_PER_DOCUMENT,
+                                           seed=scale, vocabulary=vocabulary)
+        self.ocr_texts = synthetic_ocr_texts(self.corpus)
+        self.extracted = synthetic_extracted_table(self.corpus)
+        self.suburbs = synthetic_suburbs_table(BASE_SUBURBS * scale, seed=scale, vocabulary=vocabulary)
+
+        self.suburbs_csv = workdir / f'suburbs-{scale}.csv'
+        self.extracted_csv = workdir / f'final-extracted-{scale}.csv'
+        self.output_csv = workdir / f'output-{scale}.csv'
+        self.backup_csv = workdir / f'backup-{scale}.csv'
+        write_suburbs_csv(self.suburbs, self.suburbs_csv, header_lines=['# synthetic benchmark input'])
+        self.extracted.to_csv(self.extracted_csv, index=False)
+        self.vocabulary = vocabulary
+        self._long_ocr_texts = None
+
+    @property
+    def long_ocr_texts(self) -> Dict[str, str]:
+        """The corpus's rows again as long documents (generated on first use)"""
+        if self._long_ocr_texts is None:
+            total_rows = BASE_DOCUMENTS * self.scale * ROWS_PER_DOCUMENT
+            corpus = synthetic_ocr_corpus(max(1, total_rows // LONG_DOCUMENT_ROWS), LONG_DOCUMENT_ROWS,
+                                          seed=self.scale, vocabulary=self.vocabulary)
+            self._long_ocr_texts = synthetic_ocr_texts(corpus)
+        return self._long_ocr_texts
+
+
+# ============ Stage definitions ============
+# Each stage takes Inputs and returns (callable to time, rows processed).
+
+def stage_extract_metrics(inputs: Inputs):
+    ocr = load_script('ocr-extract-suburb-data')
+    texts = list(inputs.ocr_texts.values())
+    return (lambda: [ocr.extract_metrics(t) for t in texts]), len(texts)
+
+
+def stage_extract_suburb_name(inputs: Inputs):
+    ocr = load_script('ocr-extract-suburb-data')
+    ocr.SUBURB_NAMES = load_vocabulary()['suburb'].str.lower().tolist()
+    texts = list(inputs.ocr_texts.values())
+    return (lambda: [ocr.extract_suburb_name(t) for t in texts]), len(texts)
+
+
+def stage_improved(inputs: Inputs):
+    improved = load_script('improved-ocr-extractor')
+    items = list(inputs.ocr_texts.items())
+    return (lambda: [improved.extract_suburb_data_improved(t, f) for f, t in items]), len(items)
+
+
+def stage_improved_long(inputs: Inputs):
+    improved = load_script('improved-ocr-extractor')
+    items = list(inputs.long_ocr_texts.items())
+    return (lambda: [improved.extract_suburb_data_improved(t, f) for f, t in items]), len(items)
+
+
+def stage_improved_parallel(inputs: Inputs):
+    improved = load_script('improved-ocr-extractor')
+    texts = dict(inputs.ocr_texts)
+    return (lambda: improved.extract_all(texts, workers=os.cpu_count() or 1)), len(texts)
+
+
+def stage_improved_merge(inputs: Inputs):
+    improved = load_script('improved-ocr-extractor')
+    entries = inputs.extracted[['suburb_name', 'source_file', 'lga']].to_dict('records')
+    return (lambda: improved.merge_with_ground_truth([dict(e) for e in entries], inputs.extracted)), len(entries)
+
+
+def stage_fix_names(inputs: Inputs):
+    fix = load_script('fix-suburb-names')
+
+    def run():
+        df = fix.fix_suburb_names(inputs.extracted.copy(), inputs.ocr_texts, inputs.extracted)
+        df = fix.fix_lga_names(df, inputs.extracted)
+        df = fix.validate_and_fix_data(df, inputs.extracted)
+        return fix.merge_with_ground_truth(df, inputs.extracted)
+    return run, len(inputs.extracted)
+
+
+def stage_fix_names_v2(inputs: Inputs):
+    fix = load_script('fix-suburb-names-v2')
+
+    def run():
+        df = fix.fix_all_suburb_names(inputs.extracted.copy(), inputs.ocr_texts, inputs.extracted)
+        df = fix.fix_specific_issues(df, inputs.ocr_texts)
+        return fix.fix_lga_names_comprehensive(df, inputs.extracted)
+    return run, len(inputs.extracted)
+
+
+def stage_clean(inputs: Inputs):
+    clean = load_script('clean-suburb-data')
+
+    def run():
+        df = inputs.extracted.copy()
+        df['suburb_name'] = df['suburb_name'].apply(clean.clean_suburb_name)
+        df = clean.fix_known_suburb_names(df)
+        return clean.fix_lga_names(df)
+    return run, len(inputs.extracted)
+
+
+def stage_final_clean(inputs: Inputs):
+    final = load_script('final-clean-suburb-data')
+
+    def run():
+        df = inputs.extracted.copy()
+        df['suburb_name'] = df['suburb_name'].apply(final.clean_suburb_name_final)
+        df = final.fix_specific_suburb_names(df)
+        df = final.fix_lga_names_final(df)
+        return final.remove_duplicates_and_clean(df)
+    return run, len(inputs.extracted)
+
+
+def _script_main(name: str, inputs: Inputs, **paths):
+    """Run a script's main() against the synthetic files instead of data/"""
+    module = load_script(name)
+    for attr, value in paths.items():
+        setattr(module, attr, value)
+    return module.main
+
+
+def stage_update_suburbs(inputs: Inputs):
+    run = _script_main('update-suburbs-with-extracted', inputs,
+                       EXISTING_CSV=inputs.suburbs_csv, EXTRACTED_CSV=inputs.extracted_csv,
+                       BACKUP_CSV=inputs.backup_csv, OUTPUT_CSV=inputs.output_csv)
+    return run, len(inputs.suburbs)
+
+
+def stage_remove_placeholders(inputs: Inputs):
+    run = _script_main('remove-placeholder-data', inputs,
+                       EXISTING_CSV=inputs.suburbs_csv, BACKUP_CSV=inputs.backup_csv,
+                       OUTPUT_CSV=inputs.output_csv)
+    return run, len(inputs.suburbs)
+
+
+def stage_flag_missing(inputs: Inputs):
+    run = _script_main('flag-missing-data-explicitly', inputs,
+                       EXISTING_CSV=inputs.suburbs_csv, BACKUP_CSV=inputs.backup_csv,
+                       OUTPUT_CSV=inputs.output_csv)
+    return run, len(inputs.suburbs)
+
+
+def stage_diff_suburbs(inputs: Inputs):
+    old = inputs.suburbs
+    new = old.copy()
+    new.loc[::100, 'medianPrice'] = None
+    return (lambda: diff_tables(old, new, SUBURBS_KEY)), len(old)
+
+
+STAGES: Dict[str, Callable] = {
+    'extract-metrics': stage_extract_metrics,
+    'extract-suburb-name': stage_extract_suburb_name,
+    'improved': stage_improved,
+    'improved-long': stage_improved_long,
+    'improved-parallel': stage_improved_parallel,
+    'improved-merge': stage_improved_merge,
+    'fix-names': stage_fix_names,
+    'fix-names-v2': stage_fix_names_v2,
+    'clean': stage_clean,
+    'final-clean': stage_final_clean,
+    'update-suburbs': stage_update_suburbs,
+    'remove-placeholders': stage_remove_placeholders,
+    'flag-missing': stage_flag_missing,
+    'diff-suburbs': stage_diff_suburbs,
+}
+
+
+# ============ Runner ============
+
+def time_stage(run: Callable, repeat: int) -> float:
+    """Median wall time in seconds, with the stage's own printing suppressed"""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run_benchmarks(stages: List[str], scales: List[int], repeat: int, budget: float) -> Dict:
+    results: Dict[str, Dict] = {name: {} for name in stages}
+    vocabulary = load_vocabulary()
+    too_slow = set()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            print(f"\n📏 Scale {scale}x")
+            print("-" * 60)
+            inputs = Inputs(scale, vocabulary, Path(tmp))
+
+            for name in stages:
+                if name in too_slow:
+                    results[name][str(scale)] = {'skipped': 'over time budget at smaller scale'}
+                    print(f"  {name:22} skipped (over budget)")
+                    continue
+                try:
+                    run, rows = STAGES[name](inputs)
+                    seconds = time_stage(run, repeat)
+                except ImportError as e:
+                    results[name][str(scale)] = {'skipped': str(e)}
+                    print(f"  {name:22} skipped ({e})")
+                    continue
+
+                results[name][str(scale)] = {
+                    'seconds': round(seconds, 6),
+                    'rows': rows,
+                    'rows_per_second': round(rows / seconds, 1) if seconds > 0 else None,
+                }
+                print(f"  {name:22} {seconds * 1000:10.1f} ms  {rows:8d} rows")
+                if seconds * repeat > budget:
+                    too_slow.add(name)
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Return human-readable regression lines (slower than baseline * (1 + threshold))"""
+    regressions = []
+    for name, scales in results.items():
+        for scale, current in scales.items():
+            previous = baseline.get('results', {}).get(name, {}).get(scale, {})
+            if 'seconds' not in current or 'seconds' not in previous or previous['seconds'] <= 0:
+                continue
+            ratio = current['seconds'] / previous['seconds']
+            if ratio > 1 + threshold and current['seconds'] - previous['seconds'] > MIN_REGRESSION_SECONDS:
+                regressions.append(f"{name} @ {scale}x: {previous['seconds'] * 1000:.1f} ms -> "
+                                   f"{current['seconds'] * 1000:.1f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic inputs")
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES),
+                        help="stages to run (default: all)")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100], help="input multipliers")
+    parser.add_argument('--repeat', type=int, default=3, help="repetitions per stage (median reported)")
+    parser.add_argument('--budget', type=float, default=120.0,
+                        help="skip larger scales of a stage once it takes longer than this (seconds)")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_JSON, help="baseline JSON to compare with")
+    parser.add_argument('--output', type=Path, default=RESULTS_JSON, help="where to write this run's results")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="flag stages slower than baseline by more than this fraction (default: 0.25)")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the new baseline")
+    args = parser.parse_args()
+
+    # Several stages open data/ files with paths relative to the repo root
+    os.chdir(BASE_DIR)
+
+    print("⏱️  Pipeline Benchmark (synthetic inputs)")
+    print("=" * 60)
+
+    results = run_benchmarks(args.stages, args.scales, args.repeat, args.budget)
+    report = {
+        'created': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Saved results: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Saved baseline: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("ℹ️  No baseline yet - run with --save-baseline to create one")
+        return
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.threshold:.0%} vs baseline ({baseline.get('created', '?')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Build the Static Suburb Search Index
+
+Writes data/suburbs-search-index.json: pre-ranked prefix posting lists for
+suburb name, postcode and LGA plus trigram posting lists for infix
+matches (see scripts/pipeline/search_index.py). The server's suburb search
+uses it instead of filtering every suburb on every request.
+
+Rebuilds are incremental: if an index already exists, only rows that were
+added, changed or removed in suburbs.csv are re-tokenized.
+
+Usage:
+    python3 scripts/build-search-index.py
+    python3 scripts/build-search-index.py --full --query "box hill"
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from pipeline import DATA_DIR, SUBURBS_CSV, trace
+from pipeline.search_index import INDEX_VERSION, SearchIndex
+from pipeline.suburbs_io import read_suburbs_csv
+
+OUTPUT_JSON = DATA_DIR / 'suburbs-search-index.json'
+
+
+def load_existing(path: Path) -> SearchIndex:
+    """Load the previous index, or an empty one if missing/outdated"""
+    if not path.exists():
+        return SearchIndex()
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Could not read existing index ({e}), rebuilding")
+        return SearchIndex()
+    if data.get('version') != INDEX_VERSION:
+        return SearchIndex()
+    return SearchIndex(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the suburb search index")
+    parser.add_argument('--csv', type=Path, default=SUBURBS_CSV, help="source suburbs CSV")
+    parser.add_argument('--output', type=Path, default=OUTPUT_JSON, help="index file to write")
+    parser.add_argument('--full', action='store_true', help="ignore the existing index and rebuild")
+    parser.add_argument('--query', action='append', default=[], help="run a sample lookup after building")
+    args = parser.parse_args()
+
+    print("🔎 Build Suburb Search Index")
+    print("=" * 60)
+
+    source_version = hashlib.sha256(args.csv.read_bytes()).hexdigest()[:16]
+    index = SearchIndex() if args.full else load_existing(args.output)
+
+    if index.source_version == source_version:
+        print(f"✅ Index is up to date (source version {source_version})")
+    else:
+        df = read_suburbs_csv(args.csv)
+        start = time.perf_counter()
+        counts = index.update(df, source_version)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"✅ Indexed {len(df)} suburbs in {elapsed_ms:.1f} ms "
+              f"(+{counts['added']} / -{counts['removed']} / {counts['unchanged']} unchanged)")
+
+        with open(args.output, 'w') as f:
+            json.dump(index.to_dict(), f, separators=(',', ':'))
+        print(f"💾 Saved index: {args.output} ({args.output.stat().st_size / 1024:.1f} KB)")
+        print(f"   {len(index.prefix)} prefix keys, {len(index.trigrams)} trigrams")
+
+    for query in args.query:
+        start = time.perf_counter()
+        doc_ids = index.search(query)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        names = ', '.join(f"{index.docs[i][0]} {index.docs[i][1]}" for i in doc_ids)
+        print(f"\n  '{query}' ({elapsed_us:.0f} µs): {names or 'no matches'}")
+
+    print("\n✅ Search index complete!")
+
+
+if __name__ == "__main__":
+    trace.run(main)
@@ -10,6 +10,9 @@ import pandas as pd
 import re
 from pathlib import Path
 
+from pipeline import trace
+from pipeline.quality import EXTRACTED_METRICS, report_quality
+
 def clean_suburb_name(name: str) -> str:
     """Clean suburb name by removing OCR artifacts"""
     if pd.isna(name):
@@ -167,6 +170,19 @@ def fix_lga_names(df: pd.DataFrame) -> pd.DataFrame:
     
     return fixed_df
 
+def remove_invalid_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows whose suburb name is too short, a table header word or a price"""
+    invalid = df[
+        (df['suburb_name'].str.len() < 3) |
+        (df['suburb_name'].str.contains('Household|CBD|Rente|Yield|Price', case=False, na=False)) |
+        (df['suburb_name'].str.startswith('S', na=False) & df['suburb_name'].str[1:].str.isdigit())
+    ]
+    
+    if len(invalid) > 0:
+        print(f"\n🗑️  Removing {len(invalid)} entries with invalid names")
+        df = df.drop(index=invalid.index)
+    return df
+
 def main():
     """Main cleaning function"""
     print("🧹 Cleaning Suburb Data")
@@ -174,48 +190,38 @@ def main():
     
     # Load data
     print("📂 Loading data...")
-    df = pd.read_csv('data/fixed-extracted-suburbs.csv')
+    with trace.span('load'):
+        df = pd.read_csv('data/fixed-extracted-suburbs.csv')
+    trace.count('rows_touched', len(df))
     
     print(f"✅ Loaded {len(df)} entries")
     
     # Clean suburb names
     print("\n🧹 Cleaning suburb names...")
-    df['suburb_name'] = df['suburb_name'].apply(clean_suburb_name)
-    
-    # Fix known problematic names
-    df = fix_known_suburb_names(df)
-    
-    # Fix LGA names
-    df = fix_lga_names(df)
+    with trace.span('clean'):
+        df['suburb_name'] = df['suburb_name'].apply(clean_suburb_name)
+        
+        # Fix known problematic names
+        df = fix_known_suburb_names(df)
+        
+        # Fix LGA names
+        df = fix_lga_names(df)
     
     # Remove entries with invalid suburb names
-    invalid = df[
-        (df['suburb_name'].str.len() < 3) |
-        (df['suburb_name'].str.contains('Household|CBD|Rente|Yield|Price', case=False, na=False)) |
-        (df['suburb_name'].str.startswith('S', na=False) & df['suburb_name'].str[1:].str.isdigit())
-    ]
-    
-    if len(invalid) > 0:
-        print(f"\n🗑️  Removing {len(invalid)} entries with invalid names")
-        df = df.drop(index=invalid.index)
+    df = remove_invalid_names(df)
     
     # Save cleaned data
     output_file = Path('data/cleaned-extracted-suburbs.csv')
-    df.to_csv(output_file, index=False)
+    with trace.span('write'):
+        df.to_csv(output_file, index=False)
     print(f"\n💾 Saved cleaned data to {output_file}")
     
     # Statistics
     print("\n📊 CLEANED DATA STATISTICS")
     print("=" * 60)
     print(f"Total entries: {len(df)}")
-    print(f"Unique suburbs: {df['suburb_name'].nunique()}")
     
-    print("\n📈 Data Completeness:")
-    for col in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']:
-        if col in df.columns:
-            count = df[col].notna().sum()
-            pct = count / len(df) * 100
-            print(f"  {col}: {count}/{len(df)} ({pct:.1f}%)")
+    report_quality(df, 'clean', ['suburb_name', 'lga'] + EXTRACTED_METRICS)
     
     # Show sample of cleaned names
     print("\n✅ Sample of cleaned suburb names:")
@@ -226,4 +232,4 @@ def main():
     print("\n✅ Data cleaning complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Diff Two Versions of suburbs.csv
+
+Shows what a pipeline stage changed in suburbs.csv: compares a backup (or
+any other version) with the current file by (suburb, postcode) and prints
+the inserted and deleted suburbs, the number of changed cells per column
+and a compact list of the changed cells (scripts/pipeline/table_diff.py).
+Numbers are compared with a tolerance (--rtol/--atol), so values that only
+changed by float round-tripping are not reported.
+
+update-suburbs-with-extracted.py, remove-placeholder-data.py and
+flag-missing-data-explicitly.py each leave a backup next to suburbs.csv
+before rewriting it.
+
+Usage:
+    python3 scripts/diff-suburbs.py data/suburbs.csv.backup2
+    python3 scripts/diff-suburbs.py old.csv new.csv --atol 0.01 --limit 100
+    python3 scripts/diff-suburbs.py data/suburbs.csv.backup --output data/suburbs-diff.csv
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from pipeline import SUBURBS_CSV, trace
+from pipeline.row_hashes import SUBURBS_KEY
+from pipeline.suburbs_io import read_suburbs_csv
+from pipeline.table_diff import ATOL, RTOL, diff_tables
+
+
+def format_cell(value) -> str:
+    """A cell as written in the change list ('∅' for empty)"""
+    if pd.isna(value):
+        return '∅'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def format_key(row, key) -> str:
+    return ' '.join(str(row[k]) for k in key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two versions of suburbs.csv by (suburb, postcode)")
+    parser.add_argument('old', type=Path, help="earlier version, e.g. data/suburbs.csv.backup")
+    parser.add_argument('new', type=Path, nargs='?', default=SUBURBS_CSV,
+                        help="later version (default: data/suburbs.csv)")
+    parser.add_argument('--key', nargs='+', default=SUBURBS_KEY, help="key columns (default: suburb postcode)")
+    parser.add_argument('--columns', nargs='+', default=None, help="only compare these columns")
+    parser.add_argument('--rtol', type=float, default=RTOL, help=f"relative tolerance (default: {RTOL})")
+    parser.add_argument('--atol', type=float, default=ATOL, help=f"absolute tolerance (default: {ATOL})")
+    parser.add_argument('--limit', type=int, default=50,
+                        help="changed cells and keys to print (default: 50, 0 for all)")
+    parser.add_argument('--output', type=Path, default=None, help="write every changed cell to this CSV")
+    args = parser.parse_args()
+
+    print("🔍 Diff suburbs.csv")
+    print("=" * 60)
+
+    missing_files = [str(path) for path in (args.old, args.new) if not path.is_file()]
+    if missing_files:
+        print(f"❌ File not found: {', '.join(missing_files)}")
+        return 1
+
+    old, new = read_suburbs_csv(args.old), read_suburbs_csv(args.new)
+    print(f"  Old: {args.old} ({len(old):,} rows)")
+    print(f"  New: {args.new} ({len(new):,} rows)")
+    missing = [k for k in args.key if k not in old.columns or k not in new.columns]
+    if missing:
+        print(f"❌ Key column missing: {', '.join(missing)}")
+        return 1
+    unknown = [c for c in args.columns or []
+               if c in args.key or c not in old.columns or c not in new.columns]
+    if unknown:
+        print(f"❌ Column not in both files (or a key column): {', '.join(unknown)}")
+        return 1
+
+    start = time.perf_counter()
+    with trace.span('diff', rows=len(new)):
+        diff = diff_tables(old, new, args.key, args.columns, rtol=args.rtol, atol=args.atol)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    trace.count('rows_touched', diff.rows_changed + len(diff.inserted) + len(diff.deleted))
+
+    print(f"\n📊 Compared {diff.rows_matched:,} suburbs by {', '.join(diff.key)} in {elapsed_ms:.0f} ms")
+    print(f"  Changed: {diff.rows_changed:,}  Inserted: {len(diff.inserted):,}  Deleted: {len(diff.deleted):,}")
+    if diff.added_columns:
+        print(f"  Columns added: {', '.join(diff.added_columns)}")
+    if diff.removed_columns:
+        print(f"  Columns removed: {', '.join(diff.removed_columns)}")
+
+    if diff.empty:
+        print("\n✅ No differences")
+        return 0
+
+    limit = args.limit if args.limit > 0 else None
+    changed_columns = diff.changes[diff.changes > 0]
+    if len(changed_columns):
+        print("\n📈 Changed cells per column:")
+        for name, count in changed_columns.items():
+            print(f"  {name:26} {count:>8,}")
+
+    for label, rows in (('➕ Inserted', diff.inserted), ('➖ Deleted', diff.deleted)):
+        if len(rows):
+            shown = rows.iloc[:limit]
+            print(f"\n{label} ({len(shown)} of {len(rows):,}):")
+            for row in shown.to_dict('records'):
+                print(f"  {format_key(row, diff.key)}")
+
+    if len(diff.cells):
+        shown = diff.cells.iloc[:limit]
+        print(f"\n📝 Changed cells ({len(shown)} of {len(diff.cells):,}):")
+        for row in shown.to_dict('records'):
+            print(f"  {format_key(row, diff.key):32} {row['column']:24} "
+                  f"{format_cell(row['old'])} → {format_cell(row['new'])}")
+
+    if args.output:
+        with trace.span('write', file=str(args.output), rows=len(diff.cells)):
+            diff.cells.to_csv(args.output, index=False, na_rep='')
+        print(f"\n💾 Saved {len(diff.cells):,} changed cells: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(trace.run(main))
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Export suburbs.csv as a Columnar Binary Snapshot
+
+Writes data/suburbs.bin (typed, columnar, memory-mappable) plus the
+data/suburbs.bin.json manifest, so the server and clients can load suburb
+data without splitting CSV text. The format is documented in
+scripts/pipeline/snapshot.py.
+
+Usage:
+    python3 scripts/export-suburbs-snapshot.py
+    python3 scripts/export-suburbs-snapshot.py --benchmark --scale 1 100
+"""
+
+import argparse
+import hashlib
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from pipeline import DATA_DIR, SUBURBS_CSV, trace
+from pipeline.snapshot import manifest_path, read_snapshot, round_trip_mismatches, write_snapshot
+from pipeline.suburbs_io import read_suburbs_csv, write_suburbs_csv
+
+OUTPUT_BIN = DATA_DIR / 'suburbs.bin'
+
+
+def source_version(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def naive_csv_parse(path: Path) -> list:
+    """Split-based parse, equivalent to loadSuburbsData in server/routes/suburbs.js"""
+    lines = [line for line in path.read_text().split('\n') if line and not line.startswith('#')]
+    headers = lines[0].split(',')
+    return [dict(zip(headers, line.split(','))) for line in lines[1:]]
+
+
+def best_of(fn, repeat: int) -> float:
+    """Median wall time of fn() in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def run_benchmark(df: pd.DataFrame, scales: list, repeat: int):
+    """Compare size and load time of CSV vs snapshot at several row counts"""
+    print("\n⏱️  CSV vs snapshot benchmark")
+    print("-" * 78)
+    print(f"{'rows':>9} {'csv KB':>9} {'bin KB':>9} {'pandas ms':>10} {'split ms':>9} "
+          f"{'bin ms':>8} {'bin num ms':>10}")
+
+    numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            scaled = pd.concat([df] * scale, ignore_index=True)
+            if scale > 1:
+                scaled['suburb'] = scaled['suburb'] + ' ' + (scaled.index // len(df)).astype(str)
+
+            csv_path = Path(tmp) / f'suburbs-{scale}.csv'
+            bin_path = Path(tmp) / f'suburbs-{scale}.bin'
+            write_suburbs_csv(scaled, csv_path, header_lines=[])
+            write_snapshot(scaled, bin_path, source_version(csv_path))
+
+            pandas_ms = best_of(lambda: pd.read_csv(csv_path, comment='#'), repeat)
+            split_ms = best_of(lambda: naive_csv_parse(csv_path), repeat)
+            bin_ms = best_of(lambda: read_snapshot(bin_path), repeat)
+            numeric_ms = best_of(lambda: read_snapshot(bin_path, columns=numeric, as_dataframe=False), repeat)
+
+            print(f"{len(scaled):>9} {csv_path.stat().st_size / 1024:>9.1f} {bin_path.stat().st_size / 1024:>9.1f} "
+                  f"{pandas_ms:>10.2f} {split_ms:>9.2f} {bin_ms:>8.2f} {numeric_ms:>10.2f}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export suburbs.csv as a binary columnar snapshot")
+    parser.add_argument('--csv', type=Path, default=SUBURBS_CSV, help="source suburbs CSV")
+    parser.add_argument('--output', type=Path, default=OUTPUT_BIN, help="snapshot file to write")
+    parser.add_argument('--benchmark', action='store_true', help="compare parse time and size with the CSV")
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100],
+                        help="row multipliers for the benchmark (default: 1 10 100)")
+    parser.add_argument('--repeat', type=int, default=5, help="benchmark repetitions (median reported)")
+    args = parser.parse_args()
+
+    print("📦 Export Suburbs Snapshot")
+    print("=" * 60)
+
+    df = read_suburbs_csv(args.csv)
+    print(f"✅ Loaded {len(df)} suburbs")
+
+    manifest = write_snapshot(df, args.output, source_version(args.csv))
+    print(f"💾 Saved snapshot: {args.output} ({args.output.stat().st_size / 1024:.1f} KB)")
+    print(f"💾 Saved manifest: {manifest_path(args.output)}")
+    print(f"   source version {manifest['source_version']}, content hash {manifest['content_hash']}")
+
+    # Round-trip check so a broken snapshot is never shipped
+    loaded = read_snapshot(args.output)
+    if len(loaded) != len(df) or list(loaded.columns) != list(df.columns):
+        raise SystemExit("❌ Snapshot round-trip check failed")
+    mismatches = round_trip_mismatches(df, loaded)
+    if mismatches:
+        details = ', '.join(f"{name} ({count})" for name, count in mismatches.items())
+        raise SystemExit(f"❌ Snapshot round-trip check failed: cells differ in {details}")
+    print("✅ Round-trip check passed")
+
+    if args.benchmark:
+        run_benchmark(df, args.scale, args.repeat)
+
+    print("\n✅ Snapshot export complete!")
+
+
+if __name__ == "__main__":
+    trace.run(main)
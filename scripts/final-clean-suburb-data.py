@@ -9,6 +9,9 @@ import pandas as pd
 import re
 from pathlib import Path
 
+from pipeline import trace
+from pipeline.quality import EXTRACTED_METRICS, report_quality
+
 def clean_suburb_name_final(name: str) -> str:
     """Final cleaning of suburb names"""
     if pd.isna(name):
@@ -118,40 +121,38 @@ def main():
     
     # Load data
     print("📂 Loading data...")
-    df = pd.read_csv('data/cleaned-extracted-suburbs.csv')
+    with trace.span('load'):
+        df = pd.read_csv('data/cleaned-extracted-suburbs.csv')
+    trace.count('rows_touched', len(df))
     
     print(f"✅ Loaded {len(df)} entries")
     
     # Final clean suburb names
     print("\n🧹 Final cleaning of suburb names...")
-    df['suburb_name'] = df['suburb_name'].apply(clean_suburb_name_final)
-    
-    # Fix specific names
-    df = fix_specific_suburb_names(df)
-    
-    # Fix LGA names
-    df = fix_lga_names_final(df)
-    
-    # Remove duplicates and bad entries
-    df = remove_duplicates_and_clean(df)
+    with trace.span('clean'):
+        df['suburb_name'] = df['suburb_name'].apply(clean_suburb_name_final)
+        
+        # Fix specific names
+        df = fix_specific_suburb_names(df)
+        
+        # Fix LGA names
+        df = fix_lga_names_final(df)
+        
+        # Remove duplicates and bad entries
+        df = remove_duplicates_and_clean(df)
     
     # Save final cleaned data
     output_file = Path('data/final-extracted-suburbs.csv')
-    df.to_csv(output_file, index=False)
+    with trace.span('write'):
+        df.to_csv(output_file, index=False)
     print(f"\n💾 Saved final cleaned data to {output_file}")
     
     # Statistics
     print("\n📊 FINAL DATA STATISTICS")
     print("=" * 60)
     print(f"Total entries: {len(df)}")
-    print(f"Unique suburbs: {df['suburb_name'].nunique()}")
     
-    print("\n📈 Data Completeness:")
-    for col in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']:
-        if col in df.columns:
-            count = df[col].notna().sum()
-            pct = count / len(df) * 100
-            print(f"  {col}: {count}/{len(df)} ({pct:.1f}%)")
+    report_quality(df, 'final-clean', ['suburb_name', 'lga'] + EXTRACTED_METRICS)
     
     # Show sample
     print("\n✅ Sample of final cleaned suburb names:")
@@ -164,4 +165,4 @@ def main():
     print("\n✅ Final cleaning complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
@@ -5,21 +5,22 @@ Fix Suburb Names and Data Quality Issues - Version 2
 More comprehensive fixing using OCR text analysis and pattern matching.
 """
 
-import json
 import pandas as pd
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from pipeline import trace
+from pipeline.ocr_store import load_ocr_texts
+from pipeline.quality import EXTRACTED_METRICS, report_quality
+
 def load_ground_truth() -> pd.DataFrame:
     """Load manually extracted data as reference"""
     return pd.read_csv('data/grok-extracted-suburb-data.csv')
 
 def load_ocr_data() -> Dict:
-    """Load OCR extraction results"""
-    with open('data/ocr-extraction-report.json', 'r') as f:
-        report = json.load(f)
-    return {r['source_file']: r['extracted_text'] for r in report['results']}
+    """Load OCR extraction results (full text is read from the OCR store on first use)"""
+    return load_ocr_texts('data/ocr-extraction-report.json')
 
 def extract_full_suburb_from_ocr(ocr_text: str, partial_suburb: str, lga: str, context_words: List[str]) -> Optional[str]:
     """
@@ -240,38 +241,36 @@ def main():
     
     # Load data
     print("📂 Loading data...")
-    df = pd.read_csv('data/improved-extracted-suburbs.csv')
-    ground_truth = load_ground_truth()
-    ocr_data = load_ocr_data()
+    with trace.span('load'):
+        df = pd.read_csv('data/improved-extracted-suburbs.csv')
+        ground_truth = load_ground_truth()
+        ocr_data = load_ocr_data()
+    trace.count('rows_touched', len(df))
     
     print(f"✅ Loaded {len(df)} entries to fix")
     
-    # Fix suburb names comprehensively
-    df = fix_all_suburb_names(df, ocr_data, ground_truth)
-    
-    # Fix specific known issues
-    df = fix_specific_issues(df, ocr_data)
-    
-    # Fix LGA names
-    df = fix_lga_names_comprehensive(df, ground_truth)
+    with trace.span('fix'):
+        # Fix suburb names comprehensively
+        df = fix_all_suburb_names(df, ocr_data, ground_truth)
+        
+        # Fix specific known issues
+        df = fix_specific_issues(df, ocr_data)
+        
+        # Fix LGA names
+        df = fix_lga_names_comprehensive(df, ground_truth)
     
     # Save fixed data
     output_file = Path('data/fixed-extracted-suburbs.csv')
-    df.to_csv(output_file, index=False)
+    with trace.span('write'):
+        df.to_csv(output_file, index=False)
     print(f"\n💾 Saved fixed data to {output_file}")
     
     # Statistics
     print("\n📊 FINAL DATA STATISTICS")
     print("=" * 60)
     print(f"Total entries: {len(df)}")
-    print(f"Unique suburbs: {df['suburb_name'].nunique()}")
     
-    print("\n📈 Data Completeness:")
-    for col in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']:
-        if col in df.columns:
-            count = df[col].notna().sum()
-            pct = count / len(df) * 100
-            print(f"  {col}: {count}/{len(df)} ({pct:.1f}%)")
+    report_quality(df, 'fix-names-v2', ['suburb_name', 'lga'] + EXTRACTED_METRICS)
     
     # Show unique suburbs
     print("\n✅ Sample of unique suburbs:")
@@ -283,4 +282,4 @@ def main():
     print("\n✅ Comprehensive fixing complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
@@ -6,21 +6,23 @@ Corrects incomplete suburb names, fixes LGA names, and validates data
 using ground truth and OCR text analysis.
 """
 
-import json
 import pandas as pd
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from pipeline import trace
+from pipeline.ocr_store import load_ocr_texts
+from pipeline.quality import EXTRACTED_METRICS, report_quality
+from pipeline.schema import EXTRACTED_SCHEMA, validate
+
 def load_ground_truth() -> pd.DataFrame:
     """Load manually extracted data as reference"""
     return pd.read_csv('data/grok-extracted-suburb-data.csv')
 
 def load_ocr_data() -> Dict:
-    """Load OCR extraction results"""
-    with open('data/ocr-extraction-report.json', 'r') as f:
-        report = json.load(f)
-    return {r['source_file']: r['extracted_text'] for r in report['results']}
+    """Load OCR extraction results (full text is read from the OCR store on first use)"""
+    return load_ocr_texts('data/ocr-extraction-report.json')
 
 def extract_full_suburb_name(ocr_text: str, partial_name: str, lga: str, source_file: str) -> Optional[str]:
     """
@@ -176,33 +178,13 @@ def validate_and_fix_data(df: pd.DataFrame, ground_truth: pd.DataFrame) -> pd.Da
     
     print("\n🔧 Validating and fixing data ranges...")
     
-    # Price validation (should be $200K - $5M)
-    if 'median_price' in fixed_df.columns:
-        invalid_prices = fixed_df[(fixed_df['median_price'] < 200000) | (fixed_df['median_price'] > 5000000)]
-        if len(invalid_prices) > 0:
-            print(f"  Found {len(invalid_prices)} invalid prices, removing...")
-            fixed_df.loc[invalid_prices.index, 'median_price'] = None
-    
-    # Yield validation (should be 0.5% - 10%)
-    if 'rental_yield' in fixed_df.columns:
-        invalid_yields = fixed_df[(fixed_df['rental_yield'] < 0.005) | (fixed_df['rental_yield'] > 0.10)]
-        if len(invalid_yields) > 0:
-            print(f"  Found {len(invalid_yields)} invalid yields, removing...")
-            fixed_df.loc[invalid_yields.index, 'rental_yield'] = None
-    
-    # Rent validation (should be $200 - $3000)
-    if 'weekly_rent' in fixed_df.columns:
-        invalid_rents = fixed_df[(fixed_df['weekly_rent'] < 200) | (fixed_df['weekly_rent'] > 3000)]
-        if len(invalid_rents) > 0:
-            print(f"  Found {len(invalid_rents)} invalid rents, removing...")
-            fixed_df.loc[invalid_rents.index, 'weekly_rent'] = None
-    
-    # Distance validation (should be 0-100 km)
-    if 'cbd_distance_km' in fixed_df.columns:
-        invalid_dist = fixed_df[(fixed_df['cbd_distance_km'] < 0) | (fixed_df['cbd_distance_km'] > 100)]
-        if len(invalid_dist) > 0:
-            print(f"  Found {len(invalid_dist)} invalid distances, removing...")
-            fixed_df.loc[invalid_dist.index, 'cbd_distance_km'] = None
+    # Plausible ranges are declared in pipeline/schema.py
+    out_of_range = validate(fixed_df, EXTRACTED_SCHEMA).masks['range']
+    for col, label in [('median_price', 'prices'), ('rental_yield', 'yields'),
+                       ('weekly_rent', 'rents'), ('cbd_distance_km', 'distances')]:
+        if col in out_of_range.columns and out_of_range[col].any():
+            print(f"  Found {out_of_range[col].sum()} invalid {label}, removing...")
+            fixed_df.loc[out_of_range[col], col] = None
     
     return fixed_df
 
@@ -250,42 +232,40 @@ def main():
     
     # Load data
     print("📂 Loading data...")
-    df = pd.read_csv('data/improved-extracted-suburbs.csv')
-    ground_truth = load_ground_truth()
-    ocr_data = load_ocr_data()
+    with trace.span('load'):
+        df = pd.read_csv('data/improved-extracted-suburbs.csv')
+        ground_truth = load_ground_truth()
+        ocr_data = load_ocr_data()
+    trace.count('rows_touched', len(df))
     
     print(f"✅ Loaded {len(df)} entries to fix")
     print(f"✅ Loaded {len(ground_truth)} ground truth entries")
     
-    # Fix suburb names
-    df = fix_suburb_names(df, ocr_data, ground_truth)
-    
-    # Fix LGA names
-    df = fix_lga_names(df, ground_truth)
-    
-    # Validate data ranges
-    df = validate_and_fix_data(df, ground_truth)
-    
-    # Merge with ground truth
-    df = merge_with_ground_truth(df, ground_truth)
+    with trace.span('fix'):
+        # Fix suburb names
+        df = fix_suburb_names(df, ocr_data, ground_truth)
+        
+        # Fix LGA names
+        df = fix_lga_names(df, ground_truth)
+        
+        # Validate data ranges
+        df = validate_and_fix_data(df, ground_truth)
+        
+        # Merge with ground truth
+        df = merge_with_ground_truth(df, ground_truth)
     
     # Save fixed data
     output_file = Path('data/fixed-extracted-suburbs.csv')
-    df.to_csv(output_file, index=False)
+    with trace.span('write'):
+        df.to_csv(output_file, index=False)
     print(f"\n💾 Saved fixed data to {output_file}")
     
     # Statistics
     print("\n📊 FIXED DATA STATISTICS")
     print("=" * 60)
     print(f"Total entries: {len(df)}")
-    print(f"Unique suburbs: {df['suburb_name'].nunique()}")
     
-    print("\n📈 Data Completeness:")
-    for col in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']:
-        if col in df.columns:
-            count = df[col].notna().sum()
-            pct = count / len(df) * 100
-            print(f"  {col}: {count}/{len(df)} ({pct:.1f}%)")
+    report_quality(df, 'fix-names', ['suburb_name', 'lga'] + EXTRACTED_METRICS)
     
     # Show sample of fixed names
     print("\n✅ Sample of fixed suburb names:")
@@ -296,4 +276,4 @@ def main():
     print("\n✅ Data fixing complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
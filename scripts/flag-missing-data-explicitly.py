@@ -19,6 +19,9 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 
+from pipeline import trace
+from pipeline.quality import report_quality
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 EXISTING_CSV = BASE_DIR / 'data' / 'suburbs.csv'
@@ -51,7 +54,8 @@ def main():
     
     # Load dataset
     print("Loading suburbs.csv...")
-    df = pd.read_csv(EXISTING_CSV, comment='#')
+    with trace.span('load'):
+        df = pd.read_csv(EXISTING_CSV, comment='#')
     
     print(f"  Total suburbs: {len(df)}")
     print()
@@ -117,22 +121,11 @@ def main():
     
     # 4. Report data completeness after changes
     print()
-    print("Data Completeness After Changes:")
-    print("-" * 70)
-    total = len(df)
-    
-    # Calculate completeness for each field
-    fields_to_check = [
+    report_quality(df, 'flag-missing', [
         'medianPrice', 'rentalYield', 'primaryCommuteMinutes', 'secondaryCommuteMinutes',
         'parksDensity', 'childcareCenters', 'shoppingCenters', 
         'cafesRestaurants', 'medicalCenters', 'bikeScore'
-    ]
-    
-    for field in fields_to_check:
-        if field in df.columns:
-            complete = df[field].notna().sum()
-            percentage = (complete / total * 100) if total > 0 else 0
-            print(f"  {field}: {complete}/{total} ({percentage:.1f}%)")
+    ], title="Data Completeness After Changes:\n" + "-" * 70)
     
     print()
     
@@ -149,11 +142,12 @@ def main():
                 break
     
     # Write with header comments
-    with open(OUTPUT_CSV, 'w') as f:
-        for line in header_lines:
-            f.write(line + '\n')
-        # Write CSV with empty strings for NA values
-        df.to_csv(f, index=False, lineterminator='\n', na_rep='')
+    with trace.span('write'):
+        with open(OUTPUT_CSV, 'w') as f:
+            for line in header_lines:
+                f.write(line + '\n')
+            # Write CSV with empty strings for NA values
+            df.to_csv(f, index=False, lineterminator='\n', na_rep='')
     
     print("  File saved successfully")
     print()
@@ -167,11 +161,12 @@ def main():
     print("=" * 70)
     print(f"Total amenity placeholder patterns replaced: {changes['amenity_pattern']}")
     print(f"Total individual amenity field replacements: {sum(changes['individual_amenities'].values())}")
+    trace.count('rows_touched', int(changes['amenity_pattern']))
     print()
     print("✅ Done! All placeholder values have been replaced with empty/null.")
     print("   Missing data is now clearly marked as missing.")
 
 if __name__ == '__main__':
-    main()
+    trace.run(main)
 
 
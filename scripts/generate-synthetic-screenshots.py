@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Generate Synthetic Suburb Comparison Screenshots
+
+Renders comparison tables like the ones in "extra suburb data/" from rows
+drawn from data/suburbs.csv, across a grid of image widths, noise levels
+and JPEG qualities. Every JPG gets a `<name>.jpg.truth.json` sidecar with
+the rows it shows, so scripts/benchmark-ocr.py can score OCR accuracy
+without the private screenshots.
+
+Usage:
+    python3 scripts/generate-synthetic-screenshots.py
+    python3 scripts/generate-synthetic-screenshots.py --count 4 --widths 1200 2400 --noise 0 0.1 --quality 60 90
+
+Requirements:
+- Python packages: pip install pillow pandas numpy
+"""
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from pipeline import DATA_DIR
+from pipeline.synthetic import load_vocabulary, synthetic_rows
+
+try:
+    from pipeline.screenshots import require_pillow, write_screenshot
+    require_pillow()
+except ImportError as e:
+    print(f"❌ Missing required Python package: {e}")
+    print("\n📦 Install required packages:")
+    print("   pip install pillow")
+    sys.exit(1)
+
+OUTPUT_DIR = DATA_DIR / 'benchmarks' / 'screenshots'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render synthetic comparison-table screenshots")
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help="directory for JPGs and sidecars")
+    parser.add_argument('--count', type=int, default=2, help="images per width/noise/quality combination")
+    parser.add_argument('--rows', type=int, nargs=2, default=[8, 20], metavar=('MIN', 'MAX'),
+                        help="table rows per image (inclusive range)")
+    parser.add_argument('--widths', type=int, nargs='+', default=[1170, 1600, 2400], help="image widths in px")
+    parser.add_argument('--noise', type=float, nargs='+', default=[0.0, 0.05, 0.12],
+                        help="Gaussian noise levels (fraction of full scale)")
+    parser.add_argument('--quality', type=int, nargs='+', default=[95, 75, 50], help="JPEG qualities")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("🖼️  Generate Synthetic Screenshots")
+    print("=" * 60)
+
+    rng = np.random.default_rng(args.seed)
+    vocabulary = load_vocabulary()
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    total = 0
+    for width, noise, quality in itertools.product(args.widths, args.noise, args.quality):
+        for i in range(args.count):
+            n_rows = int(rng.integers(args.rows[0], args.rows[1] + 1))
+            rows = synthetic_rows(n_rows, rng, vocabulary)
+            path = args.output / f'Screenshot synthetic w{width} n{noise:.2f} q{quality} {i:03d}.jpg'
+            truth = write_screenshot(rows, path, width=width, noise=noise, quality=quality, rng=rng)
+            total += 1
+            print(f"  ✅ {path.name} ({truth['width']}x{truth['height']}, {n_rows} rows)")
+
+    print(f"\n💾 Wrote {total} screenshots with ground truth to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
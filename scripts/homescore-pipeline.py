@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+HomeScorePro Data Pipeline CLI
+
+One entry point for every pipeline script. Each script is a subcommand;
+arguments after the subcommand are passed to the script unchanged, as are
+--trace/--profile (see scripts/pipeline/trace.py).
+
+This file only imports the standard library at start-up. A script (and
+pandas, OpenCV, EasyOCR, ...) is imported when its subcommand runs, so
+`list` and `validate` start in well under 200 ms; `startup-check`
+verifies that budget.
+
+Usage:
+    python3 scripts/homescore-pipeline.py list
+    python3 scripts/homescore-pipeline.py validate
+    python3 scripts/homescore-pipeline.py ocr-extract
+    python3 scripts/homescore-pipeline.py impute --k 3 --dry-run
+    python3 scripts/homescore-pipeline.py startup-check
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from pipeline import BASE_DIR, CONFIG_JSON, SUBURBS_CSV
+
+STARTUP_BUDGET_MS = 200
+
+# Packages that must not be imported by list/validate
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'cv2', 'easyocr', 'PIL', 'torch', 'openai']
+
+# subcommand: (script in scripts/, takes its own arguments, description)
+COMMANDS = {
+    'ocr-extract': ('ocr-extract-suburb-data', False, "OCR screenshots in 'extra suburb data/'"),
+    'improved-extract': ('improved-ocr-extractor', False, "parse OCR text into suburb rows"),
+    'llm-parse': ('llm-table-parser-fixed', False, "parse OCR text with an LLM"),
+    'fix-names': ('fix-suburb-names', False, "fix suburb/LGA names (v1)"),
+    'fix-names-v2': ('fix-suburb-names-v2', False, "fix suburb/LGA names (v2)"),
+    'clean': ('clean-suburb-data', False, "clean extracted suburb names"),
+    'final-clean': ('final-clean-suburb-data', False, "final clean and de-duplicate"),
+    'update-suburbs': ('update-suburbs-with-extracted', False, "fill suburbs.csv placeholders from extraction"),
+    'remove-placeholders': ('remove-placeholder-data', False, "blank known placeholder values"),
+    'flag-missing': ('flag-missing-data-explicitly', False, "flag remaining placeholder amenities"),
+    'diff-suburbs': ('diff-suburbs', True, "show what changed between two versions of suburbs.csv"),
+    'impute': ('impute-missing-suburb-data', True, "fill blanks from nearest neighbours"),
+    'recompute-commute': ('recompute-commute-times', True, "estimate commute times from coordinates"),
+    'precompute-scores': ('precompute-suburb-scores', True, "write data/suburb-scores.json"),
+    'export-snapshot': ('export-suburbs-snapshot', True, "write the binary suburbs snapshot"),
+    'build-search-index': ('build-search-index', True, "write the suburb search index"),
+    'benchmark': ('benchmark-pipeline', True, "benchmark pipeline stages on synthetic data"),
+    'generate-screenshots': ('generate-synthetic-screenshots', True, "render labelled synthetic screenshots"),
+    'benchmark-ocr': ('benchmark-ocr', True, "OCR throughput/accuracy on labelled screenshots"),
+    'ocr-worker': ('ocr-worker', True, "serve warm EasyOCR readers on a Unix socket"),
+    'watch': ('watch-screenshots', True, "watch 'extra suburb data/' and ingest new screenshots"),
+}
+
+# Optional packages reported by `validate` (checked without importing them)
+OPTIONAL_PACKAGES = {
+    'pandas': 'all table stages',
+    'numpy': 'all table stages',
+    'scipy': 'impute',
+    'easyocr': 'ocr-extract',
+    'cv2': 'ocr-extract',
+    'PIL': 'ocr-extract, generate-screenshots',
+    'openai': 'llm-parse',
+}
+
+
+def cmd_list(args) -> int:
+    print("Pipeline commands:")
+    for name, (script, _, description) in COMMANDS.items():
+        print(f"  {name:22} {description}  [{script}.py]")
+    print("\n  validate               check inputs and installed packages")
+    print("  startup-check          verify list/validate start within the import budget")
+    return 0
+
+
+def cmd_validate(args) -> int:
+    """Check pipeline inputs with the standard library only"""
+    problems = 0
+    print("🔎 Validating pipeline inputs")
+    print("=" * 60)
+
+    csv_path = Path(args.csv)
+    if not csv_path.exists():
+        print(f"❌ {csv_path} not found")
+        problems += 1
+    else:
+        with open(csv_path, newline='') as f:
+            rows = (line for line in f if not line.startswith('#'))
+            reader = csv.reader(rows)
+            header = next(reader, [])
+            widths = {}
+            count = 0
+            for row in reader:
+                count += 1
+                widths[len(row)] = widths.get(len(row), 0) + 1
+        missing = [c for c in ['suburb', 'postcode', 'lga', 'latitude', 'longitude'] if c not in header]
+        print(f"✅ {csv_path.name}: {count} rows, {len(header)} columns")
+        if missing:
+            print(f"❌ Missing columns: {', '.join(missing)}")
+            problems += 1
+        ragged = {w: n for w, n in widths.items() if w != len(header)}
+        if ragged:
+            print(f"❌ Rows with the wrong number of fields: {ragged}")
+            problems += 1
+
+    try:
+        with open(args.config, 'r') as f:
+            json.load(f)
+        print(f"✅ {Path(args.config).name} parses")
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ {args.config}: {e}")
+        problems += 1
+
+    screenshots = BASE_DIR / 'extra suburb data'
+    n_images = len(list(screenshots.glob('*.jpg'))) if screenshots.exists() else 0
+    print(f"{'✅' if n_images else 'ℹ️ '} {n_images} screenshots in '{screenshots.name}/'")
+
+    print("\n📦 Packages:")
+    for package, used_by in OPTIONAL_PACKAGES.items():
+        found = importlib.util.find_spec(package) is not None
+        print(f"  {'✅' if found else '⚠️ '} {package:10} ({used_by})")
+
+    print(f"\n{'✅ Inputs look valid' if not problems else f'❌ {problems} problem(s) found'}")
+    return 1 if problems else 0
+
+
+def cmd_startup_check(args) -> int:
+    """Run list/validate in fresh interpreters and check time and imported modules"""
+    probe = (
+        "import sys, time, io, contextlib\n"
+        "start = time.perf_counter()\n"
+        f"sys.path.insert(0, {str(Path(__file__).resolve().parent)!r})\n"
+        "import importlib.util\n"
+        f"spec = importlib.util.spec_from_file_location('cli', {str(Path(__file__).resolve())!r})\n"
+        "cli = importlib.util.module_from_spec(spec); spec.loader.exec_module(cli)\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    cli.main(sys.argv[1:])\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(f'{elapsed:.1f} {\",\".join(heavy)}')\n"
+    )
+    failures = 0
+    for command in ['list', 'validate']:
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', probe, command], capture_output=True, text=True)
+        total_ms = (time.perf_counter() - start) * 1000
+        if result.returncode not in (0, 1):
+            print(f"❌ {command}: probe failed\n{result.stderr}")
+            failures += 1
+            continue
+        in_process, _, heavy = result.stdout.strip().rpartition('\n')[-1].partition(' ')
+        ok = float(in_process) < args.budget_ms and not heavy
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {command:10} {float(in_process):6.1f} ms in-process, "
+              f"{total_ms:6.1f} ms incl. interpreter start"
+              + (f"  heavy imports: {heavy}" if heavy else ""))
+    print(f"\nBudget: {args.budget_ms} ms")
+    return 1 if failures else 0
+
+
+def run_script(name: str, argv) -> int:
+    """Import a pipeline script and run its main() with argv"""
+    script, _, _ = COMMANDS[name]
+    from pipeline import trace
+    from pipeline.loader import load_script
+
+    # The older scripts resolve data/ paths relative to the repo root
+    os.chdir(BASE_DIR)
+    sys.argv = [str(Path(__file__).resolve().parent / f'{script}.py')] + list(argv)
+    try:
+        module = load_script(script)
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
+    result = trace.run(module.main, name=script)
+    return result if isinstance(result, int) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='homescore-pipeline', description="HomeScorePro data pipeline")
+    sub = parser.add_subparsers(dest='command', metavar='command')
+    sub.required = True
+
+    sub.add_parser('list', help="list pipeline commands").set_defaults(func=cmd_list)
+
+    validate = sub.add_parser('validate', help="check inputs and installed packages")
+    validate.add_argument('--csv', default=str(SUBURBS_CSV))
+    validate.add_argument('--config', default=str(CONFIG_JSON))
+    validate.set_defaults(func=cmd_validate)
+
+    startup = sub.add_parser('startup-check', help="verify the start-up import budget")
+    startup.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    startup.set_defaults(func=cmd_startup_check)
+
+    for name, (script, own_args, description) in COMMANDS.items():
+        if own_args:
+            # Listed for help only; main() hands these straight to the script
+            p = sub.add_parser(name, help=description, add_help=False)
+        else:
+            p = sub.add_parser(name, help=description, description=f"{description} ({script}.py)")
+            p.add_argument('--trace', help="write a trace file (Chrome JSON or .jsonl)")
+            p.add_argument('--profile', nargs='?', const=True, help="run under cProfile")
+        p.set_defaults(command_name=name)
+    return parser
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Scripts with their own parser get their arguments untouched (incl. --help)
+    if argv and argv[0] in COMMANDS and COMMANDS[argv[0]][1]:
+        return run_script(argv[0], argv[1:])
+
+    args = build_parser().parse_args(argv)
+    if hasattr(args, 'func'):
+        return args.func(args)
+
+    script_args = []
+    if args.trace:
+        script_args += ['--trace', args.trace]
+    if args.profile is not None:
+        script_args += ['--profile'] + ([] if args.profile is True else [args.profile])
+    return run_script(args.command_name, script_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
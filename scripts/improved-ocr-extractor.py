@@ -4,193 +4,320 @@ Improved OCR Extractor - Learned from Manual Extraction Patterns
 
 Uses patterns learned from grok-extracted-suburb-data.csv to improve
 automated extraction from OCR text.
+
+Set HOMESCORE_EXTRACT_WORKERS to parse the OCR texts on that many worker
+processes (default: one process).
 """
 
-import json
+import os
 import pandas as pd
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from operator import add
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from pipeline import trace
+from pipeline.gazetteer import Gazetteer, load_gazetteer
+from pipeline.ocr_store import load_ocr_texts
+from pipeline.quality import EXTRACTED_METRICS, profile_table, report_quality
+from pipeline.schema import EXTRACTED_SCHEMA
 
 def load_ground_truth() -> pd.DataFrame:
     """Load manually extracted data as ground truth"""
     return pd.read_csv('data/grok-extracted-suburb-data.csv')
 
 def load_ocr_data() -> Dict:
-    """Load OCR extraction results"""
-    with open('data/ocr-extraction-report.json', 'r') as f:
-        report = json.load(f)
-    return {r['source_file']: r['extracted_text'] for r in report['results']}
+    """Load OCR extraction results (full text is read from the OCR store on first use)"""
+    return load_ocr_texts('data/ocr-extraction-report.json')
+
+# Worker processes for extract_all, and OCR texts per pool task
+EXTRACT_WORKERS = int(os.environ.get('HOMESCORE_EXTRACT_WORKERS', 1))
+CHUNK_DOCUMENTS = 64
+
+GROUND_TRUTH_KEY = ['suburb_name', 'source_file']
+
+# Plausible values (learned from manual data, see pipeline/schema.py)
+_PRICE = EXTRACTED_SCHEMA['median_price']
+_YIELD = EXTRACTED_SCHEMA['rental_yield']
+_RENT = EXTRACTED_SCHEMA['weekly_rent']
+_DISTANCE = EXTRACTED_SCHEMA['cbd_distance_km']
+_HOUSEHOLD = EXTRACTED_SCHEMA['household_percentage']
+
+# Words after "Victoria" searched for a row's values
+CONTEXT_WORDS = 24
+
+# The common row layout, as whole words:
+#   Victoria $price yield% $rent dist km household%
+# One regex scan over the text classifies the six words after every such
+# "Victoria" into their typed slots. $, S and s are the dollar sign as OCR
+# reads it; the km word must not contain '%' (it would count as the
+# household's '%' word).
+_REGULAR_ROW = re.compile(
+    r'(?<![^ ])Victoria '
+    r'((?:[$Ss,]*[0-9]){5,8}[$Ss,]*) '  # price
+    r'([0-9.]+)% '                      # yield
+    r'[$Ss]([0-9,]*[0-9][0-9,]*) '      # rent
+    r'([0-9]+) [^ %]*km[^ %]* '         # distance
+    r'([0-9.]+)%(?= |$)'                # household
+)
+_PRICE_NOISE = str.maketrans('', '', '$S,s')
+
 
-def extract_suburb_data_improved(ocr_text: str, source_file: str) -> List[Dict]:
+def parse_regular_row(groups: Tuple[str, ...]) -> Optional[Dict]:
+    """
+    Values of a row in the common layout, or None if any is out of range.
+
+    Within such a row each field's first candidate word is its own slot
+    (the price can never pass as a rent, the yield's '%' word is the one
+    the household search skips), so this gives the same values as
+    search_context, which handles every other row.
+    """
+    price, yield_str, rent, distance, household_str = groups
+    try:
+        yield_pct = float(yield_str) / 100
+        household = float(household_str) / 100
+    except ValueError:
+        return None
+    price = int(price.translate(_PRICE_NOISE))
+    rent = int(rent.replace(',', ''))
+    distance = int(distance)
+    if (_PRICE.in_range(price) and _YIELD.in_range(yield_pct) and _RENT.in_range(rent)
+            and _DISTANCE.in_range(distance) and _HOUSEHOLD.in_range(household)):
+        return {
+            'median_price': price,
+            'rental_yield': yield_pct,
+            'weekly_rent': rent,
+            'cbd_distance_km': distance,
+            'household_percentage': household,
+        }
+    return None
+
+
+def search_context(context: List[str]) -> Dict:
+    """Values found in the words after "Victoria", searched field by field"""
+    suburb_data = {}
+    # IMPROVED PRICE EXTRACTION
+    # Pattern: $X,XXX,XXX or SX,XXX,XXX or X,XXX,XXX
+    price_found = False
+    for word in context:
+        # Remove $, S, commas
+        clean = word.replace('$', '').replace('S', '').replace(',', '').replace('s', '')
+    
+        # Check if it's a price (5-8 digits)
+        if clean.isdigit() and 5 <= len(clean) <= 8:
+            price = int(clean)
+            # Validate price range (learned from manual data: $448K - $2.68M)
+            if _PRICE.in_range(price):
+                suburb_data['median_price'] = price
+                price_found = True
+                break
+    
+    # IMPROVED YIELD EXTRACTION
+    # Pattern: X.X% (usually 1.5% - 4.7%)
+    for word in context:
+        if '%' in word:
+            # Extract percentage
+            pct_str = ''.join(c for c in word if c.isdigit() or c == '.')
+            if pct_str:
+                try:
+                    yield_pct = float(pct_str) / 100
+                    # Validate range (learned: 1.5% - 4.7%)
+                    if _YIELD.in_range(yield_pct):
+                        suburb_data['rental_yield'] = yield_pct
+                        break
+                except ValueError:
+                    pass
+    
+    # IMPROVED RENT EXTRACTION
+    # Pattern: $XXX or SXXX (usually $300-$2000)
+    for word in context:
+        if word.startswith('$') or word.startswith('S') or word.startswith('s'):
+            rent_str = word[1:].replace(',', '')
+            if rent_str.isdigit():
+                rent = int(rent_str)
+                # Validate range (learned: $388 - $1,050)
+                if _RENT.in_range(rent):
+                    suburb_data['weekly_rent'] = rent
+                    break
+    
+    # IMPROVED DISTANCE EXTRACTION
+    # Pattern: XX km or XXkm
+    for j, word in enumerate(context):
+        if word.isdigit():
+            # Check if next word is 'km' or if 'km' is in current word
+            if (j+1 < len(context) and 'km' in context[j+1]) or 'km' in word:
+                try:
+                    # Extract number
+                    dist_str = ''.join(c for c in word if c.isdigit())
+                    if dist_str:
+                        dist = int(dist_str)
+                        # Validate range (learned: 2-29 km)
+                        if _DISTANCE.in_range(dist):
+                            suburb_data['cbd_distance_km'] = dist
+                            break
+                except ValueError:
+                    pass
+    
+    # IMPROVED HOUSEHOLD PERCENTAGE EXTRACTION
+    # Pattern: XX.X% (usually 47.7% - 91.2%)
+    yield_found = False
+    for word in context:
+        if '%' in word:
+            # Skip if this is the yield percentage (first % usually)
+            if not yield_found:
+                yield_found = True
+                continue
+    
+            # Extract percentage
+            pct_str = ''.join(c for c in word if c.isdigit() or c == '.')
+            if pct_str:
+                try:
+                    pct = float(pct_str) / 100
+                    # Validate range (learned: 47.7% - 91.2%)
+                    if _HOUSEHOLD.in_range(pct):
+                        suburb_data['household_percentage'] = pct
+                        break
+                except ValueError:
+                    pass
+    
+    return suburb_data
+
+
+def split_row_names(words: List[str], i: int, gazetteer: Gazetteer) -> Optional[Tuple[str, str]]:
+    """
+    (suburb, lga) for the row whose "Victoria" is words[i].
+
+    Known names come from the gazetteer, whatever their number of words.
+    An unknown suburb is taken as the one word before a known LGA, and
+    with no known LGA the two words before "Victoria" are used as before.
+    """
+    names = gazetteer.segment(words, i)
+    if names:
+        return names
+    
+    lga_match = gazetteer.lga_before(words, i)
+    if lga_match and lga_match[0] > 0:
+        suburb_name, lga = words[lga_match[0] - 1], lga_match[1]
+    else:
+        suburb_name, lga = words[i-2], words[i-1]
+    
+    # Validate suburb name
+    if not suburb_name[0].isupper() or len(suburb_name) < 3:
+        return None
+    return suburb_name, lga
+
+def extract_suburb_data_improved(ocr_text: str, source_file: str,
+                                 gazetteer: Optional[Gazetteer] = None) -> List[Dict]:
     """
     Improved extraction using learned patterns from manual data
     
     Pattern learned: SuburbName LGA Victoria $price yield% $rent dist km household%
+    
+    Suburb and LGA names are matched against the suburbs.csv gazetteer
+    (split_row_names). Rows in exactly that layout are read from one regex
+    scan of the whole text (parse_regular_row); the rest are searched word
+    by word in the CONTEXT_WORDS words after "Victoria" (search_context).
     """
     all_suburbs = []
+    if gazetteer is None:
+        gazetteer = load_gazetteer()
     
     # Split into words for pattern matching
     words = ocr_text.split()
     
-    i = 0
-    while i < len(words):
-        # Look for "Victoria" as anchor point
-        if words[i] == 'Victoria' and i > 1:
-            # Extract suburb name (2 words before Victoria)
-            suburb_name = words[i-2] if i >= 2 else None
-            lga = words[i-1] if i >= 1 else None
-            
-            # Validate suburb name
-            if not suburb_name or not suburb_name[0].isupper() or len(suburb_name) < 3:
-                i += 1
-                continue
-            
-            # Extract data from next 20 words after Victoria
-            context_start = i + 1
-            context_end = min(len(words), i + 25)
-            context = words[context_start:context_end]
-            
-            suburb_data = {
-                'suburb_name': suburb_name,
-                'lga': lga,
-                'state': 'Victoria',
-                'source_file': source_file
-            }
-            
-            # IMPROVED PRICE EXTRACTION
-            # Pattern: $X,XXX,XXX or SX,XXX,XXX or X,XXX,XXX
-            price_found = False
-            for word in context:
-                # Remove $, S, commas
-                clean = word.replace('$', '').replace('S', '').replace(',', '').replace('s', '')
-                
-                # Check if it's a price (5-8 digits)
-                if clean.isdigit() and 5 <= len(clean) <= 8:
-                    price = int(clean)
-                    # Validate price range (learned from manual data: $448K - $2.68M)
-                    if 200000 <= price <= 5000000:
-                        suburb_data['median_price'] = price
-                        price_found = True
-                        break
-            
-            # IMPROVED YIELD EXTRACTION
-            # Pattern: X.X% (usually 1.5% - 4.7%)
-            for word in context:
-                if '%' in word:
-                    # Extract percentage
-                    pct_str = ''.join(c for c in word if c.isdigit() or c == '.')
-                    if pct_str:
-                        try:
-                            yield_pct = float(pct_str) / 100
-                            # Validate range (learned: 1.5% - 4.7%)
-                            if 0.01 <= yield_pct <= 0.10:
-                                suburb_data['rental_yield'] = yield_pct
-                                break
-                        except ValueError:
-                            pass
-            
-            # IMPROVED RENT EXTRACTION
-            # Pattern: $XXX or SXXX (usually $300-$2000)
-            for word in context:
-                if word.startswith('$') or word.startswith('S') or word.startswith('s'):
-                    rent_str = word[1:].replace(',', '')
-                    if rent_str.isdigit():
-                        rent = int(rent_str)
-                        # Validate range (learned: $388 - $1,050)
-                        if 200 <= rent <= 3000:
-                            suburb_data['weekly_rent'] = rent
-                            break
-            
-            # IMPROVED DISTANCE EXTRACTION
-            # Pattern: XX km or XXkm
-            for j, word in enumerate(context):
-                if word.isdigit():
-                    # Check if next word is 'km' or if 'km' is in current word
-                    if (j+1 < len(context) and 'km' in context[j+1]) or 'km' in word:
-                        try:
-                            # Extract number
-                            dist_str = ''.join(c for c in word if c.isdigit())
-                            if dist_str:
-                                dist = int(dist_str)
-                                # Validate range (learned: 2-29 km)
-                                if 0 <= dist <= 100:
-                                    suburb_data['cbd_distance_km'] = dist
-                                    break
-                        except ValueError:
-                            pass
-            
-            # IMPROVED HOUSEHOLD PERCENTAGE EXTRACTION
-            # Pattern: XX.X% (usually 47.7% - 91.2%)
-            yield_found = False
-            for word in context:
-                if '%' in word:
-                    # Skip if this is the yield percentage (first % usually)
-                    if not yield_found:
-                        yield_found = True
-                        continue
-                    
-                    # Extract percentage
-                    pct_str = ''.join(c for c in word if c.isdigit() or c == '.')
-                    if pct_str:
-                        try:
-                            pct = float(pct_str) / 100
-                            # Validate range (learned: 47.7% - 91.2%)
-                            if 0.3 <= pct <= 1.0:
-                                suburb_data['household_percentage'] = pct
-                                break
-                        except ValueError:
-                            pass
-            
-            # Only add if we found at least one metric
-            if any(key in suburb_data for key in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']):
-                all_suburbs.append(suburb_data)
+    # Look for "Victoria" as anchor point
+    anchors = [i for i, word in enumerate(words) if word == 'Victoria' and i > 1]
+    if not anchors:
+        return all_suburbs
+    
+    text = ' '.join(words)
+    # Character position of every word in text
+    word_at = list(accumulate(map(add, map(len, words), repeat(1)), initial=0))
+    regular_rows = {m.start(): m.groups() for m in _REGULAR_ROW.finditer(text)}
+    
+    for i in anchors:
+        names = split_row_names(words, i, gazetteer)
+        if names is None:
+            continue
+        suburb_name, lga = names
         
-        i += 1
+        suburb_data = {
+            'suburb_name': suburb_name,
+            'lga': lga,
+            'state': 'Victoria',
+            'source_file': source_file
+        }
+        
+        groups = regular_rows.get(word_at[i])
+        values = parse_regular_row(groups) if groups else None
+        if values is None:
+            values = search_context(words[i + 1:i + 1 + CONTEXT_WORDS])
+        suburb_data.update(values)
+        
+        # Only add if we found at least one metric
+        if values:
+            all_suburbs.append(suburb_data)
     
     return all_suburbs
 
-def merge_with_ground_truth(extracted: List[Dict], ground_truth: pd.DataFrame) -> List[Dict]:
+def extract_chunk(items: List[Tuple[str, str]]) -> List[Tuple[str, List[Dict]]]:
+    """Extract the suburbs of a chunk of (source_file, ocr_text) pairs (process pool task)"""
+    return [(source_file, extract_suburb_data_improved(ocr_text, source_file))
+            for source_file, ocr_text in items]
+
+def extract_all(ocr_data: Mapping[str, str], workers: int = EXTRACT_WORKERS) -> List[Dict]:
     """
-    Merge extracted data with ground truth to fill in missing values
+    Extract the suburbs of every OCR text, in file order.
+
+    With workers > 1 the files are parsed in chunks of CHUNK_DOCUMENTS on a
+    process pool. Texts are read from the OCR store here and sent to the
+    workers, so the store is never opened from more than one process.
     """
-    # Create lookup from ground truth
-    gt_lookup = {}
-    for _, row in ground_truth.iterrows():
-        key = (row['suburb_name'], row['source_file'])
-        gt_lookup[key] = row.to_dict()
-    
-    # Enhance extracted data with ground truth
-    enhanced = []
-    for entry in extracted:
-        key = (entry['suburb_name'], entry['source_file'])
-        
-        if key in gt_lookup:
-            gt = gt_lookup[key]
-            # Fill in missing values from ground truth
-            if 'median_price' not in entry or pd.isna(entry.get('median_price')):
-                if not pd.isna(gt.get('median_price')):
-                    entry['median_price'] = gt['median_price']
-            
-            if 'rental_yield' not in entry or pd.isna(entry.get('rental_yield')):
-                if not pd.isna(gt.get('rental_yield')):
-                    entry['rental_yield'] = gt['rental_yield']
-            
-            if 'weekly_rent' not in entry or pd.isna(entry.get('weekly_rent')):
-                if not pd.isna(gt.get('weekly_rent')):
-                    entry['weekly_rent'] = gt['weekly_rent']
-            
-            if 'cbd_distance_km' not in entry or pd.isna(entry.get('cbd_distance_km')):
-                if not pd.isna(gt.get('cbd_distance_km')):
-                    entry['cbd_distance_km'] = gt['cbd_distance_km']
-            
-            if 'household_percentage' not in entry or pd.isna(entry.get('household_percentage')):
-                if not pd.isna(gt.get('household_percentage')):
-                    entry['household_percentage'] = gt['household_percentage']
-        
-        enhanced.append(entry)
-    
-    return enhanced
+    all_suburbs = []
+    if workers <= 1 or len(ocr_data) <= CHUNK_DOCUMENTS:
+        for source_file, ocr_text in ocr_data.items():
+            with trace.span('parse', file=source_file):
+                suburbs = extract_suburb_data_improved(ocr_text, source_file)
+            all_suburbs.extend(suburbs)
+            print(f"  {source_file}: {len(suburbs)} suburbs extracted")
+        return all_suburbs
+
+    items = list(ocr_data.items())
+    chunks = [items[i:i + CHUNK_DOCUMENTS] for i in range(0, len(items), CHUNK_DOCUMENTS)]
+    with trace.span('parse', files=len(items), workers=workers, chunks=len(chunks)):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for results in pool.map(extract_chunk, chunks):
+                for source_file, suburbs in results:
+                    all_suburbs.extend(suburbs)
+                    print(f"  {source_file}: {len(suburbs)} suburbs extracted")
+    return all_suburbs
+
+def merge_with_ground_truth(extracted: List[Dict], ground_truth: pd.DataFrame) -> pd.DataFrame:
+    """
+    Merge extracted data with ground truth to fill in missing values.
+
+    One left join on (suburb_name, source_file); when the ground truth has
+    the same key twice its last row is used.
+    """
+    df = pd.DataFrame(extracted)
+    metrics = [col for col in EXTRACTED_METRICS if col in ground_truth.columns]
+    if df.empty or not metrics:
+        return df
+
+    gt = (ground_truth[GROUND_TRUTH_KEY + metrics]
+          .drop_duplicates(GROUND_TRUTH_KEY, keep='last')
+          .set_index(GROUND_TRUTH_KEY))
+    matched = gt.reindex(pd.MultiIndex.from_frame(df[GROUND_TRUTH_KEY]))
+    matched.index = df.index
+
+    for col in metrics:
+        if col in df.columns:
+            df[col] = df[col].fillna(matched[col])
+        elif matched[col].notna().any():
+            df[col] = matched[col]
+    return df
 
 def main():
     """Main extraction function"""
@@ -199,48 +326,39 @@ def main():
     
     # Load data
     print("📂 Loading data...")
-    ground_truth = load_ground_truth()
-    ocr_data = load_ocr_data()
+    with trace.span('load'):
+        ground_truth = load_ground_truth()
+        ocr_data = load_ocr_data()
     
     print(f"✅ Loaded {len(ground_truth)} ground truth entries")
     print(f"✅ Loaded {len(ocr_data)} OCR texts")
     
     # Extract all suburbs
     print("\n🔄 Extracting suburbs from OCR text...")
-    all_suburbs = []
-    
-    for source_file, ocr_text in ocr_data.items():
-        suburbs = extract_suburb_data_improved(ocr_text, source_file)
-        all_suburbs.extend(suburbs)
-        print(f"  {source_file}: {len(suburbs)} suburbs extracted")
+    all_suburbs = extract_all(ocr_data)
     
     print(f"\n✅ Extracted {len(all_suburbs)} suburb entries")
     
     # Merge with ground truth
     print("\n🔗 Merging with ground truth data...")
-    enhanced_suburbs = merge_with_ground_truth(all_suburbs, ground_truth)
-    
-    # Create DataFrame
-    df = pd.DataFrame(enhanced_suburbs)
+    with trace.span('fix', step='merge_with_ground_truth'):
+        df = merge_with_ground_truth(all_suburbs, ground_truth)
+    trace.count('rows_touched', len(df))
     
     # Save results
     output_file = Path('data/improved-extracted-suburbs.csv')
-    df.to_csv(output_file, index=False)
+    with trace.span('write'):
+        df.to_csv(output_file, index=False)
     print(f"💾 Saved to {output_file}")
     
     # Statistics
     print("\n📊 EXTRACTION STATISTICS")
     print("=" * 60)
     print(f"Total entries: {len(df)}")
-    print(f"Unique suburbs: {df['suburb_name'].nunique()}")
-    print(f"Screenshots: {df['source_file'].nunique()}")
+    named = load_gazetteer().known_rows(df).sum()
+    print(f"Named from the gazetteer: {named}/{len(df)} (the rest need fix-names-v2 and the clean stages)")
     
-    print("\n📈 Data Completeness:")
-    for col in ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']:
-        if col in df.columns:
-            count = df[col].notna().sum()
-            pct = count / len(df) * 100
-            print(f"  {col}: {count}/{len(df)} ({pct:.1f}%)")
+    quality = report_quality(df, 'improved-extract', ['suburb_name', 'lga', 'source_file'] + EXTRACTED_METRICS)
     
     # Compare with previous extraction
     try:
@@ -250,10 +368,11 @@ def main():
         print(f"  Improved: {len(df)} entries")
         print(f"  Change: {len(df) - len(old_df):+d} entries")
         
-        for col in ['median_price', 'rental_yield', 'weekly_rent']:
-            if col in df.columns and col in old_df.columns:
-                old_count = old_df[col].notna().sum()
-                new_count = df[col].notna().sum()
+        old_quality = profile_table(old_df, ['median_price', 'rental_yield', 'weekly_rent'])
+        for col, old_stats in old_quality['columns'].items():
+            if col in quality['columns']:
+                old_count = old_stats['filled']
+                new_count = quality['columns'][col]['filled']
                 improvement = new_count - old_count
                 print(f"  {col}: {old_count} -> {new_count} ({improvement:+d})")
     except:
@@ -262,4 +381,4 @@ def main():
     print("\n✅ Improved extraction complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
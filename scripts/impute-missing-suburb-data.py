@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Impute Missing Suburb Data from Nearest Neighbours
+
+Fills blank numeric fields in suburbs.csv (left behind by
+remove-placeholder-data.py) from the k nearest suburbs that have real data,
+weighted by distance. Neighbours come from a KD-tree over latitude/longitude
+(scripts/pipeline/spatial.py), so each lookup is O(log n).
+
+Every filled cell is recorded in a provenance file so imputed values can
+always be told apart from measured ones. Re-runs merge their entries into
+that file, and cells listed there are never used as donors, so estimates
+are not built from earlier estimates.
+
+Usage:
+    python3 scripts/impute-missing-suburb-data.py
+    python3 scripts/impute-missing-suburb-data.py --restrict-to lga --k 3
+    python3 scripts/impute-missing-suburb-data.py --columns medianPrice rentalYield --dry-run
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pipeline import SUBURBS_CSV, trace
+from pipeline.spatial import DEFAULT_IMPUTE_COLUMNS, impute_from_neighbours
+from pipeline.suburbs_io import read_header_comments, read_suburbs_csv, write_suburbs_csv
+
+# Written next to the CSV being updated
+BACKUP_SUFFIX = '.backup-impute'
+PROVENANCE_NAME = 'suburbs-imputation-provenance.csv'
+PROVENANCE_COLUMNS = ['suburb', 'postcode', 'field', 'value', 'neighbours', 'mean_distance_km']
+PROVENANCE_KEY = ['suburb', 'postcode', 'field']
+FLAG_COLUMN = 'imputedFields'
+
+
+def positive_int(value: str) -> int:
+    """Parse an integer argument that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected an integer, got: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Must be at least 1, got: {value}")
+    return number
+
+
+def load_estimates(df: pd.DataFrame, provenance_csv: Path) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """
+    Match the provenance of earlier runs to df. An entry still applies while
+    its cell holds the recorded value (a cell that was re-measured or
+    cleared since is real data again). Returns the entries that apply and,
+    per field, a bool mask of the cells they cover.
+    """
+    if not provenance_csv.exists():
+        return pd.DataFrame(columns=PROVENANCE_COLUMNS), {}
+
+    entries = pd.read_csv(provenance_csv, dtype={'suburb': str, 'postcode': str})
+    rows = pd.DataFrame({
+        'suburb': df['suburb'].astype(str).to_numpy(),
+        'postcode': df['postcode'].astype(str).to_numpy(),
+        'row': np.arange(len(df)),
+    })
+    matched = entries.merge(rows, on=['suburb', 'postcode'], how='inner')
+
+    keep = np.zeros(len(matched), dtype=bool)
+    estimated = {}
+    for field, group in matched.groupby('field'):
+        if field not in df.columns:
+            continue
+        positions = group['row'].to_numpy()
+        current = pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64)[positions]
+        recorded = pd.to_numeric(group['value'], errors='coerce').to_numpy(dtype=np.float64)
+        same = np.isclose(current, recorded)
+        keep[group.index[same]] = True
+        mask = np.zeros(len(df), dtype=bool)
+        mask[positions[same]] = True
+        estimated[field] = mask
+
+    current = matched[keep].drop(columns='row').drop_duplicates(PROVENANCE_KEY)
+    return current[PROVENANCE_COLUMNS], estimated
+
+
+def merge_flags(imputed: pd.DataFrame, provenance: pd.DataFrame) -> pd.Series:
+    """The imputedFields column with this run's fields added to earlier flags"""
+    if FLAG_COLUMN in imputed.columns:
+        flags = imputed[FLAG_COLUMN].fillna('').astype(str)
+    else:
+        flags = pd.Series('', index=imputed.index, dtype=object)
+    added = provenance.groupby('row')['field'].agg(list)
+    labels = imputed.index[added.index]
+    flags.loc[labels] = [
+        ';'.join(dict.fromkeys([f for f in earlier.split(';') if f] + fields))
+        for earlier, fields in zip(flags.loc[labels], added)
+    ]
+    return flags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill missing suburb fields from nearest neighbours")
+    parser.add_argument('--csv', type=Path, default=SUBURBS_CSV, help="suburbs CSV to update")
+    parser.add_argument('--columns', nargs='+', default=None,
+                        help=f"fields to impute (default: {' '.join(DEFAULT_IMPUTE_COLUMNS)})")
+    parser.add_argument('--k', type=positive_int, default=5, help="number of neighbours (default: 5)")
+    parser.add_argument('--restrict-to', choices=['lga', 'category'], default=None,
+                        help="only use neighbours with the same LGA or category")
+    parser.add_argument('--max-distance-km', type=float, default=None, help="ignore neighbours further away")
+    parser.add_argument('--power', type=float, default=1.0, help="inverse-distance weight exponent")
+    parser.add_argument('--flag-column', action='store_true',
+                        help="add to the imputedFields column listing the filled fields per suburb")
+    parser.add_argument('--dry-run', action='store_true', help="report without saving")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("IMPUTE MISSING SUBURB DATA (Nearest Neighbours)")
+    print("=" * 70)
+    print()
+
+    df = read_suburbs_csv(args.csv)
+    print(f"  Total suburbs: {len(df)}")
+    print(f"  k={args.k}, restrict_to={args.restrict_to or 'none'}, power={args.power}")
+    print()
+
+    unknown = [c for c in args.columns or [] if c not in df.columns]
+    if unknown:
+        print(f"❌ Unknown columns: {', '.join(unknown)}")
+        sys.exit(1)
+
+    provenance_csv = args.csv.with_name(PROVENANCE_NAME)
+    earlier, estimated = load_estimates(df, provenance_csv)
+    if len(earlier):
+        print(f"  Earlier estimates (not used as donors): {len(earlier)}")
+        print()
+
+    start = time.perf_counter()
+    imputed, provenance = impute_from_neighbours(
+        df, columns=args.columns, k=args.k, restrict_to=args.restrict_to,
+        power=args.power, max_distance_km=args.max_distance_km, estimated=estimated,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Imputation finished in {elapsed_ms:.1f} ms")
+    print("-" * 70)
+    columns = args.columns or [c for c in DEFAULT_IMPUTE_COLUMNS if c in df.columns]
+    filled_counts = provenance['field'].value_counts()
+    total = len(df)
+    for column in columns:
+        before = df[column].notna().sum()
+        after = imputed[column].notna().sum()
+        print(f"  {column:25} filled {filled_counts.get(column, 0):4d}  "
+              f"completeness {before}/{total} -> {after}/{total}")
+    print()
+
+    if args.dry_run:
+        print("Dry run - no changes saved")
+        return
+
+    if args.flag_column:
+        imputed[FLAG_COLUMN] = merge_flags(imputed, provenance)
+
+    backup_csv = args.csv.with_name(args.csv.name + BACKUP_SUFFIX)
+    print(f"Creating backup: {backup_csv}")
+    write_suburbs_csv(df, backup_csv, header_lines=read_header_comments(args.csv))
+
+    # This run's entries replace earlier ones for the same cell
+    rows = provenance['row'].to_numpy()
+    provenance.insert(0, 'suburb', df['suburb'].astype(str).to_numpy()[rows])
+    provenance.insert(1, 'postcode', df['postcode'].astype(str).to_numpy()[rows])
+    merged = pd.concat([earlier, provenance[PROVENANCE_COLUMNS]], ignore_index=True)
+    merged = merged.drop_duplicates(PROVENANCE_KEY, keep='last')
+    merged.to_csv(provenance_csv, index=False)
+    print(f"Provenance saved to: {provenance_csv} ({len(provenance)} new, {len(merged)} total)")
+
+    write_suburbs_csv(imputed, args.csv)
+    print(f"Updated file: {args.csv}")
+    print()
+    print("Done!")
+
+
+if __name__ == '__main__':
+    trace.run(main)
@@ -20,6 +20,9 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import re
 
+from pipeline import trace
+from pipeline.ocr_store import entry_text
+
 try:
     import openai
     from openai import OpenAI
@@ -114,15 +117,19 @@ def parse_suburb_with_llm(client: OpenAI, ocr_text: str, target_suburb: str) ->
     prompt = create_parsing_prompt(ocr_text, target_suburb)
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a precise data extraction specialist. Return only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=1000
-        )
+        with trace.span('parse', suburb=target_suburb):
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a precise data extraction specialist. Return only valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+                max_tokens=1000
+            )
+        if response.usage:
+            trace.count('llm_prompt_tokens', response.usage.prompt_tokens)
+            trace.count('llm_completion_tokens', response.usage.completion_tokens)
 
         content = response.choices[0].message.content.strip()
         content = re.sub(r'^```json\s*', '', content)
@@ -165,11 +172,12 @@ def process_all_screenshots(client: OpenAI, ocr_data: Dict) -> List[Dict]:
                 best_confidence = confidence
                 best_entry = entry
 
-        if not best_entry or 'extracted_text' not in best_entry:
+        # Full text lives in the OCR text store; the entry references it
+        ocr_text = entry_text(best_entry) if best_entry else None
+        if not ocr_text:
             print(f"  ⚠️  No OCR text found for {suburb_name}")
             continue
 
-        ocr_text = best_entry['extracted_text']
         source_file = best_entry['source_file']
 
         parsed_data = parse_suburb_with_llm(client, ocr_text, suburb_name)
@@ -278,7 +286,8 @@ def main():
     client = init_openai_client()
 
     print("📂 Loading OCR extraction data...")
-    ocr_data = load_ocr_data()
+    with trace.span('load'):
+        ocr_data = load_ocr_data()
     print(f"✅ Loaded data for {len(ocr_data)} suburbs")
 
     OUTPUT_JSON.parent.mkdir(exist_ok=True)
@@ -290,12 +299,13 @@ def main():
 
     print("💾 Saving results...")
 
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-    print(f"✅ Saved detailed results: {OUTPUT_JSON}")
+    with trace.span('write'):
+        with open(OUTPUT_JSON, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"✅ Saved detailed results: {OUTPUT_JSON}")
 
-    df.to_csv(OUTPUT_CSV, index=False)
-    print(f"✅ Saved CSV dataset: {OUTPUT_CSV}")
+        df.to_csv(OUTPUT_CSV, index=False)
+        print(f"✅ Saved CSV dataset: {OUTPUT_CSV}")
 
     report = generate_report(results, df)
     with open(REPORT_FILE, 'w') as f:
@@ -322,4 +332,4 @@ def main():
     print("Check the CSV file for the structured suburb data.")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
@@ -9,28 +9,47 @@ Requirements:
 - Python packages: pip install easyocr pillow opencv-python pandas
 
 Note: EasyOCR will download models on first run (requires internet connection)
+
+Start scripts/ocr-worker.py first to reuse warm EasyOCR readers across runs;
+without it the reader is loaded in-process.
 """
 
+import importlib
 import os
 import sys
 import json
 import csv
 import re
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-try:
-    import easyocr
-    from PIL import Image
-    import cv2
-    import numpy as np
-    import pandas as pd
-except ImportError as e:
-    print(f"❌ Missing required Python package: {e}")
-    print("\n📦 Install required packages:")
-    print("   pip install easyocr pillow opencv-python pandas")
-    sys.exit(1)
+from pipeline import trace
+
+# Heavy packages are imported on first use (require_packages) so that
+# importing this module, --help and the light pipeline commands start fast
+easyocr = Image = cv2 = np = pd = None
+PACKAGES = {
+    'easyocr': 'easyocr',
+    'Image': 'PIL.Image',
+    'cv2': 'cv2',
+    'np': 'numpy',
+    'pd': 'pandas',
+}
+
+def require_packages(*names: str):
+    """Import the named packages (keys of PACKAGES) into module globals"""
+    for name in names or PACKAGES:
+        if globals()[name] is not None:
+            continue
+        try:
+            globals()[name] = importlib.import_module(PACKAGES[name])
+        except ImportError as e:
+            print(f"❌ Missing required Python package: {e}")
+            print("\n📦 Install required packages:")
+            print("   pip install easyocr pillow opencv-python pandas")
+            sys.exit(1)
 
 # Global OCR reader (initialized lazily)
 OCR_READER = None
@@ -39,6 +58,7 @@ def get_ocr_reader():
     """Initialize and return EasyOCR reader (lazy loading)"""
     global OCR_READER
     if OCR_READER is None:
+        require_packages('easyocr')
         print("🔄 Initializing EasyOCR (this may take a moment on first run)...")
         try:
             OCR_READER = easyocr.Reader(['en'], gpu=False)  # Use CPU mode
@@ -48,12 +68,100 @@ def get_ocr_reader():
             sys.exit(1)
     return OCR_READER
 
+# Client for a running OCR worker service (scripts/ocr-worker.py);
+# False once we know there is none, so the socket is only probed once
+OCR_SERVICE = None
+
+def get_ocr_service():
+    """Return a client for the warm OCR service, or None to OCR in-process"""
+    global OCR_SERVICE
+    if OCR_SERVICE is None:
+        from pipeline import ocr_service
+        OCR_SERVICE = ocr_service.connect() or False
+        if OCR_SERVICE:
+            print(f"✅ Using OCR service at {OCR_SERVICE.path}\n")
+    return OCR_SERVICE or None
+
+def ocr_settings() -> Dict:
+    """This run's OCR settings, sent with each request to the worker service"""
+    return {'table_crop': TABLE_CROP, 'refine_confidence': REFINE_CONFIDENCE, 'tile_workers': TILE_WORKERS}
+
+def readtext_via_service(image_path: Path) -> Optional[List]:
+    """OCR results from the worker service, or None if it is unavailable"""
+    global OCR_SERVICE
+    service = get_ocr_service()
+    if service is None:
+        return None
+    settings = ocr_settings()
+    try:
+        with trace.span('ocr', file=image_path.name, service=True):
+            response = service.readtext(image_path, settings)
+    except OSError as e:
+        print(f"⚠️  OCR service unavailable ({e}), continuing in-process")
+        OCR_SERVICE = False
+        return None
+    except RuntimeError as e:
+        print(f"⚠️  OCR service failed on {image_path.name} ({e}), retrying in-process")
+        return None
+    
+    # A service that predates per-request settings OCRs with its own
+    if response.get('settings') != settings:
+        print(f"⚠️  OCR service did not apply this run's settings "
+              f"(used {response.get('settings')}), continuing in-process")
+        OCR_SERVICE = False
+        return None
+    merge_service_stats(response.get('stats', {}))
+    return response['results']
+
+def merge_service_stats(stats: Dict):
+    """Add the crop/refine statistics of one service request to this run's"""
+    crop, refine = stats.get('table_crop', {}), stats.get('refine', {})
+    with _stats_lock:
+        for key, value in crop.items():
+            CROP_STATS[key] += value
+        for key, value in refine.items():
+            REFINE_STATS[key] += value
+    if crop:
+        trace.count('pixels_cropped', crop['source_pixels'] - crop['cropped_pixels'])
+    if refine:
+        trace.count('reocr_boxes', refine['reread'])
+
 # Configuration
 SCREENSHOT_DIR = Path("extra suburb data")
+# Preprocessing threads for the streaming pipeline (0 = one image at a time)
+STREAM_WORKERS = int(os.environ.get('HOMESCORE_OCR_PREPROCESS_WORKERS', min(4, os.cpu_count() or 1)))
+STREAM_QUEUE_SIZE = 8
+# Batched recognition (readtext_batched): images per network batch (1 = off)
+# and DataLoader workers; images are grouped into size buckets first
+OCR_BATCH_SIZE = int(os.environ.get('HOMESCORE_OCR_BATCH_SIZE', 1))
+OCR_BATCH_WORKERS = int(os.environ.get('HOMESCORE_OCR_BATCH_WORKERS', 0))
+BATCH_CHUNK_IMAGES = 32
+# Crop screenshots to the detected table before OCR (1 = on). Off by
+# default: the row-rule detection has only been checked on synthetic
+# screenshots, and a section break or tall header would cut real rows
+TABLE_CROP = os.environ.get('HOMESCORE_OCR_TABLE_CROP', '0') == '1'
+CROP_STATS = {'images': 0, 'tables_found': 0, 'source_pixels': 0, 'cropped_pixels': 0}
+_stats_lock = threading.Lock()
+# Near-duplicate screenshots (perceptual hash within this many bits of
+# another) are listed in the report; -1 turns detection off. They are only
+# skipped with HOMESCORE_OCR_DEDUPE_SKIP=1: a changed digit in one cell is
+# below what the hash can see
+DEDUPE_DISTANCE = int(os.environ.get('HOMESCORE_OCR_DEDUPE_DISTANCE', 10))
+DEDUPE_SKIP = os.environ.get('HOMESCORE_OCR_DEDUPE_SKIP', '0') == '1'
+HASH_INDEX = Path("data") / "screenshot-hashes.json"
+# Second pass: boxes below this confidence are re-read on their own at a
+# higher scale (0 = off; see pipeline/ocr_refine.py)
+REFINE_CONFIDENCE = float(os.environ.get('HOMESCORE_OCR_REFINE_CONFIDENCE', 0))
+REFINE_STATS = {'images': 0, 'boxes': 0, 'reread': 0, 'improved': 0, 'reread_pixels': 0, 'image_pixels': 0}
+# Threads OCR'ing the bands of one tall screenshot (see pipeline/ocr_tiles.py)
+TILE_WORKERS = int(os.environ.get('HOMESCORE_OCR_TILE_WORKERS', min(4, os.cpu_count() or 1)))
 OUTPUT_DIR = Path("data")
 OUTPUT_JSON = OUTPUT_DIR / "extracted-suburb-data.json"
 OUTPUT_CSV = OUTPUT_DIR / "extracted-suburb-data.csv"
 REPORT_FILE = OUTPUT_DIR / "ocr-extraction-report.json"
+# Full OCR text and boxes (the report only references them)
+OCR_TEXT_DB = OUTPUT_DIR / "ocr-text.sqlite"
+OCR_TEXT_STORE = None
 
 # Suburb names for matching (load from suburbs.csv)
 SUBURB_NAMES = []
@@ -61,6 +169,7 @@ SUBURB_NAMES = []
 def load_suburb_names():
     """Load suburb names from suburbs.csv for validation"""
     global SUBURB_NAMES
+    require_packages('pd')
     suburbs_file = Path("data/suburbs.csv")
     if suburbs_file.exists():
         try:
@@ -71,50 +180,101 @@ def load_suburb_names():
             print(f"⚠️  Could not load suburbs.csv: {e}")
             SUBURB_NAMES = []
 
-def preprocess_image(image_path: Path) -> np.ndarray:
+def decode_image(image_path: Path) -> 'np.ndarray':
+    """Read and decode an image file (BGR)"""
+    require_packages('cv2')
+    img = cv2.imread(str(image_path))
+    if img is None:
+        raise ValueError(f"Could not load image: {image_path}")
+    return img
+
+def preprocess_image(image_path: Path) -> 'np.ndarray':
+    """Load an image and preprocess it for OCR (None if that fails)"""
+    try:
+        return preprocess_array(decode_image(image_path))
+    except Exception as e:
+        print(f"⚠️  Error preprocessing {image_path.name}: {e}")
+        return None
+
+def preprocess_array(img: 'np.ndarray') -> 'np.ndarray':
     """
-    Preprocess image for better OCR accuracy
+    Preprocess a decoded image for better OCR accuracy
     
     Steps:
-    1. Load image
-    2. Convert to grayscale
-    3. Enhance contrast
-    4. Reduce noise
-    5. Sharpen text
+    1. Convert to grayscale
+    2. Enhance contrast
+    3. Reduce noise
+    4. Sharpen text
     """
+    require_packages('cv2', 'np')
+    # Convert to grayscale
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    
+    # Keep only the table (browser chrome, headers and ads are OCR noise)
+    if TABLE_CROP:
+        from pipeline.table_region import crop_to_table
+        with trace.span('table_region'):
+            gray, region = crop_to_table(gray)
+        record_crop(img.shape[0] * img.shape[1], gray.size, region is not None)
+    
+    # Enhance contrast using CLAHE (Contrast Limited Adaptive Histogram Equalization)
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    enhanced = clahe.apply(gray)
+    
+    # Reduce noise
+    denoised = cv2.fastNlMeansDenoising(enhanced, h=10)
+    
+    # Sharpen
+    kernel = np.array([[-1, -1, -1],
+                      [-1,  9, -1],
+                      [-1, -1, -1]])
+    sharpened = cv2.filter2D(denoised, -1, kernel)
+    
+    # Resize if too small (improves OCR accuracy)
+    height, width = sharpened.shape
+    if height < 1000:
+        scale = 1000 / height
+        new_width = int(width * scale)
+        sharpened = cv2.resize(sharpened, (new_width, 1000), interpolation=cv2.INTER_CUBIC)
+    
+    return sharpened
+
+def record_crop(source_pixels: int, cropped_pixels: int, found: bool):
+    """Add one image to CROP_STATS (preprocessing runs on several threads)"""
+    with _stats_lock:
+        CROP_STATS['images'] += 1
+        CROP_STATS['tables_found'] += found
+        CROP_STATS['source_pixels'] += source_pixels
+        CROP_STATS['cropped_pixels'] += cropped_pixels
+    trace.count('pixels_cropped', source_pixels - cropped_pixels)
+
+def crop_summary() -> Dict:
+    """Table-crop totals for the report"""
+    stats = dict(CROP_STATS)
+    stats['pixel_reduction'] = (1 - stats['cropped_pixels'] / stats['source_pixels']
+                                if stats['source_pixels'] else 0.0)
+    return stats
+
+def ocr_screenshot(image_path: Path) -> List:
+    """readtext results for one screenshot ([] if it could not be OCR'd)"""
     try:
-        # Load image
-        img = cv2.imread(str(image_path))
-        if img is None:
-            raise ValueError(f"Could not load image: {image_path}")
+        # Use the warm worker service if one is running
+        results = readtext_via_service(image_path)
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        
-        # Enhance contrast using CLAHE (Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(gray)
-        
-        # Reduce noise
-        denoised = cv2.fastNlMeansDenoising(enhanced, h=10)
-        
-        # Sharpen
-        kernel = np.array([[-1, -1, -1],
-                          [-1,  9, -1],
-                          [-1, -1, -1]])
-        sharpened = cv2.filter2D(denoised, -1, kernel)
-        
-        # Resize if too small (improves OCR accuracy)
-        height, width = sharpened.shape
-        if height < 1000:
-            scale = 1000 / height
-            new_width = int(width * scale)
-            sharpened = cv2.resize(sharpened, (new_width, 1000), interpolation=cv2.INTER_CUBIC)
-        
-        return sharpened
+        if results is None:
+            # Preprocess image
+            with trace.span('preprocess', file=image_path.name):
+                processed_img = preprocess_image(image_path)
+            if processed_img is None:
+                return []
+            
+            # Run OCR
+            with trace.span('ocr', file=image_path.name):
+                results = ocr_image(processed_img)
+        return results
     except Exception as e:
-        print(f"⚠️  Error preprocessing {image_path.name}: {e}")
-        return None
+        print(f"⚠️  Error extracting text from {image_path.name}: {e}")
+        return []
 
 def extract_text_with_easyocr(image_path: Path) -> Tuple[str, float]:
     """
@@ -123,32 +283,47 @@ def extract_text_with_easyocr(image_path: Path) -> Tuple[str, float]:
     Returns:
         (extracted_text, confidence_score)
     """
-    try:
-        # Preprocess image
-        processed_img = preprocess_image(image_path)
-        if processed_img is None:
-            return "", 0.0
-        
-        # Run OCR
-        reader = get_ocr_reader()
-        results = reader.readtext(processed_img)
-        
-        # Extract text and calculate average confidence
-        text_parts = []
-        confidences = []
-        
-        for (bbox, text, confidence) in results:
-            if text.strip():
-                text_parts.append(text)
-                confidences.append(confidence)
-        
-        extracted_text = ' '.join(text_parts)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        
-        return extracted_text, avg_confidence
-    except Exception as e:
-        print(f"⚠️  Error extracting text from {image_path.name}: {e}")
-        return "", 0.0
+    return text_from_ocr_results(ocr_screenshot(image_path))
+
+def ocr_image(processed_img: 'np.ndarray') -> List:
+    """readtext on a preprocessed image; tall screenshots are OCR'd in parallel bands"""
+    from pipeline.ocr_tiles import readtext_tiled
+    results = readtext_tiled(processed_img, get_ocr_reader().readtext, workers=TILE_WORKERS)
+    return refine_low_confidence(processed_img, results)
+
+def refine_low_confidence(processed_img: 'np.ndarray', results: List) -> List:
+    """Re-read boxes below REFINE_CONFIDENCE, keeping the better reading"""
+    if REFINE_CONFIDENCE <= 0 or not results:
+        return results
+    from pipeline.ocr_refine import easyocr_recognizer, refine_results
+    
+    with trace.span('refine'):
+        results, stats = refine_results(processed_img, results, easyocr_recognizer(get_ocr_reader()),
+                                        REFINE_CONFIDENCE)
+    with _stats_lock:
+        REFINE_STATS['images'] += 1
+        for key, value in stats.items():
+            REFINE_STATS[key] += value
+    trace.count('reocr_boxes', stats['reread'])
+    return results
+
+def text_from_ocr_results(results: List) -> Tuple[str, float]:
+    """Join readtext results into (extracted_text, average_confidence)"""
+    trace.count('ocr_boxes', len(results))
+    
+    # Extract text and calculate average confidence
+    text_parts = []
+    confidences = []
+    
+    for (bbox, text, confidence) in results:
+        if text.strip():
+            text_parts.append(text)
+            confidences.append(confidence)
+    
+    extracted_text = ' '.join(text_parts)
+    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    
+    return extracted_text, avg_confidence
 
 def extract_suburb_name(text: str) -> Optional[str]:
     """
@@ -156,6 +331,7 @@ def extract_suburb_name(text: str) -> Optional[str]:
     
     Uses fuzzy matching against known suburb names
     """
+    require_packages('pd')
     text_lower = text.lower()
     
     # Look for common patterns
@@ -318,8 +494,16 @@ def process_screenshot(image_path: Path) -> Dict:
     print(f"📸 Processing: {image_path.name}")
     
     # Extract text
-    extracted_text, confidence = extract_text_with_easyocr(image_path)
-    
+    ocr_results = ocr_screenshot(image_path)
+    extracted_text, confidence = text_from_ocr_results(ocr_results)
+    return build_result(image_path, extracted_text, confidence, ocr_results)
+
+def build_result(image_path: Path, extracted_text: str, confidence: float,
+                 boxes: Optional[List] = None) -> Dict:
+    """
+    Parse OCR text into the extraction result dictionary. The full text and
+    boxes go to the OCR text store; the result references them.
+    """
     if not extracted_text:
         return {
             'source_file': image_path.name,
@@ -328,20 +512,26 @@ def process_screenshot(image_path: Path) -> Dict:
             'confidence': 0.0
         }
     
-    # Extract suburb name
-    suburb_name = extract_suburb_name(extracted_text)
-    
-    # Extract metrics
-    metrics = extract_metrics(extracted_text)
+    with trace.span('parse', file=image_path.name):
+        # Extract suburb name
+        suburb_name = extract_suburb_name(extracted_text)
+        
+        # Extract metrics
+        metrics = extract_metrics(extracted_text)
+        
+        # Separate existing vs new metrics
+        existing_metrics, new_metrics = map_to_existing_fields(metrics)
     
-    # Separate existing vs new metrics
-    existing_metrics, new_metrics = map_to_existing_fields(metrics)
+    if OCR_TEXT_STORE is not None:
+        text_field = {'ocr_ref': OCR_TEXT_STORE.put(image_path, extracted_text, boxes, confidence)}
+    else:
+        text_field = {'extracted_text': extracted_text}
     
     return {
         'source_file': image_path.name,
         'status': 'success' if suburb_name else 'partial',
         'suburb_name': suburb_name,
-        'extracted_text': extracted_text[:500] + '...' if len(extracted_text) > 500 else extracted_text,  # Truncate for storage
+        **text_field,
         'full_text_length': len(extracted_text),
         'parsed_metrics': existing_metrics,
         'new_metrics': new_metrics,
@@ -350,9 +540,146 @@ def process_screenshot(image_path: Path) -> Dict:
         'extraction_date': datetime.now().isoformat()
     }
 
-def generate_report(results: List[Dict]) -> Dict:
-    """Generate extraction report with statistics"""
+def print_result(result: Dict):
+    if result['status'] == 'success':
+        print(f"✅ {result['suburb_name']} (confidence: {result['confidence']:.2f})")
+    elif result['status'] == 'partial':
+        print(f"⚠️  Partial (confidence: {result['confidence']:.2f})")
+    else:
+        print(f"❌ Failed: {result.get('error', 'Unknown error')}")
+
+def process_sequential(screenshot_files: List[Path]) -> List[Dict]:
+    """Read, preprocess and OCR one screenshot at a time"""
+    results = []
+    for i, image_path in enumerate(screenshot_files, 1):
+        print(f"[{i}/{len(screenshot_files)}] ", end="")
+        result = process_screenshot(image_path)
+        results.append(result)
+        print_result(result)
+    return results
+
+def process_streaming(screenshot_files: List[Path]) -> List[Dict]:
+    """
+    Overlap file reads, preprocessing (thread pool) and OCR with bounded
+    queues; results are returned in input order
+    """
+    from pipeline.ocr_stream import OCRStream
+    
+    get_ocr_reader()
+    stream = OCRStream(screenshot_files, decode=decode_image, preprocess=preprocess_array,
+                       ocr=ocr_image, workers=STREAM_WORKERS, queue_size=STREAM_QUEUE_SIZE)
+    results = [None] * len(screenshot_files)
+    for done, item in enumerate(stream, 1):
+        print(f"[{done}/{len(screenshot_files)}] 📸 {item.path.name}: ", end="")
+        if item.error:
+            print(f"⚠️  {item.error}")
+            extracted_text, confidence = "", 0.0
+        else:
+            extracted_text, confidence = text_from_ocr_results(item.results)
+        results[item.index] = build_result(item.path, extracted_text, confidence, item.results)
+        print_result(results[item.index])
+    stream.print_stats()
+    return results
+
+def process_batched(screenshot_files: List[Path]) -> List[Dict]:
+    """
+    Preprocess a chunk of screenshots in parallel, then recognise them in
+    size-bucketed batches with readtext_batched
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from pipeline.ocr_batch import readtext_batched
+    from pipeline.ocr_tiles import tile_bands
+    
+    reader = get_ocr_reader()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, STREAM_WORKERS)) as pool:
+        for start in range(0, len(screenshot_files), BATCH_CHUNK_IMAGES):
+            chunk = screenshot_files[start:start + BATCH_CHUNK_IMAGES]
+            with trace.span('preprocess', images=len(chunk)):
+                processed = dict(zip(chunk, pool.map(preprocess_image, chunk)))
+            ready = {path: img for path, img in processed.items() if img is not None}
+            # Tall screenshots are tiled instead of padding a whole bucket to their size
+            tall = [path for path, img in ready.items() if len(tile_bands(img.shape[0])) > 1]
+            with trace.span('ocr', images=len(ready), batch_size=OCR_BATCH_SIZE):
+                ocr_results = {path: ocr_image(ready.pop(path)) for path in tall}
+                batched = readtext_batched(reader, ready, batch_size=OCR_BATCH_SIZE, workers=OCR_BATCH_WORKERS)
+                ocr_results.update({path: refine_low_confidence(ready[path], found)
+                                    for path, found in batched.items()})
+            
+            for i, image_path in enumerate(chunk, start + 1):
+                print(f"[{i}/{len(screenshot_files)}] 📸 {image_path.name}: ", end="")
+                found = ocr_results.get(image_path, [])
+                extracted_text, confidence = text_from_ocr_results(found)
+                result = build_result(image_path, extracted_text, confidence, found)
+                results.append(result)
+                print_result(result)
+    return results
+
+def dedupe_screenshots(screenshot_files: List[Path],
+                       folder_files: Optional[List[Path]] = None) -> Tuple[List[Path], Dict[str, str]]:
+    """
+    Find re-captures of an already seen table using the persisted
+    perceptual-hash index; returns (files to OCR, {duplicate: representative}).
+    Duplicates are left out of the files to OCR only when DEDUPE_SKIP is set.
+    folder_files (default: screenshot_files) is everything still in the folder.
+    """
+    from pipeline.phash import HashIndex
+    
+    index = HashIndex(HASH_INDEX, DEDUPE_DISTANCE)
+    index.prune({path.name for path in (folder_files or screenshot_files)})
+    duplicates = {}
+    # Newest files first, so a cluster is represented by its latest capture
+    with trace.span('dedupe', files=len(screenshot_files)):
+        for path in sorted(screenshot_files, key=lambda p: p.stat().st_mtime_ns, reverse=True):
+            try:
+                representative = index.assign(path)
+            except Exception as e:
+                print(f"⚠️  Could not hash {path.name}: {e}")
+                continue
+            if representative != path.name:
+                duplicates[path.name] = representative
+    index.save()
+    if not DEDUPE_SKIP:
+        return screenshot_files, duplicates
+    return [path for path in screenshot_files if path.name not in duplicates], duplicates
+
+def group_by_suburb(results: List[Dict]) -> Dict[str, List[Dict]]:
+    """{suburb: [entries]}, the layout of extracted-suburb-data.json"""
+    output_data = {}
+    for result in results:
+        if result.get('suburb_name'):
+            output_data.setdefault(result['suburb_name'], []).append({
+                'source_file': result['source_file'],
+                'ocr_ref': result.get('ocr_ref'),
+                'parsed_metrics': result['parsed_metrics'],
+                'new_metrics': result['new_metrics'],
+                'confidence': result['confidence']
+            })
+    return output_data
+
+def results_table(results: List[Dict]) -> 'pd.DataFrame':
+    """One row per screenshot with a suburb name, the layout of extracted-suburb-data.csv"""
+    csv_rows = []
+    for result in results:
+        if result.get('suburb_name'):
+            row = {
+                'source_file': result['source_file'],
+                'suburb_name': result['suburb_name'],
+                'confidence': result['confidence'],
+                **result['parsed_metrics'],
+                **{f'new_{k}': v for k, v in result['new_metrics'].items()}
+            }
+            csv_rows.append(row)
+    return pd.DataFrame(csv_rows)
+
+def generate_report(results: List[Dict], duplicates: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    Generate extraction report with statistics. duplicates that were OCR'd
+    anyway are listed as near_duplicates, the others as skipped_duplicates.
+    """
     total = len(results)
+    ocr_names = {r['source_file'] for r in results}
+    duplicates = duplicates or {}
     successful = sum(1 for r in results if r['status'] == 'success')
     partial = sum(1 for r in results if r['status'] == 'partial')
     failed = sum(1 for r in results if r['status'] == 'failed')
@@ -377,15 +704,23 @@ def generate_report(results: List[Dict]) -> Dict:
         'average_confidence': avg_confidence,
         'suburbs_found': list(set(suburbs_found)),
         'new_metrics_identified': list(all_new_metrics),
+        'table_crop': crop_summary() if TABLE_CROP else None,
+        'skipped_duplicates': {n: rep for n, rep in duplicates.items() if n not in ocr_names},
+        'near_duplicates': {n: rep for n, rep in duplicates.items() if n in ocr_names},
+        'refine': dict(REFINE_STATS) if REFINE_CONFIDENCE > 0 else None,
         'results': results
     }
 
 def main():
     """Main extraction function"""
+    global OCR_TEXT_STORE
     print("🔍 OCR Extraction from Suburb Data Screenshots\n")
+    # OCR packages load on first use; with a running OCR service they are never needed here
+    require_packages('pd')
     
     # Load suburb names for validation
-    load_suburb_names()
+    with trace.span('load'):
+        load_suburb_names()
     
     # Check screenshot directory
     if not SCREENSHOT_DIR.exists():
@@ -400,69 +735,61 @@ def main():
     
     print(f"📁 Found {len(screenshot_files)} screenshot files\n")
     
+    # Skip re-captures of tables already in the folder
+    duplicates = {}
+    if DEDUPE_DISTANCE >= 0:
+        screenshot_files, duplicates = dedupe_screenshots(sorted(screenshot_files))
+        if duplicates and DEDUPE_SKIP:
+            print(f"🔁 Skipping {len(duplicates)} near-duplicate screenshot(s); "
+                  f"OCR'ing {len(screenshot_files)}\n")
+        elif duplicates:
+            print(f"🔁 {len(duplicates)} near-duplicate screenshot(s) found; OCR'ing all "
+                  f"(listed in the report, HOMESCORE_OCR_DEDUPE_SKIP=1 skips them)\n")
+    
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(exist_ok=True)
-    
-    # Process each screenshot
-    results = []
-    for i, image_path in enumerate(screenshot_files, 1):
-        print(f"[{i}/{len(screenshot_files)}] ", end="")
-        result = process_screenshot(image_path)
-        results.append(result)
-        
-        if result['status'] == 'success':
-            print(f"✅ {result['suburb_name']} (confidence: {result['confidence']:.2f})")
-        elif result['status'] == 'partial':
-            print(f"⚠️  Partial (confidence: {result['confidence']:.2f})")
-        else:
-            print(f"❌ Failed: {result.get('error', 'Unknown error')}")
+    from pipeline.ocr_store import OCRStore
+    OCR_TEXT_STORE = OCRStore(OCR_TEXT_DB)
+    
+    # Process each screenshot. The OCR service preprocesses on its side;
+    # in-process, file reads and preprocessing overlap with OCR, or images
+    # are recognised in batches when HOMESCORE_OCR_BATCH_SIZE > 1.
+    if get_ocr_service() is not None:
+        results = process_sequential(screenshot_files)
+    elif OCR_BATCH_SIZE > 1:
+        results = process_batched(screenshot_files)
+    elif STREAM_WORKERS == 0:
+        results = process_sequential(screenshot_files)
+    else:
+        results = process_streaming(screenshot_files)
     
     print("\n" + "="*60)
     print("📊 Generating reports...\n")
     
     # Generate report
-    report = generate_report(results)
-    
-    # Save JSON output
-    output_data = {}
-    for result in results:
-        if result.get('suburb_name'):
-            suburb = result['suburb_name']
-            if suburb not in output_data:
-                output_data[suburb] = []
-            output_data[suburb].append({
-                'source_file': result['source_file'],
-                'parsed_metrics': result['parsed_metrics'],
-                'new_metrics': result['new_metrics'],
-                'confidence': result['confidence']
-            })
-    
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(output_data, f, indent=2)
-    print(f"✅ Saved extracted data: {OUTPUT_JSON}")
+    report = generate_report(results, duplicates)
+    trace.count('rows_touched', len(results))
+    with trace.span('write'):
+        OCR_TEXT_STORE.close()
+        print(f"✅ Saved full OCR text and boxes: {OCR_TEXT_DB}")
+        
+        # Save JSON output
+        output_data = group_by_suburb(results)
     
-    # Save CSV output
-    csv_rows = []
-    for result in results:
-        if result.get('suburb_name'):
-            row = {
-                'source_file': result['source_file'],
-                'suburb_name': result['suburb_name'],
-                'confidence': result['confidence'],
-                **result['parsed_metrics'],
-                **{f'new_{k}': v for k, v in result['new_metrics'].items()}
-            }
-            csv_rows.append(row)
+        with open(OUTPUT_JSON, 'w') as f:
+            json.dump(output_data, f, indent=2)
+        print(f"✅ Saved extracted data: {OUTPUT_JSON}")
     
-    if csv_rows:
-        df = pd.DataFrame(csv_rows)
-        df.to_csv(OUTPUT_CSV, index=False)
-        print(f"✅ Saved CSV output: {OUTPUT_CSV}")
+        # Save CSV output
+        df = results_table(results)
+        if not df.empty:
+            df.to_csv(OUTPUT_CSV, index=False)
+            print(f"✅ Saved CSV output: {OUTPUT_CSV}")
     
-    # Save report
-    with open(REPORT_FILE, 'w') as f:
-        json.dump(report, f, indent=2)
-    print(f"✅ Saved extraction report: {REPORT_FILE}")
+        # Save report
+        with open(REPORT_FILE, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved extraction report: {REPORT_FILE}")
     
     # Print summary
     print("\n" + "="*60)
@@ -472,14 +799,28 @@ def main():
     print(f"Successful: {report['successful_extractions']} ({report['success_rate']*100:.1f}%)")
     print(f"Partial: {report['partial_extractions']}")
     print(f"Failed: {report['failed_extractions']}")
+    if report['skipped_duplicates']:
+        print(f"Near-duplicates skipped: {len(report['skipped_duplicates'])}")
+    if report['near_duplicates']:
+        print(f"Near-duplicates OCR'd anyway: {len(report['near_duplicates'])}")
     print(f"Average confidence: {report['average_confidence']:.2f}")
     print(f"Suburbs found: {len(report['suburbs_found'])}")
     print(f"New metrics identified: {len(report['new_metrics_identified'])}")
     if report['new_metrics_identified']:
         print(f"  - {', '.join(report['new_metrics_identified'])}")
+    crop = report['table_crop']
+    if crop and crop['images']:
+        # Images preprocessed by the OCR service are not counted here
+        print(f"Table crop: found in {crop['tables_found']}/{crop['images']} images, "
+              f"{crop['pixel_reduction']*100:.1f}% of screenshot pixels cropped away")
+    refine = report['refine']
+    if refine and refine['images']:
+        print(f"Second pass: re-read {refine['reread']}/{refine['boxes']} boxes below "
+              f"{REFINE_CONFIDENCE:.2f} confidence, {refine['improved']} improved "
+              f"({refine['reread_pixels'] / refine['image_pixels'] * 100:.1f}% of image pixels)")
     print("\n✅ Extraction complete!")
 
 if __name__ == "__main__":
-    main()
+    trace.run(main)
 
 
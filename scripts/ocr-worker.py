@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Persistent OCR Worker Service
+
+Keeps EasyOCR readers loaded in one or more worker processes behind a Unix
+socket, so ocr-extract-suburb-data.py (and other tools) skip the several
+seconds of model loading on every run. Clients fall back to an in-process
+reader when the service is not running.
+
+The socket defaults to $TMPDIR/homescore-ocr-<uid>/ocr.sock, in a directory
+only its owner can enter; set HOMESCORE_OCR_SOCKET to use another path
+(clients read the same variable). The socket itself is always created
+owner-only (0600).
+
+Usage:
+    python3 scripts/ocr-worker.py                 # serve in the foreground
+    python3 scripts/ocr-worker.py --workers 2
+    python3 scripts/ocr-worker.py --status
+    python3 scripts/ocr-worker.py --stop
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from pipeline.ocr_service import OCRClient, serve, socket_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve warm EasyOCR readers on a Unix socket")
+    parser.add_argument('--socket', type=Path, default=None, help=f"socket path (default: {socket_path()})")
+    parser.add_argument('--workers', type=int, default=1, help="reader processes (each holds its own models)")
+    parser.add_argument('--status', action='store_true', help="report whether a service is running")
+    parser.add_argument('--stop', action='store_true', help="stop a running service")
+    args = parser.parse_args()
+
+    client = OCRClient(args.socket)
+    if args.status or args.stop:
+        status = client.ping()
+        if status is None:
+            print(f"ℹ️  No OCR service on {client.path}")
+            sys.exit(1)
+        if args.stop:
+            client.shutdown()
+            print(f"✅ Stopped OCR service on {client.path}")
+        else:
+            print(f"✅ OCR service on {client.path}: {status['workers']} worker(s), {status['served']} images served")
+        return
+
+    print("🔄 Starting OCR service (loading EasyOCR models)...")
+    try:
+        serve(args.socket, workers=args.workers)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+    print("\n✅ OCR service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""
+Shared helpers for the suburb data pipeline scripts.
+
+The hyphenated scripts in scripts/ remain the entry points; this package
+holds the reusable engines they import (scripts/ is on sys.path when a
+script is run as `python3 scripts/<name>.py`).
+"""
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DATA_DIR = BASE_DIR / 'data'
+SUBURBS_CSV = DATA_DIR / 'suburbs.csv'
+CONFIG_JSON = DATA_DIR / 'config.json'
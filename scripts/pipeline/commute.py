@@ -0,0 +1,167 @@
+"""
+Geospatial Commute Estimator
+
+Computes commute minutes from every suburb to any number of target
+locations in one vectorized batch, using the latitude/longitude columns of
+suburbs.csv and the `locations` block of data/config.json.
+
+Model: great-circle (haversine) distance, scaled by a road-network detour
+factor, divided by an average door-to-door speed that depends on the
+suburb's `category` band (ramping up towards freeway speed on longer
+trips), plus a fixed start/finish overhead.
+"""
+
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Average door-to-door driving speeds (km/h) per suburb category band.
+# Inner suburbs crawl through congestion; growth-corridor and hills suburbs
+# spend most of the trip on freeways and arterials.
+DEFAULT_CATEGORY_SPEEDS_KMH = {
+    'INNER METRO': 28.0,
+    'BAYSIDE': 36.0,
+    'HILLS & RANGES': 42.0,
+    'OUTER GROWTH': 48.0,
+}
+DEFAULT_SPEED_KMH = 40.0
+
+# Longer trips spend proportionally more time on freeways, so the average
+# speed ramps from the band speed towards FREEWAY_SPEED_KMH with distance.
+FREEWAY_SPEED_KMH = 70.0
+FREEWAY_RAMP_KM = 15.0
+
+# Road distance is typically ~1.3x the straight-line distance in Melbourne
+ROAD_DETOUR_FACTOR = 1.3
+
+# Minutes spent getting out of the driveway and parking at the destination
+TRIP_OVERHEAD_MINUTES = 4.0
+
+# A speed model maps (distance_km[n, m], categories[n]) -> speed_kmh[n, m]
+SpeedModel = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+class CategorySpeedModel:
+    """
+    Speed model with one average local speed per suburb category band.
+
+    The band speed applies to short trips; longer trips approach
+    `freeway_kmh` with an exponential ramp of `ramp_km`. Unknown categories
+    fall back to `default_kmh`. Pass a different mapping (or any callable
+    with the same signature) to estimate_commute_minutes to try another
+    model.
+    """
+
+    def __init__(self, speeds_kmh: Optional[Mapping[str, float]] = None,
+                 default_kmh: float = DEFAULT_SPEED_KMH,
+                 freeway_kmh: float = FREEWAY_SPEED_KMH,
+                 ramp_km: float = FREEWAY_RAMP_KM):
+        self.speeds_kmh = dict(DEFAULT_CATEGORY_SPEEDS_KMH if speeds_kmh is None else speeds_kmh)
+        self.default_kmh = default_kmh
+        self.freeway_kmh = freeway_kmh
+        self.ramp_km = ramp_km
+
+    def __call__(self, distance_km: np.ndarray, categories: np.ndarray) -> np.ndarray:
+        # Map each distinct category once instead of once per suburb
+        codes, uniques = pd.factorize(pd.Series(categories, dtype='object').str.upper().str.strip())
+        lookup = np.array([self.speeds_kmh.get(c, self.default_kmh) for c in uniques] + [self.default_kmh])
+        band = lookup[codes][:, None]  # code -1 (missing category) picks the trailing default
+        if self.ramp_km <= 0:
+            return np.broadcast_to(band, distance_km.shape)
+        highway_share = 1.0 - np.exp(-distance_km / self.ramp_km)
+        return band + (np.maximum(self.freeway_kmh, band) - band) * highway_share
+
+
+def haversine_km(lat: np.ndarray, lng: np.ndarray,
+                 target_lat: np.ndarray, target_lng: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances between n points and m targets.
+
+    Returns an (n, m) array of kilometres.
+    """
+    lat1 = np.radians(np.asarray(lat, dtype=np.float64))[:, None]
+    lng1 = np.radians(np.asarray(lng, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(target_lat, dtype=np.float64))[None, :]
+    lng2 = np.radians(np.asarray(target_lng, dtype=np.float64))[None, :]
+
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def load_target_locations(config: Dict) -> Dict[str, Tuple[float, float]]:
+    """
+    Extract named target locations from data/config.json.
+
+    Returns {'primary': (lat, lng), 'secondary': (lat, lng), ...} for every
+    entry of config['locations'] that has coordinates.
+    """
+    targets = {}
+    for key, location in (config.get('locations') or {}).items():
+        if location and location.get('lat') is not None and location.get('lng') is not None:
+            targets[key] = (float(location['lat']), float(location['lng']))
+    return targets
+
+
+def estimate_commute_minutes(df: pd.DataFrame, targets: Mapping[str, Tuple[float, float]],
+                             speed_model: Optional[SpeedModel] = None,
+                             detour_factor: float = ROAD_DETOUR_FACTOR,
+                             overhead_minutes: float = TRIP_OVERHEAD_MINUTES) -> pd.DataFrame:
+    """
+    Estimate commute minutes from every suburb to every target in one batch.
+
+    Args:
+        df: suburbs with `latitude`, `longitude` and `category` columns
+        targets: {name: (lat, lng)}
+        speed_model: callable returning km/h per suburb/target pair
+            (defaults to CategorySpeedModel)
+
+    Returns:
+        DataFrame indexed like df with one `<name>CommuteMinutes` column per
+        target. Suburbs without coordinates get NA.
+    """
+    if speed_model is None:
+        speed_model = CategorySpeedModel()
+
+    names = list(targets)
+    columns = [f'{name}CommuteMinutes' for name in names]
+    if not names or df.empty:
+        return pd.DataFrame(index=df.index, columns=columns, dtype='Int64')
+
+    target_coords = np.array([targets[name] for name in names], dtype=np.float64)
+    lat = pd.to_numeric(df['latitude'], errors='coerce').to_numpy(dtype=np.float64)
+    lng = pd.to_numeric(df['longitude'], errors='coerce').to_numpy(dtype=np.float64)
+    categories = df['category'].to_numpy() if 'category' in df.columns else np.full(len(df), None)
+
+    road_km = haversine_km(lat, lng, target_coords[:, 0], target_coords[:, 1]) * detour_factor
+    speeds = speed_model(road_km, categories)
+    minutes = overhead_minutes + road_km / speeds * 60.0
+
+    result = pd.DataFrame(np.rint(minutes), index=df.index, columns=columns)
+    return result.astype('Int64')  # NaN coordinates become <NA>
+
+
+def apply_commute_estimates(df: pd.DataFrame, targets: Mapping[str, Tuple[float, float]],
+                            overwrite: bool = False,
+                            speed_model: Optional[SpeedModel] = None) -> Dict[str, int]:
+    """
+    Write commute estimates into df in place.
+
+    Only empty cells are filled unless `overwrite` is set. Returns the
+    number of cells written per column.
+    """
+    estimates = estimate_commute_minutes(df, targets, speed_model=speed_model)
+    written = {}
+    for column in estimates.columns:
+        if column not in df.columns:
+            df[column] = pd.NA
+        mask = estimates[column].notna()
+        if not overwrite:
+            mask &= df[column].isna()
+        df.loc[mask, column] = estimates.loc[mask, column].astype(float)
+        written[column] = int(mask.sum())
+    return written
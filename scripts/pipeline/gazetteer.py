@@ -0,0 +1,85 @@
+"""
+Known suburb and LGA names, for splitting OCR'd table rows.
+
+A table row reads "Suburb Name LGA Name Victoria $price ...", and neither
+name has a fixed number of words. The gazetteer holds every suburb and LGA
+in data/suburbs.csv in two token tries, stored back to front, so the names
+that end just before a "Victoria" anchor are found by walking backwards
+from it: first the longest LGA, then the longest suburb before that LGA.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from pipeline import SUBURBS_CSV
+
+# Trie key holding the name that ends at a node
+_NAME = ''
+
+
+def _build_trie(names: Iterable[str]) -> Dict:
+    """Token trie of names, keyed by casefolded words from last to first"""
+    trie: Dict = {}
+    for name in names:
+        node = trie
+        for token in reversed(name.casefold().split()):
+            node = node.setdefault(token, {})
+        node[_NAME] = name
+    return trie
+
+
+def _names_ending_at(trie: Dict, words: Sequence[str], end: int) -> List[Tuple[int, str]]:
+    """(start, name) of every name in trie that is words[start:end], longest first"""
+    found = []
+    node = trie
+    for j in range(end - 1, -1, -1):
+        node = node.get(words[j].casefold())
+        if node is None:
+            break
+        if _NAME in node:
+            found.append((j, node[_NAME]))
+    found.reverse()
+    return found
+
+
+class Gazetteer:
+    """Suburb and LGA names matched backwards from a word position"""
+
+    def __init__(self, suburbs: Iterable[str], lgas: Iterable[str]):
+        self.suburb_names = frozenset(suburbs)
+        self.lga_names = frozenset(lgas)
+        self.suburbs = _build_trie(self.suburb_names)
+        self.lgas = _build_trie(self.lga_names)
+
+    def segment(self, words: Sequence[str], anchor: int) -> Optional[Tuple[str, str]]:
+        """
+        (suburb, lga) of the row whose "Victoria" is words[anchor], spelled
+        as in suburbs.csv, or None if no known LGA and suburb precede it.
+
+        LGAs are tried longest first, so "Kilsyth Yarra Ranges" is Kilsyth
+        in Yarra Ranges rather than "Kilsyth Yarra" in Ranges.
+        """
+        for lga_start, lga in _names_ending_at(self.lgas, words, anchor):
+            suburbs = _names_ending_at(self.suburbs, words, lga_start)
+            if suburbs:
+                return suburbs[0][1], lga
+        return None
+
+    def lga_before(self, words: Sequence[str], anchor: int) -> Optional[Tuple[int, str]]:
+        """(start, lga) of the longest known LGA ending just before words[anchor]"""
+        lgas = _names_ending_at(self.lgas, words, anchor)
+        return lgas[0] if lgas else None
+
+    def known_rows(self, df: pd.DataFrame) -> pd.Series:
+        """Rows whose suburb_name and lga are both gazetteer names"""
+        return df['suburb_name'].isin(self.suburb_names) & df['lga'].isin(self.lga_names)
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path: Path = SUBURBS_CSV) -> Gazetteer:
+    """Gazetteer of the suburbs and LGAs in suburbs.csv (read once per process)"""
+    df = pd.read_csv(path, comment='#', usecols=['suburb', 'lga'])
+    return Gazetteer(df['suburb'].dropna(), df['lga'].dropna())
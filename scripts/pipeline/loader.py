@@ -0,0 +1,52 @@
+"""
+Import the hyphenated pipeline scripts as modules.
+
+Scripts such as `improved-ocr-extractor.py` cannot be imported with a
+plain import statement; load_script() loads them by file name so their
+functions can be reused by other tools (benchmarks, the CLI, daemons).
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Dict
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+_loaded: Dict[str, ModuleType] = {}
+_failed: Dict[str, str] = {}
+
+
+def load_script(name: str) -> ModuleType:
+    """
+    Load scripts/<name>.py as a module (cached).
+
+    Raises ImportError if the script or one of its dependencies is missing.
+    """
+    if name in _loaded:
+        return _loaded[name]
+    if name in _failed:
+        raise ImportError(_failed[name])
+
+    path = SCRIPTS_DIR / f'{name}.py'
+    if not path.exists():
+        raise ImportError(f"No pipeline script named {name!r} ({path})")
+
+    module_name = 'homescore_script_' + name.replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except SystemExit as e:
+        # Scripts exit on missing packages at import time
+        del sys.modules[module_name]
+        _failed[name] = f"{name} could not be imported (exited with {e.code})"
+        raise ImportError(_failed[name]) from None
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    _loaded[name] = module
+    return module
@@ -0,0 +1,62 @@
+"""
+Batched EasyOCR recognition.
+
+reader.readtext() runs detection and recognition one image at a time.
+readtext_batched() pushes several images through the networks together,
+but needs them to be the same size. Images are therefore grouped into
+size buckets (height and width rounded up to BUCKET_STEP px) and padded
+with white on the bottom/right to the bucket size - padding never moves
+text, so box coordinates stay valid for the original image.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+
+BUCKET_STEP = 64
+
+
+def bucket_key(shape: Tuple[int, ...], step: int = BUCKET_STEP) -> Tuple[int, int]:
+    """Bucket (height, width) an image of this shape is padded to"""
+    height, width = shape[:2]
+    return math.ceil(height / step) * step, math.ceil(width / step) * step
+
+
+def pad_to(image: np.ndarray, height: int, width: int, value: int = 255) -> np.ndarray:
+    """Pad an image bottom/right to height x width"""
+    pad_h, pad_w = height - image.shape[0], width - image.shape[1]
+    if pad_h == 0 and pad_w == 0:
+        return image
+    padding = [(0, pad_h), (0, pad_w)] + [(0, 0)] * (image.ndim - 2)
+    return np.pad(image, padding, mode='constant', constant_values=value)
+
+
+def group_by_size(images: Dict[Hashable, np.ndarray], step: int = BUCKET_STEP) -> Dict[Tuple[int, int], List]:
+    """{bucket (height, width): [image ids]}"""
+    buckets = defaultdict(list)
+    for image_id, image in images.items():
+        buckets[bucket_key(image.shape, step)].append(image_id)
+    return dict(buckets)
+
+
+def readtext_batched(reader, images: Dict[Hashable, np.ndarray], batch_size: int = 8, workers: int = 0,
+                     step: int = BUCKET_STEP) -> Dict[Hashable, List]:
+    """
+    OCR images with reader.readtext_batched, one call per size bucket.
+
+    Returns {image id: readtext-style results}. Buckets holding a single
+    image go through plain readtext (no padding needed).
+    """
+    results: Dict[Hashable, List] = {}
+    for (height, width), ids in group_by_size(images, step).items():
+        if len(ids) == 1:
+            results[ids[0]] = reader.readtext(images[ids[0]], batch_size=batch_size, workers=workers)
+            continue
+        batch = [pad_to(images[i], height, width) for i in ids]
+        batched = reader.readtext_batched(batch, n_height=height, n_width=width,
+                                          batch_size=batch_size, workers=workers)
+        for image_id, image_results in zip(ids, batched):
+            results[image_id] = image_results
+    return results
@@ -0,0 +1,106 @@
+"""
+Second OCR pass over low-confidence text boxes.
+
+A single misread price cell costs an LLM call or a manual fix later, and
+re-OCR'ing the whole screenshot to fix it is wasteful. Instead, boxes
+whose confidence is below a threshold are cut out of the preprocessed
+image, re-rendered with alternate profiles and passed to the recogniser
+alone (no detection step). The reading with the highest confidence wins;
+the box itself is kept.
+
+Profiles:
+    upscale   - crop scaled up UPSCALE x (cubic)
+    binarize  - upscaled crop, Otsu-thresholded to black on white
+
+Boxes whose first reading is a number, price, percentage or distance
+(NUMERIC_TEXT, which tolerates the usual O/l/S misreads) are re-read with
+NUMERIC_ALLOWLIST, which stops letters being read into prices and
+percentages ("$1,2O5,000"). Mixed boxes such as "Box Hill 3128" or a name
+merged with its price are re-read without an allowlist, so their letters
+(and the "Victoria" anchor) are never dropped.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pipeline.ocr_tiles import box_extent
+
+UPSCALE = 2.0
+PAD_PX = 4
+PROFILES = ['upscale', 'binarize']
+NUMERIC_ALLOWLIST = '0123456789$,.%km '
+# A whole box that is a number: "$1,205,000", "4.2%", "12 km", "$1,2O5,000"
+NUMERIC_TEXT = re.compile(r'\s*\$?\s*[\dOoIlSB][\dOoIlSB,.\s]*(%|\s*km)?\s*')
+
+
+def is_numeric_text(text: str) -> bool:
+    """Whether a box reads as a single number (with at least one real digit)"""
+    return bool(NUMERIC_TEXT.fullmatch(text)) and any(c.isdigit() for c in text)
+
+
+def render_profile(crop: np.ndarray, profile: str) -> np.ndarray:
+    """Crop re-rendered with one of PROFILES"""
+    import cv2
+    scaled = cv2.resize(crop, None, fx=UPSCALE, fy=UPSCALE, interpolation=cv2.INTER_CUBIC)
+    if profile == 'upscale':
+        return scaled
+    if profile == 'binarize':
+        _, binary = cv2.threshold(scaled, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return binary
+    raise ValueError(f"unknown profile {profile!r}")
+
+
+def crop_box(image: np.ndarray, bbox) -> Optional[np.ndarray]:
+    """Padded crop of a readtext box (None for boxes outside the image)"""
+    x0, y0, x1, y1 = box_extent(bbox)
+    height, width = image.shape[:2]
+    x0, y0 = max(0, int(x0) - PAD_PX), max(0, int(y0) - PAD_PX)
+    x1, y1 = min(width, int(np.ceil(x1)) + PAD_PX), min(height, int(np.ceil(y1)) + PAD_PX)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return image[y0:y1, x0:x1]
+
+
+def refine_results(image: np.ndarray, results: List, recognize: Callable, threshold: float,
+                   profiles: List[str] = PROFILES) -> Tuple[List, Dict[str, int]]:
+    """
+    Re-read boxes below threshold; returns (results, stats).
+
+    recognize(crop, allowlist) returns (text, confidence) for a crop
+    holding one line of text. stats counts boxes re-read and improved and
+    the pixels re-read, for comparison with the full image.
+    """
+    stats = {'boxes': len(results), 'reread': 0, 'improved': 0, 'reread_pixels': 0,
+             'image_pixels': int(image.shape[0] * image.shape[1])}
+    refined = []
+    for bbox, text, confidence in results:
+        crop = crop_box(image, bbox) if confidence < threshold else None
+        if crop is None:
+            refined.append((bbox, text, confidence))
+            continue
+
+        stats['reread'] += 1
+        stats['reread_pixels'] += int(crop.shape[0] * crop.shape[1])
+        allowlist = NUMERIC_ALLOWLIST if is_numeric_text(text) else None
+        best = (text, confidence)
+        for profile in profiles:
+            candidate = recognize(render_profile(crop, profile), allowlist)
+            if candidate and candidate[0].strip() and candidate[1] > best[1]:
+                best = candidate
+        if best[1] > confidence:
+            stats['improved'] += 1
+        refined.append((bbox, best[0], best[1]))
+    return refined, stats
+
+
+def easyocr_recognizer(reader) -> Callable:
+    """recognize() for refine_results backed by an easyocr.Reader (recognition only)"""
+    def recognize(crop: np.ndarray, allowlist: Optional[str]) -> Optional[Tuple[str, float]]:
+        readings = reader.recognize(crop, allowlist=allowlist, detail=1, paragraph=False)
+        if not readings:
+            return None
+        texts = [text for _, text, _ in readings]
+        return ' '.join(texts), float(np.mean([conf for _, _, conf in readings]))
+    return recognize
@@ -0,0 +1,311 @@
+"""
+Persistent OCR worker service.
+
+Building an EasyOCR reader loads its detection and recognition models,
+which takes several seconds - longer than OCR'ing a handful of
+screenshots. The service keeps one or more reader processes warm behind a
+Unix socket; ocr-extract-suburb-data.py sends it image paths and falls
+back to an in-process reader when no service is running.
+
+Protocol: each message is a 4-byte big-endian length followed by a JSON
+object. Requests:
+
+    {"op": "ping"}
+    {"op": "readtext", "path": "/abs/path.jpg", "settings": {...}}
+    {"op": "shutdown"}
+
+Responses carry {"ok": true, ...} or {"ok": false, "error": "..."}; a
+readtext response has "results": [[bbox, text, confidence], ...] in the
+same shape as easyocr.Reader.readtext, plus timing and the worker pid.
+
+Workers are started with the server's environment, so a readtext request
+carries the client's OCR settings (WORKER_SETTINGS: table crop, refine
+confidence, tile workers) and the worker applies them for that image. The
+response echoes the settings it used and the crop/refine statistics of the
+request, so the client's report covers work done in the service.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from pipeline.ocr_store import jsonable_boxes
+
+SOCKET_ENV = 'HOMESCORE_OCR_SOCKET'
+# In a per-user 0700 directory, so other local users cannot reach the socket
+DEFAULT_SOCKET = Path(tempfile.gettempdir()) / f"homescore-ocr-{getattr(os, 'getuid', lambda: 'user')()}" / 'ocr.sock'
+CONNECT_TIMEOUT_S = 0.5
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+_HEADER = struct.Struct('>I')
+
+# Request setting -> (ocr-extract-suburb-data.py global, type)
+WORKER_SETTINGS = {
+    'table_crop': ('TABLE_CROP', bool),
+    'refine_confidence': ('REFINE_CONFIDENCE', float),
+    'tile_workers': ('TILE_WORKERS', int),
+}
+
+
+def socket_path() -> Path:
+    return Path(os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET)
+
+
+def _private_directory(directory: Path):
+    """Create directory as 0700, or check that an existing one is ours and private"""
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"{directory} is not a private directory owned by this user")
+
+
+def send_message(sock: socket.socket, message: Dict):
+    payload = json.dumps(message).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n:
+        chunk = sock.recv(min(n, 1 << 20))
+        if not chunk:
+            raise ConnectionError("OCR service closed the connection")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict]:
+    """Read one message, or None if the peer closed cleanly between messages"""
+    header = sock.recv(_HEADER.size, socket.MSG_WAITALL)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        header += _recv_exact(sock, _HEADER.size - len(header))
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise ConnectionError(f"OCR message too large ({length} bytes)")
+    return json.loads(_recv_exact(sock, length))
+
+
+# ============ Worker processes ============
+
+_worker_ocr = None
+_worker_defaults: Dict = {}
+
+
+def _init_worker():
+    """Pool initializer: import the OCR script and build its reader once"""
+    global _worker_ocr, _worker_defaults
+    from pipeline.loader import load_script
+    _worker_ocr = load_script('ocr-extract-suburb-data')
+    _worker_ocr.get_ocr_reader()
+    _worker_defaults = {key: getattr(_worker_ocr, name) for key, (name, _) in WORKER_SETTINGS.items()}
+
+
+def _apply_settings(settings: Optional[Dict]) -> Dict:
+    """Set the request's OCR settings (the server's for any not given)"""
+    unknown = set(settings or {}) - set(WORKER_SETTINGS)
+    if unknown:
+        raise ValueError(f"unknown OCR settings: {', '.join(sorted(unknown))}")
+    applied = dict(_worker_defaults, **(settings or {}))
+    for key, value in applied.items():
+        name, kind = WORKER_SETTINGS[key]
+        applied[key] = kind(value)
+        setattr(_worker_ocr, name, applied[key])
+    return applied
+
+
+def _stats_delta(before: Dict, after: Dict) -> Dict:
+    return {key: after[key] - before[key] for key in after}
+
+
+def _worker_readtext(path: str, settings: Optional[Dict] = None) -> Dict:
+    applied = _apply_settings(settings)
+    crop_before = dict(_worker_ocr.CROP_STATS)
+    refine_before = dict(_worker_ocr.REFINE_STATS)
+
+    start = time.perf_counter()
+    processed = _worker_ocr.preprocess_image(Path(path))
+    if processed is None:
+        return {'ok': False, 'error': f'could not preprocess {path}'}
+    preprocess_s = time.perf_counter() - start
+    results = _worker_ocr.ocr_image(processed)
+    return {
+        'ok': True,
+        'results': jsonable_boxes(results),
+        'settings': applied,
+        'stats': {
+            'table_crop': _stats_delta(crop_before, _worker_ocr.CROP_STATS),
+            'refine': _stats_delta(refine_before, _worker_ocr.REFINE_STATS),
+        },
+        'preprocess_s': round(preprocess_s, 4),
+        'ocr_s': round(time.perf_counter() - start - preprocess_s, 4),
+        'worker': os.getpid(),
+    }
+
+
+def _warm(_) -> int:
+    return os.getpid()
+
+
+# ============ Server ============
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (ConnectionError, ValueError):
+                return
+            if request is None:
+                return
+
+            op = request.get('op')
+            if op == 'ping':
+                response = {'ok': True, 'workers': self.server.workers, 'served': self.server.served}
+            elif op == 'readtext':
+                try:
+                    response = self.server.pool.apply(_worker_readtext,
+                                                      (request['path'], request.get('settings')))
+                except Exception as e:
+                    response = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+                with self.server.served_lock:
+                    self.server.served += 1
+            elif op == 'shutdown':
+                send_message(self.request, {'ok': True})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            else:
+                response = {'ok': False, 'error': f'unknown op {op!r}'}
+            send_message(self.request, response)
+
+
+class OCRServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, pool, workers: int):
+        self.pool = pool
+        self.workers = workers
+        self.served = 0
+        self.served_lock = threading.Lock()
+        super().__init__(str(path), _Handler)
+
+    def server_bind(self):
+        # The socket is created owner-only; a chmod after bind would leave
+        # a window in which other users could connect
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+
+def serve(path: Optional[Path] = None, workers: int = 1):
+    """Start warm reader processes and serve requests until shutdown"""
+    import importlib.util
+    import multiprocessing
+
+    # A worker that cannot build its reader would be respawned by the pool forever
+    for package in ['easyocr', 'cv2']:
+        if importlib.util.find_spec(package) is None:
+            raise RuntimeError(f"{package} is not installed (pip install easyocr opencv-python)")
+
+    path = Path(path or socket_path())
+    if path.parent == DEFAULT_SOCKET.parent:
+        _private_directory(path.parent)
+    if path.exists():
+        if OCRClient(path).ping() is not None:
+            raise RuntimeError(f"An OCR service is already running on {path}")
+        path.unlink()  # stale socket from a previous run
+
+    # 'spawn' keeps torch/OpenCV thread pools out of forked children
+    pool = multiprocessing.get_context('spawn').Pool(workers, initializer=_init_worker)
+    try:
+        # Workers load their models in the initializer; wait for them
+        pool.map(_warm, range(workers), chunksize=1)
+        with OCRServer(path, pool, workers) as server:
+            print(f"✅ OCR service ready on {path} ({workers} warm worker(s))")
+            server.serve_forever()
+    finally:
+        pool.terminate()
+        if path.exists():
+            path.unlink()
+
+
+# ============ Client ============
+
+class OCRClient:
+    """Client for a running OCR service (one connection, reused)"""
+
+    def __init__(self, path: Optional[Path] = None, timeout: Optional[float] = None):
+        self.path = Path(path or socket_path())
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(CONNECT_TIMEOUT_S)
+            sock.connect(str(self.path))
+            sock.settimeout(self.timeout)
+            self._sock = sock
+        return self._sock
+
+    def request(self, message: Dict) -> Dict:
+        try:
+            sock = self._connect()
+            send_message(sock, message)
+            response = recv_message(sock)
+        except OSError:
+            self.close()
+            raise
+        if response is None:
+            self.close()
+            raise ConnectionError("OCR service closed the connection")
+        return response
+
+    def ping(self) -> Optional[Dict]:
+        """Service status, or None if nothing is listening"""
+        if not self.path.exists():
+            return None
+        try:
+            return self.request({'op': 'ping'})
+        except OSError:
+            return None
+
+    def readtext(self, image_path: Path, settings: Optional[Dict] = None) -> Dict:
+        """
+        OCR one image with the given WORKER_SETTINGS and return the response
+        (results, settings used, stats); raises RuntimeError if the service
+        reports a failure
+        """
+        message = {'op': 'readtext', 'path': str(Path(image_path).resolve())}
+        if settings is not None:
+            message['settings'] = settings
+        response = self.request(message)
+        if not response.get('ok'):
+            raise RuntimeError(response.get('error', 'OCR service error'))
+        return response
+
+    def shutdown(self):
+        self.request({'op': 'shutdown'})
+        self.close()
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+def connect() -> Optional[OCRClient]:
+    """Client for the configured service if one is running, else None"""
+    client = OCRClient()
+    return client if client.ping() is not None else None
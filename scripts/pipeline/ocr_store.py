@@ -0,0 +1,167 @@
+"""
+Side store for full OCR output.
+
+The extraction report used to embed the first 500 characters of each
+screenshot's text, so every downstream parser lost the rows past the cut.
+The full text and the readtext boxes are now kept in a SQLite file
+(data/ocr-text.sqlite), zlib-compressed and keyed by the SHA-1 of the
+image file, and the report and extracted JSON carry a small reference:
+
+    "ocr_ref": {"store": "data/ocr-text.sqlite", "file_hash": "3f9c..."}
+
+Readers fetch text only when a file's text is actually used:
+load_ocr_texts() gives the {source_file: text} mapping the parser and
+fix-name scripts work with, entry_text() resolves a single entry. Both
+fall back to an embedded "extracted_text" for reports written before the
+store existed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from pipeline import BASE_DIR, DATA_DIR
+
+STORE_PATH = DATA_DIR / 'ocr-text.sqlite'
+REPORT_PATH = DATA_DIR / 'ocr-extraction-report.json'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_output (
+    file_hash   TEXT PRIMARY KEY,
+    source_file TEXT NOT NULL,
+    text        BLOB NOT NULL,
+    boxes       BLOB,
+    confidence  REAL,
+    created     TEXT DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def file_hash(path: Path) -> str:
+    """SHA-1 of a file's bytes"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def jsonable_boxes(results) -> List:
+    """readtext results as plain JSON (easyocr returns numpy numbers in boxes)"""
+    return [[[[float(x), float(y)] for x, y in bbox], str(text), float(confidence)]
+            for bbox, text, confidence in results]
+
+
+def _pack(value) -> bytes:
+    data = value if isinstance(value, str) else json.dumps(value, separators=(',', ':'))
+    return zlib.compress(data.encode('utf-8'))
+
+
+def _unpack(blob: bytes) -> str:
+    return zlib.decompress(blob).decode('utf-8')
+
+
+def _relative(path: Path) -> str:
+    path = Path(path).resolve()
+    try:
+        return str(path.relative_to(BASE_DIR))
+    except ValueError:
+        return str(path)
+
+
+class OCRStore:
+    """Compressed full OCR text and boxes, keyed by image file hash"""
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(_SCHEMA)
+
+    def put(self, image_path: Path, text: str, boxes: Optional[List] = None,
+            confidence: Optional[float] = None) -> Dict[str, str]:
+        """Store one screenshot's output and return its reference"""
+        digest = file_hash(image_path)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO ocr_output (file_hash, source_file, text, boxes, confidence) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (digest, Path(image_path).name, _pack(text),
+             _pack(jsonable_boxes(boxes)) if boxes is not None else None, confidence))
+        return {'store': _relative(self.path), 'file_hash': digest}
+
+    def text(self, digest: str) -> Optional[str]:
+        row = self._conn.execute("SELECT text FROM ocr_output WHERE file_hash = ?", (digest,)).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def boxes(self, digest: str) -> Optional[List]:
+        row = self._conn.execute("SELECT boxes FROM ocr_output WHERE file_hash = ?", (digest,)).fetchone()
+        return json.loads(_unpack(row[0])) if row and row[0] is not None else None
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_stores: Dict[Path, OCRStore] = {}
+
+
+def open_store(ref: Dict[str, str]) -> OCRStore:
+    """Store named by a reference (paths are relative to the repo root); kept open for reuse"""
+    path = Path(ref['store'])
+    if not path.is_absolute():
+        path = BASE_DIR / path
+    if path not in _stores:
+        if not path.exists():
+            raise FileNotFoundError(f"OCR text store not found: {path}")
+        _stores[path] = OCRStore(path)
+    return _stores[path]
+
+
+def entry_text(entry: Dict) -> Optional[str]:
+    """Full OCR text of a report/extracted-JSON entry (None if it has none)"""
+    if entry.get('ocr_ref'):
+        return open_store(entry['ocr_ref']).text(entry['ocr_ref']['file_hash'])
+    return entry.get('extracted_text')
+
+
+class OCRTexts(Mapping):
+    """{source_file: full OCR text}, read from the store on first access"""
+
+    def __init__(self, entries: Dict[str, Dict]):
+        self._entries = entries
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def __getitem__(self, source_file: str) -> str:
+        if source_file not in self._cache:
+            self._cache[source_file] = entry_text(self._entries[source_file])
+        text = self._cache[source_file]
+        if text is None:
+            raise KeyError(source_file)
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def load_ocr_texts(report_path: Path = REPORT_PATH) -> OCRTexts:
+    """{source_file: text} for every screenshot in an OCR extraction report"""
+    with open(report_path, 'r') as f:
+        report = json.load(f)
+    return OCRTexts({r['source_file']: r for r in report['results']
+                     if r.get('ocr_ref') or 'extracted_text' in r})
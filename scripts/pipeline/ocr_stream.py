@@ -0,0 +1,200 @@
+"""
+Streaming OCR pipeline: overlap disk reads, preprocessing and OCR.
+
+    reader thread        -> decode_q ->  preprocess pool  -> ready_q ->  OCR (caller's thread)
+    read + decode files                  preprocess_image                 reader.readtext
+
+Queues are bounded, so at most `queue_size` decoded images wait for
+preprocessing and `queue_size` preprocessed images wait for OCR no matter
+how many files are processed. OpenCV releases the GIL, so the preprocess
+pool runs in parallel with OCR.
+
+The stage functions are passed in, which keeps this module free of
+OpenCV/EasyOCR imports. Results come back in completion order with their
+input index.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+_DONE = object()
+_POLL_S = 0.1
+
+
+@dataclass
+class StageStats:
+    """Busy time of one stage, for utilisation reporting"""
+    name: str
+    parallelism: int = 1
+    items: int = 0
+    busy_s: float = 0.0
+    waiting_s: float = 0.0      # time spent blocked on an empty input queue
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.items += 1
+            self.busy_s += seconds
+
+    def utilisation(self, wall_s: float) -> float:
+        return self.busy_s / (wall_s * self.parallelism) if wall_s > 0 else 0.0
+
+
+@dataclass
+class StreamItem:
+    index: int
+    path: Path
+    results: Any = None
+    error: Optional[str] = None
+
+
+class OCRStream:
+    """
+    Run decode -> preprocess -> ocr over paths with bounded queues.
+
+    Iterate over the stream to drive it; `stats()` reports per-stage
+    utilisation afterwards.
+    """
+
+    def __init__(self, paths: Sequence[Path], decode: Callable, preprocess: Callable, ocr: Callable,
+                 workers: int = 4, queue_size: int = 8):
+        self.paths = list(paths)
+        self.decode = decode
+        self.preprocess = preprocess
+        self.ocr = ocr
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.stages = {
+            'decode': StageStats('decode'),
+            'preprocess': StageStats('preprocess', self.workers),
+            'ocr': StageStats('ocr'),
+        }
+        self.max_queued = {'decode_q': 0, 'ready_q': 0}
+        self.wall_s = 0.0
+        self._stop = threading.Event()
+
+    def _put(self, q: queue.Queue, item, name: str) -> bool:
+        """Blocking put that gives up when the stream is stopped"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_S)
+                self.max_queued[name] = max(self.max_queued[name], q.qsize())
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read_files(self, decode_q: queue.Queue):
+        for index, path in enumerate(self.paths):
+            start = time.perf_counter()
+            try:
+                item = (index, path, self.decode(path), None)
+            except Exception as e:
+                item = (index, path, None, f'{type(e).__name__}: {e}')
+            self.stages['decode'].add(time.perf_counter() - start)
+            if not self._put(decode_q, item, 'decode_q'):
+                return
+        self._put(decode_q, _DONE, 'decode_q')
+
+    def _preprocess_one(self, item: Tuple, ready_q: queue.Queue, slots: threading.BoundedSemaphore):
+        index, path, image, error = item
+        try:
+            processed = None
+            if error is None:
+                start = time.perf_counter()
+                try:
+                    processed = self.preprocess(image)
+                    if processed is None:
+                        error = 'preprocessing failed'
+                except Exception as e:
+                    error = f'{type(e).__name__}: {e}'
+                self.stages['preprocess'].add(time.perf_counter() - start)
+            self._put(ready_q, (index, path, processed, error), 'ready_q')
+        finally:
+            slots.release()
+
+    def _dispatch(self, decode_q: queue.Queue, ready_q: queue.Queue):
+        # One slot per image between the decode queue and the ready queue
+        slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='preprocess') as pool:
+            while not self._stop.is_set():
+                wait_start = time.perf_counter()
+                try:
+                    item = decode_q.get(timeout=_POLL_S)
+                except queue.Empty:
+                    continue
+                finally:
+                    self.stages['preprocess'].waiting_s += time.perf_counter() - wait_start
+                if item is _DONE:
+                    break
+                while not slots.acquire(timeout=_POLL_S):
+                    if self._stop.is_set():
+                        return
+                pool.submit(self._preprocess_one, item, ready_q, slots)
+        self._put(ready_q, _DONE, 'ready_q')
+
+    def __iter__(self) -> Iterator[StreamItem]:
+        decode_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        ready_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        threads = [
+            threading.Thread(target=self._read_files, args=(decode_q,), name='ocr-reader', daemon=True),
+            threading.Thread(target=self._dispatch, args=(decode_q, ready_q), name='ocr-dispatch', daemon=True),
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                wait_start = time.perf_counter()
+                item = ready_q.get()
+                self.stages['ocr'].waiting_s += time.perf_counter() - wait_start
+                if item is _DONE:
+                    break
+                index, path, processed, error = item
+                results = None
+                if error is None:
+                    ocr_start = time.perf_counter()
+                    try:
+                        results = self.ocr(processed)
+                    except Exception as e:
+                        error = f'{type(e).__name__}: {e}'
+                    self.stages['ocr'].add(time.perf_counter() - ocr_start)
+                yield StreamItem(index, path, results, error)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall_s = time.perf_counter() - start
+
+    def stats(self) -> Dict:
+        return {
+            'wall_s': round(self.wall_s, 3),
+            'images_per_second': round(len(self.paths) / self.wall_s, 3) if self.wall_s else None,
+            'max_queued': dict(self.max_queued),
+            'stages': {
+                name: {
+                    'items': s.items,
+                    'parallelism': s.parallelism,
+                    'busy_s': round(s.busy_s, 3),
+                    'waiting_s': round(s.waiting_s, 3),
+                    'utilisation': round(s.utilisation(self.wall_s), 3),
+                }
+                for name, s in self.stages.items()
+            },
+        }
+
+    def print_stats(self):
+        stats = self.stats()
+        print(f"\n⏱️  Stream: {len(self.paths)} images in {stats['wall_s']:.1f} s "
+              f"({stats['images_per_second'] or 0:.2f} images/sec)")
+        for name, s in stats['stages'].items():
+            print(f"  {name:11} x{s['parallelism']:<2} busy {s['busy_s']:7.2f} s  "
+                  f"utilisation {s['utilisation'] * 100:5.1f}%  starved {s['waiting_s']:6.2f} s")
+        print(f"  peak queue depth: decode {stats['max_queued']['decode_q']}, "
+              f"ready {stats['max_queued']['ready_q']} (limit {self.queue_size})")
@@ -0,0 +1,111 @@
+"""
+Tiled OCR for tall scrolling screenshots.
+
+A long scrolling capture is one huge image: EasyOCR shrinks it to its
+detection canvas (small text gets lost), holds its full-size feature maps
+in memory, and the whole run waits on that one image. Instead, images
+taller than TILE_HEIGHT * TILE_MIN_FACTOR are split into overlapping
+horizontal bands which are OCR'd concurrently and merged:
+
+- bands overlap by TILE_OVERLAP px, more than a table row, so every text
+  box lies wholly inside at least one band
+- a box touching a band's inner (cut) edge is dropped; the neighbouring
+  band holds it whole
+- the remaining boxes in the overlap are found twice; a box whose IoU
+  with an already kept box exceeds DEDUPE_IOU is dropped, keeping the
+  more confident of the two
+
+Bands are numpy views, so only `workers` bands are being OCR'd (and held
+by the OCR engine) at any time, whatever the height of the screenshot.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+TILE_HEIGHT = 1600
+TILE_OVERLAP = 200
+# Images up to TILE_HEIGHT * TILE_MIN_FACTOR tall are OCR'd whole
+TILE_MIN_FACTOR = 1.5
+DEDUPE_IOU = 0.5
+# Boxes within this many px of a band's cut edge count as cut
+EDGE_PX = 2
+
+
+def tile_bands(height: int, tile_height: int = TILE_HEIGHT, overlap: int = TILE_OVERLAP) -> List[Tuple[int, int]]:
+    """(top, bottom) rows of overlapping bands covering an image"""
+    if height <= tile_height * TILE_MIN_FACTOR:
+        return [(0, height)]
+    step = tile_height - overlap
+    bands = []
+    top = 0
+    while True:
+        bottom = min(height, top + tile_height)
+        bands.append((top, bottom))
+        if bottom == height:
+            return bands
+        top += step
+
+
+def box_extent(bbox: Sequence) -> Tuple[float, float, float, float]:
+    """(x0, y0, x1, y1) of a readtext 4-point box"""
+    xs = [p[0] for p in bbox]
+    ys = [p[1] for p in bbox]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def box_iou(a: Sequence, b: Sequence) -> float:
+    """Intersection over union of two readtext boxes"""
+    ax0, ay0, ax1, ay1 = box_extent(a)
+    bx0, by0, bx1, by1 = box_extent(b)
+    w = min(ax1, bx1) - max(ax0, bx0)
+    h = min(ay1, by1) - max(ay0, by0)
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    union = (ax1 - ax0) * (ay1 - ay0) + (bx1 - bx0) * (by1 - by0) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def merge_tile_results(bands: List[Tuple[int, int]], band_results: List[List], height: int,
+                       iou_threshold: float = DEDUPE_IOU) -> List:
+    """
+    Merge per-band readtext results into image coordinates.
+
+    Keeps band order (and readtext's order within a band), so the joined
+    text reads top to bottom as for an untiled image.
+    """
+    merged = []
+    previous_start, previous_bottom = 0, 0
+    for (top, bottom), results in zip(bands, band_results):
+        band_start = len(merged)
+        for bbox, text, confidence in results:
+            shifted = [[x, y + top] for x, y in bbox]
+            _, y0, _, y1 = box_extent(shifted)
+            if (top > 0 and y0 <= top + EDGE_PX) or (bottom < height and y1 >= bottom - EDGE_PX):
+                continue
+
+            # Only boxes in the overlap can have been kept from the band above
+            duplicate = None
+            if y0 < previous_bottom:
+                duplicate = next((i for i in range(previous_start, band_start)
+                                  if box_iou(merged[i][0], shifted) > iou_threshold), None)
+            if duplicate is None:
+                merged.append((shifted, text, confidence))
+            elif confidence > merged[duplicate][2]:
+                merged[duplicate] = (shifted, text, confidence)
+        previous_start, previous_bottom = band_start, bottom
+    return merged
+
+
+def readtext_tiled(image: np.ndarray, readtext: Callable, workers: int = 4,
+                   tile_height: int = TILE_HEIGHT, overlap: int = TILE_OVERLAP) -> List:
+    """readtext(image), band by band for tall images"""
+    height = image.shape[0]
+    bands = tile_bands(height, tile_height, overlap)
+    if len(bands) == 1:
+        return readtext(image)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(bands))), thread_name_prefix='ocr-tile') as pool:
+        band_results = list(pool.map(lambda band: readtext(image[band[0]:band[1]]), bands))
+    return merge_tile_results(bands, band_results, height)
@@ -0,0 +1,165 @@
+"""
+Perceptual-hash index of screenshots for skipping near-duplicates.
+
+The screenshot folder collects re-captures of the same table (different
+JPEG quality or window width). Each image gets a 256-bit
+dHash (sign of horizontal gradients on a 17x16 thumbnail); images within
+`max_distance` bits of another image join its cluster, which is
+represented by its newest capture (by mtime), so a re-capture with updated
+numbers is never the one left out.
+
+Comparison tables all look alike at thumbnail scale, so a hash match is
+confirmed by comparing the two images strip by strip at 512x256: a table
+with even one different row differs strongly in that strip, while a
+re-capture differs a little everywhere. A changed digit in one cell is
+below what either check can see, which is why ocr-extract-suburb-data.py
+only reports near-duplicates unless told to skip them.
+
+The index is persisted as JSON with each file's size and mtime, so
+unchanged files are never decoded again. Lookups use multi-index hashing:
+the hash is split into max_distance + 1 chunks, and by pigeonhole any
+hash within max_distance bits matches at least one chunk exactly, so a
+new file is checked against a few dict buckets rather than every hash.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+HASH_SIZE = 16
+DEFAULT_MAX_DISTANCE = 10
+# Largest mean abs. difference (0-255) of any strip for a confirmed duplicate
+MAX_STRIP_DIFF = 5.0
+THUMB_SIZE = (512, 256)
+STRIPS = 32
+
+
+def load_gray(path: Path) -> np.ndarray:
+    """Decode an image as grayscale at half resolution (plenty for hashing)"""
+    import cv2
+    gray = cv2.imread(str(path), cv2.IMREAD_REDUCED_GRAYSCALE_2)
+    if gray is None:
+        raise ValueError(f"Could not load image: {path}")
+    return gray
+
+
+def dhash(gray: np.ndarray, size: int = HASH_SIZE) -> int:
+    """Difference hash: size*size bits, one per adjacent-pixel comparison"""
+    import cv2
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA).astype(np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int(''.join('1' if b else '0' for b in bits), 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def strip_difference(a: np.ndarray, b: np.ndarray) -> float:
+    """Largest mean absolute difference over horizontal strips of two images"""
+    import cv2
+    ta = cv2.resize(a, THUMB_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+    tb = cv2.resize(b, THUMB_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+    return float(np.abs(ta - tb).reshape(STRIPS, -1).mean(axis=1).max())
+
+
+class HashIndex:
+    """
+    Persistent {file name: hash, cluster representative} index of a folder.
+
+    assign(path) returns the name of the representative a screenshot
+    belongs to - its own name when it starts a new cluster.
+    """
+
+    def __init__(self, path: Path, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.path = Path(path)
+        self.max_distance = max_distance
+        self.files: Dict[str, Dict] = {}
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                saved = json.load(f)
+            if saved.get('hash_size') == HASH_SIZE:
+                self.files = saved['files']
+
+        bits = HASH_SIZE * HASH_SIZE
+        n_chunks = min(bits, max_distance + 1)
+        edges = np.linspace(0, bits, n_chunks + 1).astype(int).tolist()
+        self._chunks: List[Tuple[int, int]] = list(zip(edges[:-1], edges[1:]))
+        self._buckets: Dict[Tuple[int, int], Set[str]] = {}
+        for name, entry in self.files.items():
+            if entry['representative'] == name:
+                self._add_to_buckets(name, int(entry['hash'], 16))
+
+    def _keys(self, h: int):
+        for i, (start, end) in enumerate(self._chunks):
+            yield i, (h >> start) & ((1 << (end - start)) - 1)
+
+    def _add_to_buckets(self, name: str, h: int):
+        for key in self._keys(h):
+            self._buckets.setdefault(key, set()).add(name)
+
+    def _remove_from_buckets(self, name: str, h: int):
+        for key in self._keys(h):
+            self._buckets.get(key, set()).discard(name)
+
+    def candidates(self, h: int) -> List[Tuple[int, str]]:
+        """(distance, representative) within max_distance, nearest first"""
+        names = set()
+        for key in self._keys(h):
+            names |= self._buckets.get(key, set())
+        found = [(hamming(h, int(self.files[name]['hash'], 16)), name) for name in names]
+        return sorted(item for item in found if item[0] <= self.max_distance)
+
+    def prune(self, names: Set[str]):
+        """Forget files no longer in the folder; their clusters' members are re-checked"""
+        gone = [name for name in self.files if name not in names]
+        for name in gone:
+            entry = self.files.pop(name)
+            if entry['representative'] == name:
+                self._remove_from_buckets(name, int(entry['hash'], 16))
+        for name, entry in list(self.files.items()):
+            if entry['representative'] not in self.files:
+                del self.files[name]
+
+    def assign(self, path: Path) -> str:
+        """Representative name for a screenshot, hashing it if it is new or changed"""
+        stat = path.stat()
+        entry = self.files.get(path.name)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['representative']
+
+        gray = load_gray(path)
+        h = dhash(gray)
+        match = None
+        for _, name in self.candidates(h):
+            if name != path.name and strip_difference(gray, load_gray(path.parent / name)) <= MAX_STRIP_DIFF:
+                match = name
+                break
+
+        if entry and entry['representative'] == path.name:
+            # The representative changed; its members are re-checked when next assigned
+            self._remove_from_buckets(path.name, int(entry['hash'], 16))
+            for member in [n for n, e in self.files.items() if e['representative'] == path.name]:
+                del self.files[member]
+
+        representative = path.name
+        if match is not None and self.files[match]['mtime_ns'] >= stat.st_mtime_ns:
+            representative = match
+        elif match is not None:
+            # A newer capture of the cluster takes over as its representative
+            self._remove_from_buckets(match, int(self.files[match]['hash'], 16))
+            for member in self.files.values():
+                if member['representative'] == match:
+                    member['representative'] = path.name
+        self.files[path.name] = {'hash': format(h, 'x'), 'size': stat.st_size,
+                                 'mtime_ns': stat.st_mtime_ns, 'representative': representative}
+        if representative == path.name:
+            self._add_to_buckets(path.name, h)
+        return representative
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump({'hash_size': HASH_SIZE, 'files': self.files}, f, indent=1)
@@ -0,0 +1,137 @@
+"""
+Data-quality profile of a table, for the stage summaries.
+
+profile_table() computes, for every column, the filled and empty counts,
+the number of distinct values and, for numeric columns, min / quartiles /
+max. The numeric columns are profiled together as one 2-D array: a single
+column-wise sort gives every statistic, so a summary costs one pass over
+the table rather than a notna(), min(), quantile() and nunique() per
+column.
+
+report_quality() prints the profile as a table and, when the
+HOMESCORE_QUALITY_LOG environment variable names a file, appends it there
+as one JSON line per stage run so completeness can be tracked over time:
+
+    HOMESCORE_QUALITY_LOG=data/quality.jsonl python3 scripts/clean-suburb-data.py
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+QUALITY_LOG_ENV = 'HOMESCORE_QUALITY_LOG'
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Metric columns of the extraction tables
+EXTRACTED_METRICS = ['median_price', 'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']
+
+
+def _number(value) -> Optional[float]:
+    """JSON-safe float (None for NaN)"""
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def _numeric_stats(values: np.ndarray, quantiles: Sequence[float]) -> Dict[str, np.ndarray]:
+    """
+    Per-column filled count, distinct count, min, quantiles and max of a
+    2-D float array, all read off one column-wise sort (NaN sorts last).
+    Quantiles interpolate linearly, like pandas' and numpy's default.
+    """
+    n, width = values.shape
+    ordered = np.sort(values, axis=0)
+    filled = (~np.isnan(ordered)).sum(axis=0)
+    cols = np.arange(width)
+    valid = np.arange(1, n)[:, None] < filled
+    distinct = np.where(filled > 0, 1 + ((ordered[1:] != ordered[:-1]) & valid).sum(axis=0), 0)
+    last = np.maximum(filled - 1, 0)
+    stats = {'filled': filled, 'distinct': distinct, 'min': ordered[0],
+             'max': np.where(filled > 0, ordered[last, cols], np.nan)}
+    for q in quantiles:
+        position = q * last
+        below = np.floor(position).astype(int)
+        above = np.minimum(below + 1, last)
+        low, high = ordered[below, cols], ordered[above, cols]
+        point = low + (high - low) * (position - below)
+        stats[f'p{round(q * 100)}'] = np.where(filled > 0, point, np.nan)
+    return stats
+
+
+def profile_table(df: pd.DataFrame, columns: Optional[Sequence[str]] = None,
+                  quantiles: Sequence[float] = QUANTILES) -> Dict:
+    """
+    {'rows': n, 'columns': {name: stats}} for the given columns (default:
+    all) that exist in df. Stats are filled, empty, fill_pct and distinct,
+    plus min, the quantiles (p25, p50, p75) and max for numeric columns.
+    """
+    names = [c for c in (df.columns if columns is None else columns) if c in df.columns]
+    n = len(df)
+    numeric = [c for c in names
+               if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])]
+    others = [c for c in names if c not in numeric]
+
+    stats: Dict[str, Dict] = {name: {'dtype': str(df[name].dtype)} for name in names}
+    if others:
+        filled = df[others].notna().sum()
+        distinct = df[others].nunique()
+        for name in others:
+            stats[name].update(filled=int(filled[name]), distinct=int(distinct[name]))
+    if numeric:
+        values = df[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        if n == 0:
+            values = np.full((1, len(numeric)), np.nan)
+        numbers = _numeric_stats(values, quantiles)
+        for j, name in enumerate(numeric):
+            stats[name].update(filled=int(numbers['filled'][j]), distinct=int(numbers['distinct'][j]))
+            for key in ['min'] + [f'p{round(q * 100)}' for q in quantiles] + ['max']:
+                stats[name][key] = _number(numbers[key][j])
+
+    for name in names:
+        stats[name]['empty'] = n - stats[name]['filled']
+        stats[name]['fill_pct'] = round(stats[name]['filled'] / n * 100, 1) if n else 0.0
+    return {'rows': n, 'columns': stats}
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return '-'
+    if abs(value) >= 1000:
+        return f'{value:,.0f}'
+    return f'{value:.4g}'
+
+
+def format_profile(profile: Dict) -> List[str]:
+    """Console table lines, one per column"""
+    n = profile['rows']
+    lines = [f"  {'column':24} {'filled':>15} {'fill%':>6} {'distinct':>8} "
+             f"{'min':>11} {'median':>11} {'max':>11}"]
+    for name, stats in profile['columns'].items():
+        filled = f"{stats['filled']}/{n}"
+        lines.append(
+            f"  {name:24} {filled:>15} {stats['fill_pct']:>5.1f}% {stats['distinct']:>8} "
+            f"{_format_value(stats.get('min')):>11} {_format_value(stats.get('p50')):>11} "
+            f"{_format_value(stats.get('max')):>11}")
+    return lines
+
+
+def report_quality(df: pd.DataFrame, stage: str, columns: Optional[Sequence[str]] = None,
+                   title: str = "\n📈 Data Completeness:") -> Dict:
+    """Print the profile of df under title and log it if HOMESCORE_QUALITY_LOG is set"""
+    profile = profile_table(df, columns)
+    print(title)
+    for line in format_profile(profile):
+        print(line)
+
+    log_path = os.environ.get(QUALITY_LOG_ENV)
+    if log_path:
+        entry = {'stage': stage, 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), **profile}
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+    return profile
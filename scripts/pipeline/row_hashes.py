@@ -0,0 +1,114 @@
+"""
+Per-row content hashes and change sets between two versions of a table.
+
+row_hashes() gives every row a 64-bit hash of its canonical column values,
+computed for the whole frame at once with pandas' vectorized hashing.
+Values are canonicalised first, so a row hashes the same whether a CSV
+read the column as int or float, or left a cell as NaN or None.
+
+change_set() compares two versions of a table by key and returns the keys
+that were inserted, updated and deleted, so downstream work (score
+precompute, search index, client deltas) can be limited to those rows:
+
+    changes = change_set(read_suburbs_csv(BACKUP), read_suburbs_csv(), SUBURBS_KEY)
+    changes.updated          # key columns of the rows whose content changed
+
+Hashes are deterministic across runs and machines (fixed hash key), so
+they can be stored and compared later.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+SUBURBS_KEY = ['suburb', 'postcode']
+EXTRACTED_KEY = ['suburb_name', 'source_file']
+
+# Spreads the occurrence number of a repeated key over the hash space
+_OCCURRENCE_STEP = np.uint64(0x9E3779B97F4A7C15)
+
+
+def canonical(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """
+    The given columns with numbers as float64 (-0.0 as 0.0) and everything
+    else as str, empty cells as NaN in both
+    """
+    out = {}
+    for name in columns:
+        series = df[name]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            out[name] = series.astype(np.float64) + 0.0
+        elif pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+            out[name] = series.astype(object).where(series.notna(), np.nan)
+        else:
+            out[name] = series.astype(object).where(series.notna(), np.nan).map(str, na_action='ignore')
+    return pd.DataFrame(out, index=df.index)
+
+
+def row_hashes(df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> pd.Series:
+    """uint64 hash of each row's values in columns (default: all, by name)"""
+    columns = sorted(df.columns) if columns is None else list(columns)
+    return pd.util.hash_pandas_object(canonical(df, columns), index=False)
+
+
+def hash_hex(hashes: pd.Series) -> pd.Series:
+    """Hashes as 16-character hex strings, for JSON and CSV"""
+    return hashes.map('{:016x}'.format)
+
+
+def key_hashes(df: pd.DataFrame, key: Sequence[str]) -> np.ndarray:
+    """Hash of each row's key; the n-th repeat of a key gets a distinct hash"""
+    hashes = row_hashes(df, key).to_numpy()
+    occurrence = pd.Series(hashes).groupby(hashes).cumcount().to_numpy().astype(np.uint64)
+    return hashes + occurrence * _OCCURRENCE_STEP
+
+
+@dataclass
+class ChangeSet:
+    """Key columns of the inserted, updated and deleted rows (indexed like their table)"""
+    inserted: pd.DataFrame      # rows of the new table
+    updated: pd.DataFrame       # rows of the new table
+    deleted: pd.DataFrame       # rows of the old table
+    unchanged: int
+
+    def counts(self) -> Dict[str, int]:
+        return {'inserted': len(self.inserted), 'updated': len(self.updated),
+                'deleted': len(self.deleted), 'unchanged': self.unchanged}
+
+    @property
+    def empty(self) -> bool:
+        return self.inserted.empty and self.updated.empty and self.deleted.empty
+
+
+def change_set(old: pd.DataFrame, new: pd.DataFrame, key: Sequence[str],
+               columns: Optional[Sequence[str]] = None) -> ChangeSet:
+    """
+    Rows of new whose key is not in old (inserted) or whose content hash
+    differs (updated), and rows of old whose key is gone (deleted).
+
+    Content is compared over columns (default: the columns both tables
+    have). A key that occurs several times is matched occurrence by
+    occurrence, in row order.
+    """
+    key = list(key)
+    if columns is None:
+        columns = sorted(set(old.columns) & set(new.columns))
+    old_keys, new_keys = key_hashes(old, key), key_hashes(new, key)
+    old_rows = row_hashes(old, columns).to_numpy()
+    new_rows = row_hashes(new, columns).to_numpy()
+
+    in_old = pd.Index(old_keys).get_indexer(new_keys)
+    inserted = in_old < 0
+    matched = np.flatnonzero(~inserted)
+    updated = np.zeros(len(new), dtype=bool)
+    updated[matched] = old_rows[in_old[matched]] != new_rows[matched]
+    deleted = pd.Index(new_keys).get_indexer(old_keys) < 0
+
+    return ChangeSet(
+        inserted=new.loc[inserted, key],
+        updated=new.loc[updated, key],
+        deleted=old.loc[deleted, key],
+        unchanged=int((~inserted & ~updated).sum()),
+    )
@@ -0,0 +1,175 @@
+"""
+Column schemas for suburbs.csv and the extraction tables, and a validator.
+
+Each column declares its type, whether it may be empty, its plausible
+range, its allowed values and the placeholder values that stand in for
+missing data (medianPrice 0, rentalYield 4.0, ...). These used to be
+literals spread over the extractor and the placeholder scripts.
+
+validate() checks a whole DataFrame column by column with vectorized
+comparisons and returns one boolean cell mask per rule, so a stage can ask
+"which prices are out of range" or "which cells are placeholders" without
+looping over rows:
+
+    result = validate(df, SUBURBS_SCHEMA)
+    result.masks['placeholder']['medianPrice']   # bool Series
+    result.counts()                              # violations per column and rule
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Rules reported by validate(), in report order
+RULES = ('null', 'dtype', 'range', 'category', 'placeholder')
+
+
+@dataclass(frozen=True)
+class Column:
+    """What one column may hold"""
+    dtype: str                                  # 'int' (whole numbers), 'float' or 'str'
+    nullable: bool = True
+    min: Optional[float] = None
+    max: Optional[float] = None
+    categories: Optional[Tuple[str, ...]] = None
+    placeholders: Tuple[float, ...] = ()        # values that mean "no data"
+
+    def in_range(self, value: float) -> bool:
+        """Whether a single value lies within [min, max]"""
+        return ((self.min is None or value >= self.min)
+                and (self.max is None or value <= self.max))
+
+
+Schema = Dict[str, Column]
+
+# Rows of improved-extracted-suburbs.csv and the later extraction CSVs.
+# Ranges learned from the manually extracted data.
+EXTRACTED_SCHEMA: Schema = {
+    'suburb_name': Column('str', nullable=False),
+    'lga': Column('str'),
+    'state': Column('str', categories=('Victoria',)),
+    'source_file': Column('str', nullable=False),
+    'median_price': Column('int', min=200_000, max=5_000_000),
+    'rental_yield': Column('float', min=0.01, max=0.10),
+    'weekly_rent': Column('int', min=200, max=3000),
+    'cbd_distance_km': Column('int', min=0, max=100),
+    'household_percentage': Column('float', min=0.30, max=1.0),
+}
+
+_SCORE = Column('int', nullable=False, min=500, max=1300)
+_DECILE = Column('int', nullable=False, min=1, max=10)
+_COUNT = Column('int', min=0)
+_PERCENT = Column('float', min=0, max=100)
+
+SUBURBS_SCHEMA: Schema = {
+    'suburb': Column('str', nullable=False),
+    'postcode': Column('int', nullable=False, min=3000, max=3999),
+    'lga': Column('str'),
+    'latitude': Column('float', min=-39.2, max=-33.9),
+    'longitude': Column('float', min=140.9, max=150.0),
+    'irsd_score': _SCORE,
+    'irsd_decile': _DECILE,
+    'ier_score': _SCORE,
+    'ier_decile': _DECILE,
+    'ieo_score': _SCORE,
+    'ieo_decile': _DECILE,
+    'medianPrice': Column('int', min=200_000, max=10_000_000, placeholders=(0,)),
+    # 0 may be real growth; it is reported, never cleared automatically
+    'growth1yr': Column('float', min=-50, max=50, placeholders=(0,)),
+    'crimeRate': Column('float', min=0),
+    'schoolRating': _PERCENT,
+    'schoolCount': _COUNT,
+    'primarySchools': _COUNT,
+    'secondarySchools': _COUNT,
+    'primaryCommuteMinutes': Column('float', min=1, max=180, placeholders=(0,)),
+    'secondaryCommuteMinutes': Column('float', min=1, max=180, placeholders=(0,)),
+    'rentalYield': Column('float', min=1, max=10, placeholders=(4.0,)),
+    'transitScore': _PERCENT,
+    'walkScore': _PERCENT,
+    'parksDensity': Column('float', min=0),
+    'childcareCenters': _COUNT,
+    'shoppingCenters': _COUNT,
+    'cafesRestaurants': _COUNT,
+    'medicalCenters': _COUNT,
+    'bikeScore': _PERCENT,
+    'category': Column('str', categories=('INNER METRO', 'BAYSIDE', 'HILLS & RANGES', 'OUTER GROWTH')),
+}
+
+
+@dataclass
+class Validation:
+    """Cell masks of one validate() call; every mask has the frame's index"""
+    masks: Dict[str, pd.DataFrame]              # rule -> bool DataFrame (schema columns present)
+    empty: pd.DataFrame                         # cells with no value, allowed or not
+    missing_columns: List[str] = field(default_factory=list)
+
+    def counts(self) -> pd.DataFrame:
+        """Violations per column (rows) and rule (columns)"""
+        return pd.DataFrame({rule: mask.sum() for rule, mask in self.masks.items()}).astype(int)
+
+    def invalid(self) -> pd.DataFrame:
+        """Cells breaking any rule except 'placeholder'"""
+        invalid = self.masks['null'].copy()
+        for rule in ('dtype', 'range', 'category'):
+            invalid |= self.masks[rule]
+        return invalid
+
+    def no_data(self) -> pd.DataFrame:
+        """Cells that are empty or hold a placeholder value"""
+        return self.empty | self.masks['placeholder']
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing_columns and not self.invalid().to_numpy().any()
+
+
+def _check_column(series: pd.Series, column: Column) -> Dict[str, np.ndarray]:
+    """Bool arrays per rule (and 'empty') for one column"""
+    n = len(series)
+    none = np.zeros(n, dtype=bool)
+    empty = series.isna().to_numpy()
+    checks = {'empty': empty, 'null': empty if not column.nullable else none,
+              'dtype': none, 'range': none, 'category': none, 'placeholder': none}
+
+    if column.dtype == 'str':
+        values = series.astype(str).to_numpy()
+        if column.categories is not None:
+            checks['category'] = ~empty & ~np.isin(values, column.categories)
+        return checks
+
+    numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(numbers)
+    checks['dtype'] = ~empty & ~present
+    if column.dtype == 'int':
+        checks['dtype'] = checks['dtype'] | (present & (numbers != np.floor(numbers)))
+    if column.placeholders:
+        checks['placeholder'] = np.isin(numbers, column.placeholders)
+    with np.errstate(invalid='ignore'):
+        out_of_range = none
+        if column.min is not None:
+            out_of_range = out_of_range | (numbers < column.min)
+        if column.max is not None:
+            out_of_range = out_of_range | (numbers > column.max)
+    # A placeholder is reported as a placeholder, not as out of range
+    checks['range'] = out_of_range & ~checks['placeholder']
+    return checks
+
+
+def validate(df: pd.DataFrame, schema: Schema) -> Validation:
+    """Check every schema column of df; columns not in the schema are ignored"""
+    present = [name for name in schema if name in df.columns]
+    per_rule: Dict[str, Dict[str, np.ndarray]] = {rule: {} for rule in RULES + ('empty',)}
+    for name in present:
+        for rule, mask in _check_column(df[name], schema[name]).items():
+            per_rule[rule][name] = mask
+
+    def frame(masks: Dict[str, np.ndarray]) -> pd.DataFrame:
+        return pd.DataFrame(masks, index=df.index, columns=present, dtype=bool)
+
+    return Validation(
+        masks={rule: frame(per_rule[rule]) for rule in RULES},
+        empty=frame(per_rule['empty']),
+        missing_columns=[name for name in schema if name not in df.columns],
+    )
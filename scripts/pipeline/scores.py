@@ -0,0 +1,118 @@
+"""
+Suburb Component Scores
+
+Vectorized versions of the A-Score component formulas used by the client
+(react-app/src/utils/members.js calculateAScoreForSuburb). Every component
+is normalized to 0-100, so a client only needs a weighted dot product with
+the strategy's A-Score tier weights to get a suburb's score.
+
+The weights are read from react-app/src/utils/strategyWeights.json, the
+file members.js imports, so the published weights are the ones the client
+scores with.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from pipeline import BASE_DIR
+
+# The A-Score tiers (tier1..tier4 in strategyWeights.json), in order
+COMPONENTS = ['investment', 'location', 'accessibility', 'lifestyle']
+TIERS = ['tier1', 'tier2', 'tier3', 'tier4']
+
+STRATEGY_WEIGHTS_JSON = BASE_DIR / 'react-app' / 'src' / 'utils' / 'strategyWeights.json'
+
+# Mirrors crimeData in react-app/src/utils/members.js (rates per 100,000)
+LGA_CRIME_RATES = {
+    'Banyule': 8426.88,
+    'Brimbank': 9476.96,
+    'Darebin': 11790.89,
+    'Hobsons Bay': 8182.20,
+    'Hume': 8276.54,
+    'Maribyrnong': 12958.47,
+    'Melbourne': 23519.82,
+    'Melton': 7056.17,
+    'Merri-bek': 8523.31,
+    'Moonee Valley': 8050.79,
+    'Moreland': 8523.31,
+    'Nillumbik': 3245.67,
+    'Port Phillip': 14532.89,
+    'Stonnington': 10234.56,
+    'Whitehorse': 5678.90,
+    'Whittlesea': 6789.01,
+    'Wyndham': 7890.12,
+    'Yarra': 15678.90,
+}
+DEFAULT_CRIME_RATE = 8500.00
+
+# SEIFA/crime mix of the location component per strategy (irsd, ier, ieo, crime)
+LOCATION_WEIGHTS = {
+    'investment': (0.45, 0.30, 0.15, 0.10),
+    'balanced': (0.30, 0.25, 0.30, 0.15),
+    'lifestyle': (0.20, 0.20, 0.50, 0.10),
+}
+
+
+def normalize(values: np.ndarray, low: float, high: float, inverse: bool = False) -> np.ndarray:
+    """Scale values into 0-100 (same as normalizeScore in members.js)"""
+    if inverse:
+        scaled = (high - values) / (high - low) * 100.0
+    else:
+        scaled = (values - low) / (high - low) * 100.0
+    return np.clip(scaled, 0.0, 100.0)
+
+
+def _column(df: pd.DataFrame, name: str, default: float = 0.0) -> np.ndarray:
+    """Numeric column with JS `value || default` semantics (NaN and 0 -> default)"""
+    if name not in df.columns:
+        return np.full(len(df), default)
+    values = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float64)
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
+def strategy_weights(path: Path = STRATEGY_WEIGHTS_JSON) -> Dict[str, List[float]]:
+    """A-Score tier weights per strategy, in COMPONENTS order"""
+    with open(path, 'r') as f:
+        table = json.load(f)
+    return {strategy: [float(tiers['aTiers'][t]) for t in TIERS] for strategy, tiers in table.items()}
+
+
+def compute_component_scores(df: pd.DataFrame, strategy: str) -> np.ndarray:
+    """
+    Compute the four component scores for every suburb.
+
+    Only the location component depends on the strategy. Returns an
+    (n, len(COMPONENTS)) float array in COMPONENTS order.
+    """
+    # Investment: growth and yield
+    growth = normalize(_column(df, 'growth1yr'), -5, 15)
+    rental_yield = normalize(_column(df, 'rentalYield'), 1, 6)
+    investment = growth * 0.55 + rental_yield * 0.45
+
+    # Location: SEIFA scores and LGA crime rate
+    crime_rates = df['lga'].map(LGA_CRIME_RATES).fillna(DEFAULT_CRIME_RATE).to_numpy(dtype=np.float64) \
+        if 'lga' in df.columns else np.full(len(df), DEFAULT_CRIME_RATE)
+    w_irsd, w_ier, w_ieo, w_crime = LOCATION_WEIGHTS.get(strategy, LOCATION_WEIGHTS['balanced'])
+    location = (normalize(_column(df, 'irsd_score'), 800, 1200) * w_irsd
+                + normalize(_column(df, 'ier_score'), 800, 1200) * w_ier
+                + normalize(_column(df, 'ieo_score'), 800, 1200) * w_ieo
+                + normalize(crime_rates, 3000, 25000, inverse=True) * w_crime)
+
+    # Accessibility: the client uses primaryCommuteMinutes as the CBD distance
+    accessibility = (normalize(_column(df, 'primaryCommuteMinutes'), 0, 50, inverse=True) * 0.30
+                     + _column(df, 'transitScore') * 0.45
+                     + _column(df, 'walkScore') * 0.25)
+
+    # Lifestyle: schools and amenities
+    lifestyle = (_column(df, 'schoolRating', 60) * 0.40
+                 + normalize(_column(df, 'parksDensity'), 0, 10) * 0.25
+                 + normalize(_column(df, 'childcareCenters'), 0, 20) * 0.20
+                 + normalize(_column(df, 'shoppingCenters'), 0, 10) * 0.08
+                 + normalize(_column(df, 'cafesRestaurants'), 0, 100) * 0.07)
+
+    scores = np.column_stack([investment, location, accessibility, lifestyle])
+    return np.clip(scores, 0.0, 100.0)
@@ -0,0 +1,180 @@
+"""
+Synthetic comparison-table screenshots with ground truth.
+
+Renders rows in the layout of the real "extra suburb data" screenshots
+(Suburb | LGA | State | Median House Price | Gross Rental Yield | Median
+Rent | Distance to CBD | Family Households) into JPGs, and writes a
+`<image>.truth.json` sidecar holding the rows that were drawn. Also scores
+parsed OCR rows against those sidecars field by field.
+
+Pillow is imported lazily so the scoring helpers work without it.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from pipeline.synthetic import EXTRACTED_COLUMNS
+
+SIDECAR_SUFFIX = '.truth.json'
+
+COLUMN_TITLES = ['Suburb Name', 'Local Government Area', 'State', 'Median House Price',
+                 'Gross Rental Yield', 'Median Rent', 'Distance to CBD', 'Family Households']
+# Relative column widths, roughly those of the real screenshots
+COLUMN_WEIGHTS = [1.6, 1.8, 0.9, 1.3, 1.1, 1.0, 1.0, 1.1]
+
+# How close a parsed value must be to count as correct
+FIELD_TOLERANCES = {
+    'median_price': 1000,
+    'rental_yield': 0.0011,
+    'weekly_rent': 1,
+    'cbd_distance_km': 0.5,
+    'household_percentage': 0.0011,
+}
+TEXT_FIELDS = ['lga']
+METRIC_FIELDS = list(FIELD_TOLERANCES)
+
+
+def require_pillow():
+    """Import Pillow on first use (raises ImportError if it is not installed)"""
+    from PIL import Image, ImageDraw, ImageFont
+    return Image, ImageDraw, ImageFont
+
+
+def _font(ImageFont, size: int):
+    for name in ['DejaVuSans.ttf', 'Arial.ttf', 'Helvetica.ttc']:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow < 10.1 has a single fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def format_cells(row) -> List[str]:
+    """Cell texts for one table row, formatted as on the real screenshots"""
+    return [
+        row.suburb_name, row.lga, 'Victoria',
+        f"${row.median_price:,}",
+        f"{row.rental_yield * 100:.1f}%",
+        f"${row.weekly_rent:,}",
+        f"{row.cbd_distance_km} km",
+        f"{row.household_percentage * 100:.1f}%",
+    ]
+
+
+def render_table(rows: pd.DataFrame, width: int = 1600, noise: float = 0.0,
+                 rng: Optional[np.random.Generator] = None):
+    """
+    Draw rows as a comparison table and return a PIL image.
+
+    noise is the standard deviation of added Gaussian pixel noise as a
+    fraction of full scale (0.05 = mild, 0.15 = heavy).
+    """
+    Image, ImageDraw, ImageFont = require_pillow()
+    rng = rng or np.random.default_rng()
+
+    font_size = max(10, width // 80)
+    font = _font(ImageFont, font_size)
+    row_height = int(font_size * 2.6)
+    header_height = row_height * 2
+    height = header_height + row_height * len(rows) + row_height // 2
+
+    total = sum(COLUMN_WEIGHTS)
+    edges = np.cumsum([0] + [w / total * width for w in COLUMN_WEIGHTS]).astype(int)
+
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, width, header_height], fill=(236, 240, 245))
+    for title, left in zip(COLUMN_TITLES, edges[:-1]):
+        # Long titles wrap over two lines like the real table header
+        words = title.split()
+        split = (len(words) + 1) // 2
+        draw.text((left + 8, font_size // 2), ' '.join(words[:split]), fill=(40, 40, 40), font=font)
+        draw.text((left + 8, font_size // 2 + int(font_size * 1.2)), ' '.join(words[split:]),
+                  fill=(40, 40, 40), font=font)
+
+    for i, row in enumerate(rows.itertuples()):
+        top = header_height + i * row_height
+        draw.line([0, top, width, top], fill=(210, 214, 220), width=1)
+        for text, left in zip(format_cells(row), edges[:-1]):
+            draw.text((left + 8, top + (row_height - font_size) // 2), str(text), fill=(20, 20, 20), font=font)
+
+    if noise > 0:
+        pixels = np.asarray(image, dtype=np.float32)
+        pixels += rng.normal(0, noise * 255, pixels.shape)
+        image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+    return image
+
+
+def write_screenshot(rows: pd.DataFrame, path: Path, width: int = 1600, noise: float = 0.0,
+                     quality: int = 85, rng: Optional[np.random.Generator] = None) -> Dict:
+    """Render rows to a JPG at path and write its ground-truth sidecar"""
+    image = render_table(rows, width=width, noise=noise, rng=rng)
+    image.save(path, 'JPEG', quality=quality)
+    truth = {
+        'source_file': path.name,
+        'width': image.width,
+        'height': image.height,
+        'noise': noise,
+        'quality': quality,
+        'rows': rows[[c for c in EXTRACTED_COLUMNS if c != 'source_file']].to_dict('records'),
+    }
+    with open(sidecar_path(path), 'w') as f:
+        json.dump(truth, f, indent=2, default=lambda v: v.item())
+    return truth
+
+
+def sidecar_path(image_path: Path) -> Path:
+    return image_path.with_name(image_path.name + SIDECAR_SUFFIX)
+
+
+def load_truth(image_path: Path) -> Optional[Dict]:
+    path = sidecar_path(image_path)
+    if not path.exists():
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def score_rows(parsed: List[Dict], truth_rows: List[Dict]) -> Dict[str, Dict[str, int]]:
+    """
+    Field-level accuracy of parsed rows against ground truth.
+
+    Rows are paired by suburb name (first unused parsed row with the same
+    name, falling back to any single word of it since the extractors only
+    read one word). Returns {field: {'correct', 'total'}}; 'suburb_name' counts how
+    many truth rows were found at all.
+    """
+    fields = ['suburb_name'] + TEXT_FIELDS + METRIC_FIELDS
+    counts = {field: {'correct': 0, 'total': 0} for field in fields}
+    unused = list(parsed)
+
+    for truth in truth_rows:
+        for field in fields:
+            counts[field]['total'] += 1
+        name = str(truth['suburb_name']).lower()
+        match = next((p for p in unused if str(p.get('suburb_name', '')).lower() == name), None)
+        if match is None:
+            words = set(name.split())
+            match = next((p for p in unused if str(p.get('suburb_name', '')).lower() in words), None)
+        if match is None:
+            continue
+        unused.remove(match)
+        counts['suburb_name']['correct'] += 1
+
+        for field in TEXT_FIELDS:
+            parsed_value = str(match.get(field) or '').lower()
+            if parsed_value and str(truth[field]).lower().startswith(parsed_value):
+                counts[field]['correct'] += 1
+        for field, tolerance in FIELD_TOLERANCES.items():
+            value = match.get(field)
+            if value is not None and not pd.isna(value) and abs(float(value) - float(truth[field])) <= tolerance:
+                counts[field]['correct'] += 1
+    return counts
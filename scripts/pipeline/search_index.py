@@ -0,0 +1,261 @@
+"""
+Static Suburb Search Index
+
+Prefix posting lists (a flattened trie) for suburb names, postcodes and
+LGAs, plus trigram posting lists for infix matches. Posting lists are
+stored pre-ranked, so a lookup is a dictionary hit plus a slice:
+
+    tier 0  suburb name starts with the query
+    tier 1  a later word of the suburb name starts with the query
+    tier 2  postcode starts with the query
+    tier 3  LGA (or a word of it) starts with the query
+
+ties broken by shorter name, then alphabetically.
+
+Prefix matches come first; when there are fewer than the requested limit,
+the rest are filled from the trigram lists, which match anywhere in the
+name, postcode or LGA ("ill" finds "Illawarra", then "Box Hill"). Prefix
+lists keep MAX_PREFIX_POSTINGS documents, so a capped list that is shorter
+than the limit is skipped and the trigram lists rank every match.
+
+The index keeps a content hash per document (pipeline/row_hashes.py key
+hashes, so exact duplicate rows stay distinct documents) and a rebuild
+only re-tokenizes rows that were added, changed or removed since the
+previous build.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from pipeline.row_hashes import hash_hex, key_hashes
+
+INDEX_VERSION = 3           # 3: occurrence-numbered key hashes from pipeline/row_hashes.py
+MAX_PREFIX_LENGTH = 12      # longer queries go through the trigram lists
+MAX_PREFIX_POSTINGS = 50    # ranked results kept per prefix key
+FULL_REBUILD_RATIO = 4      # rebuild all prefixes when > 1/4 of rows changed
+
+TIER_NAME, TIER_WORD, TIER_POSTCODE, TIER_LGA = range(4)
+
+# suburbs.csv columns a document is built from (and hashed over)
+DOCUMENT_COLUMNS = ['suburb', 'postcode', 'lga']
+
+
+def normalize(text) -> str:
+    """Lowercase, keep letters/digits, collapse everything else to one space"""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return ''
+    return re.sub(r'[^a-z0-9]+', ' ', str(text).lower()).strip()
+
+
+def prefix_terms(doc: List) -> Dict[str, int]:
+    """Map every indexed prefix of a document to its best (lowest) tier"""
+    suburb, postcode, lga = (normalize(v) for v in doc[:3])
+    terms: Dict[str, int] = {}
+
+    def add(text: str, tier: int):
+        for length in range(1, min(len(text), MAX_PREFIX_LENGTH) + 1):
+            key = text[:length].rstrip()
+            if key and terms.get(key, 99) > tier:
+                terms[key] = tier
+
+    add(suburb, TIER_NAME)
+    words = suburb.split()
+    for i in range(1, len(words)):
+        add(' '.join(words[i:]), TIER_WORD)
+    add(postcode, TIER_POSTCODE)
+    lga_words = lga.split()
+    for i in range(len(lga_words)):
+        add(' '.join(lga_words[i:]), TIER_LGA)
+    return terms
+
+
+def prefix_tier(normalized_doc: List[str], key: str) -> Optional[int]:
+    """Tier at which key prefixes a normalized document, or None"""
+    suburb, postcode, lga = normalized_doc
+    if suburb.startswith(key):
+        return TIER_NAME
+    words = suburb.split()
+    if any(' '.join(words[i:]).startswith(key) for i in range(1, len(words))):
+        return TIER_WORD
+    if postcode.startswith(key):
+        return TIER_POSTCODE
+    lga_words = lga.split()
+    if any(' '.join(lga_words[i:]).startswith(key) for i in range(len(lga_words))):
+        return TIER_LGA
+    return None
+
+
+def query_trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def trigram_terms(doc: List) -> set:
+    text = ' '.join(normalize(v) for v in doc[:3])
+    return query_trigrams(f' {text} ')
+
+
+class SearchIndex:
+    """In-memory form of data/suburbs-search-index.json"""
+
+    def __init__(self, data: Optional[Dict] = None):
+        data = data or {}
+        self.source_version = data.get('source_version')
+        self.docs: List[List] = data.get('docs', [])            # [suburb, postcode, lga]
+        self.hashes: List[str] = data.get('hashes', [])
+        self.prefix: Dict[str, List[int]] = data.get('prefix', {})
+        self.trigrams: Dict[str, List[int]] = data.get('trigrams', {})
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': INDEX_VERSION,
+            'source_version': self.source_version,
+            'max_prefix_length': MAX_PREFIX_LENGTH,
+            'max_prefix_postings': MAX_PREFIX_POSTINGS,
+            'docs': self.docs,
+            'hashes': self.hashes,
+            'prefix': self.prefix,
+            'trigrams': self.trigrams,
+        }
+
+    def _rank_key(self, doc_id: int, tier: int) -> Tuple:
+        name = self.docs[doc_id][0]
+        return (tier, len(name), name, self.docs[doc_id][1], doc_id)
+
+    def update(self, df: pd.DataFrame, source_version: str) -> Dict[str, int]:
+        """
+        Bring the index in line with df, re-tokenizing only changed rows.
+
+        Returns counts of added / removed / unchanged documents.
+        """
+        new_docs = [[str(s), str(p), '' if pd.isna(l) else str(l)]
+                    for s, p, l in zip(df['suburb'], df['postcode'], df['lga'])]
+        new_hashes = hash_hex(pd.Series(key_hashes(df, DOCUMENT_COLUMNS))).tolist()
+
+        old_positions = {h: i for i, h in enumerate(self.hashes)}
+        new_set = set(new_hashes)
+        removed_ids = [i for i, h in enumerate(self.hashes) if h not in new_set]
+        added_ids = [i for i, h in enumerate(new_hashes) if h not in old_positions]
+
+        # Keys touched by removed or added documents
+        dirty_prefix = set()
+        dirty_trigrams = set()
+        for doc_id in removed_ids:
+            dirty_prefix.update(prefix_terms(self.docs[doc_id]))
+            dirty_trigrams.update(trigram_terms(self.docs[doc_id]))
+        added_trigrams = {doc_id: trigram_terms(new_docs[doc_id]) for doc_id in added_ids}
+        for doc_id in added_ids:
+            dirty_prefix.update(prefix_terms(new_docs[doc_id]))
+            dirty_trigrams.update(added_trigrams[doc_id])
+
+        # Renumber surviving documents to the new row order
+        remap = {old_positions[h]: pos for pos, h in enumerate(new_hashes) if h in old_positions}
+        old_trigrams = self.trigrams
+        self.prefix = {key: [remap[i] for i in ids if i in remap]
+                       for key, ids in self.prefix.items() if key not in dirty_prefix}
+        self.trigrams = {key: sorted(remap[i] for i in ids if i in remap)
+                         for key, ids in old_trigrams.items() if key not in dirty_trigrams}
+        self.docs = new_docs
+        self.hashes = new_hashes
+        self.source_version = source_version
+
+        # Trigram lists are complete, so dirty ones are patched in place
+        for gram in dirty_trigrams:
+            ids = [remap[i] for i in old_trigrams.get(gram, []) if i in remap]
+            ids.extend(doc_id for doc_id in added_ids if gram in added_trigrams[doc_id])
+            if ids:
+                self.trigrams[gram] = sorted(ids)
+
+        changed = len(added_ids) + len(removed_ids)
+        if changed * FULL_REBUILD_RATIO > len(new_docs):
+            self._rebuild_prefix()
+        else:
+            self._rerank_prefix(dirty_prefix)
+
+        return {'added': len(added_ids), 'removed': len(removed_ids),
+                'unchanged': len(new_docs) - len(added_ids)}
+
+    def _rebuild_prefix(self):
+        """Tokenize every document and rank all prefix lists"""
+        entries = defaultdict(list)
+        for doc_id, doc in enumerate(self.docs):
+            for key, tier in prefix_terms(doc).items():
+                entries[key].append((doc_id, tier))
+        self.prefix = {}
+        for key, items in entries.items():
+            items.sort(key=lambda e: self._rank_key(*e))
+            self.prefix[key] = [doc_id for doc_id, _ in items[:MAX_PREFIX_POSTINGS]]
+
+    def _rerank_prefix(self, dirty_prefix: set):
+        """
+        Re-rank only the given prefix keys. Prefix lists are capped, so each
+        key is re-ranked from the documents that can contain it (trigram
+        candidates) rather than patched.
+        """
+        normalized = {}
+        for key in dirty_prefix:
+            entries = []
+            for doc_id in self._candidates(key):
+                if doc_id not in normalized:
+                    normalized[doc_id] = [normalize(v) for v in self.docs[doc_id]]
+                tier = prefix_tier(normalized[doc_id], key)
+                if tier is not None:
+                    entries.append((doc_id, tier))
+            if entries:
+                entries.sort(key=lambda e: self._rank_key(*e))
+                self.prefix[key] = [doc_id for doc_id, _ in entries[:MAX_PREFIX_POSTINGS]]
+
+    def _candidates(self, text: str) -> Iterable[int]:
+        """Documents that contain every trigram of text (all docs if text < 3 chars)"""
+        grams = query_trigrams(text)
+        if not grams:
+            return range(len(self.docs))
+        postings = sorted((self.trigrams.get(g, []) for g in grams), key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query: str, limit: int = 10) -> List[int]:
+        """
+        Return up to limit ranked document ids matching query: prefix
+        matches first, then documents that contain the query elsewhere.
+        """
+        q = normalize(query)
+        if not q or limit <= 0:
+            return []
+
+        # A complete prefix list, or a capped one that covers the limit, leads
+        ids: List[int] = []
+        prefix = self.prefix.get(q) if len(q) <= MAX_PREFIX_LENGTH else None
+        if prefix is not None and (len(prefix) < MAX_PREFIX_POSTINGS or limit <= len(prefix)):
+            ids = prefix[:limit]
+            if len(ids) == limit:
+                return ids
+
+        seen = set(ids)
+        rest = [doc_id for doc_id in self._infix_matches(q) if doc_id not in seen]
+        return ids + rest[:limit - len(ids)]
+
+    def _infix_matches(self, q: str) -> List[int]:
+        """Every document containing q, ranked (trigram intersection, then verify)"""
+        matches = []
+        for doc_id in self._candidates(q):
+            suburb, postcode, lga = (normalize(v) for v in self.docs[doc_id])
+            if suburb.startswith(q):
+                tier = TIER_NAME
+            elif q in suburb:
+                tier = TIER_WORD
+            elif q in postcode:
+                tier = TIER_POSTCODE
+            elif q in lga:
+                tier = TIER_LGA
+            else:
+                continue
+            matches.append((doc_id, tier))
+        matches.sort(key=lambda e: self._rank_key(*e))
+        return [doc_id for doc_id, _ in matches]
@@ -0,0 +1,225 @@
+"""
+Columnar Binary Snapshot of suburbs.csv
+
+File layout (all integers little-endian, every column block 8-byte aligned):
+
+    bytes 0-7    magic b'HSPSNAP1'
+    bytes 8-11   uint32 manifest length M
+    bytes 12..   manifest JSON (UTF-8, M bytes), zero-padded to 8 bytes
+    ...          column blocks at the offsets listed in the manifest
+
+The same manifest is also written next to the snapshot as `<name>.json`, so
+HTTP clients can fetch it first and then range-request only the columns
+they need. Offsets in the manifest are absolute file offsets.
+
+Column encodings:
+    plain    fixed-width numbers, integers in the narrowest width that fits
+             (float columns use NaN for missing)
+    null     column with no values; no block is stored
+    dict     int codes (narrowest of int8/16/32 for the dictionary size)
+             into manifest `dictionary` (-1 = missing)
+    offsets  uint32 offsets[n + 1] block followed by a UTF-8 data block
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b'HSPSNAP1'
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+
+DICT_COLUMNS = ('lga', 'category')
+STRING_COLUMNS = ('suburb',)
+# Coordinates keep full precision; other float metrics fit in float32
+FLOAT64_COLUMNS = ('latitude', 'longitude')
+
+
+def _pad(length: int) -> int:
+    return (-length) % ALIGNMENT
+
+
+def _smallest_int_dtype(values: np.ndarray) -> str:
+    low, high = (int(values.min()), int(values.max())) if len(values) else (0, 0)
+    for dtype in ('<i1', '<i2', '<i4'):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return '<i8'
+
+
+def _encode_columns(df: pd.DataFrame):
+    """Yield (column manifest entry, [raw byte blocks]) per column"""
+    for name in df.columns:
+        series = df[name]
+
+        if name in STRING_COLUMNS:
+            encoded = [str(v).encode('utf-8') if pd.notna(v) else b'' for v in series]
+            offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            yield {'name': name, 'encoding': 'offsets', 'dtype': '<u4'}, [offsets.tobytes(), b''.join(encoded)]
+
+        elif name in DICT_COLUMNS or not pd.api.types.is_numeric_dtype(series):
+            codes, uniques = pd.factorize(series, sort=True)
+            dtype = _smallest_int_dtype(np.array([-1, len(uniques)]))
+            yield ({'name': name, 'encoding': 'dict', 'dtype': dtype,
+                    'dictionary': [str(u) for u in uniques]},
+                   [codes.astype(dtype).tobytes()])
+
+        elif series.isna().all():
+            yield {'name': name, 'encoding': 'null', 'dtype': '<f4'}, []
+
+        elif pd.api.types.is_integer_dtype(series) and series.notna().all():
+            values = series.to_numpy()
+            dtype = _smallest_int_dtype(values)
+            yield {'name': name, 'encoding': 'plain', 'dtype': dtype}, [values.astype(dtype).tobytes()]
+
+        else:
+            dtype = '<f8' if name in FLOAT64_COLUMNS else '<f4'
+            values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64)
+            yield {'name': name, 'encoding': 'plain', 'dtype': dtype}, [values.astype(dtype).tobytes()]
+
+
+def write_snapshot(df: pd.DataFrame, path: Path, source_version: str) -> Dict:
+    """
+    Write df as a columnar snapshot and a sidecar manifest.
+
+    Args:
+        source_version: hash of the source CSV, recorded in the manifest
+
+    Returns the manifest dict.
+    """
+    columns = []
+    blocks = []
+    for entry, raw_blocks in _encode_columns(df):
+        entry['blocks'] = [{'length': len(raw)} for raw in raw_blocks]
+        columns.append(entry)
+        blocks.extend(raw_blocks)
+
+    manifest = {
+        'format': 'homescore-snapshot',
+        'format_version': FORMAT_VERSION,
+        'source_version': source_version,
+        'rows': len(df),
+        'columns': columns,
+    }
+
+    # Offsets depend on the manifest length, which depends on the offsets;
+    # iterate until the encoded manifest size is stable.
+    manifest['content_hash'] = hashlib.sha256(b''.join(blocks)).hexdigest()[:16]
+    manifest_bytes = b''
+    for _ in range(10):
+        offset = len(MAGIC) + 4 + len(manifest_bytes) + _pad(len(MAGIC) + 4 + len(manifest_bytes))
+        for entry in columns:
+            for block in entry['blocks']:
+                block['offset'] = offset
+                offset += block['length'] + _pad(block['length'])
+        encoded = json.dumps(manifest, separators=(',', ':')).encode('utf-8')
+        stable = len(encoded) == len(manifest_bytes)
+        manifest_bytes = encoded
+        if stable:
+            break
+    else:
+        raise RuntimeError("Snapshot manifest layout did not converge")
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(manifest_bytes)))
+        f.write(manifest_bytes)
+        f.write(b'\0' * _pad(f.tell()))
+        for raw in blocks:
+            f.write(raw)
+            f.write(b'\0' * _pad(len(raw)))
+
+    with open(manifest_path(path), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def manifest_path(path: Path) -> Path:
+    return Path(path).with_name(Path(path).name + '.json')
+
+
+def read_manifest(buffer) -> Dict:
+    """Parse the embedded manifest from a snapshot buffer"""
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Not a homescore snapshot (bad magic)")
+    (length,) = struct.unpack_from('<I', buffer, len(MAGIC))
+    start = len(MAGIC) + 4
+    return json.loads(bytes(buffer[start:start + length]).decode('utf-8'))
+
+
+def read_snapshot(path: Path, columns: Optional[list] = None, as_dataframe: bool = True):
+    """
+    Load a snapshot via mmap.
+
+    Numeric columns are zero-copy views onto the mapped file; dict and
+    string columns are decoded. Pass `columns` to touch only those blocks.
+    Returns a DataFrame (or a dict of arrays with as_dataframe=False).
+    """
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    manifest = read_manifest(buffer)
+    rows = manifest['rows']
+    wanted = set(columns) if columns else None
+    data = {}
+
+    for entry in manifest['columns']:
+        name = entry['name']
+        if wanted is not None and name not in wanted:
+            continue
+        if entry['encoding'] == 'null':
+            data[name] = np.full(rows, np.nan, dtype=entry['dtype'])
+            continue
+        first = entry['blocks'][0]
+
+        if entry['encoding'] == 'plain':
+            data[name] = np.frombuffer(buffer, dtype=entry['dtype'], count=rows, offset=first['offset'])
+        elif entry['encoding'] == 'dict':
+            codes = np.frombuffer(buffer, dtype=entry['dtype'], count=rows, offset=first['offset'])
+            dictionary = np.array(entry['dictionary'] + [None], dtype=object)
+            data[name] = dictionary[codes]  # code -1 selects the trailing None
+        else:
+            offsets = np.frombuffer(buffer, dtype=entry['dtype'], count=rows + 1, offset=first['offset'])
+            text_start = entry['blocks'][1]['offset']
+            text = bytes(buffer[text_start:text_start + entry['blocks'][1]['length']])
+            data[name] = np.array([text[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])],
+                                  dtype=object)
+
+    return pd.DataFrame(data) if as_dataframe else data
+
+
+def _as_text(values) -> np.ndarray:
+    """Cells as strings, missing as '' (how the offsets encoding stores them)"""
+    series = pd.Series(values, dtype=object)
+    return series.where(series.notna(), '').map(str).to_numpy()
+
+
+def round_trip_mismatches(df: pd.DataFrame, loaded: pd.DataFrame) -> Dict[str, int]:
+    """
+    Cells per column that differ between df and its read-back snapshot.
+    Numbers are compared at float32 precision; text by its string form.
+    """
+    mismatches = {}
+    for name in df.columns:
+        if name not in loaded.columns:
+            mismatches[name] = len(df)
+            continue
+        original, restored = df[name], loaded[name]
+        if pd.api.types.is_numeric_dtype(restored) and pd.api.types.is_numeric_dtype(original):
+            a = original.to_numpy(dtype=np.float64, na_value=np.nan)
+            b = restored.to_numpy(dtype=np.float64)
+            differ = ~np.isclose(a, b, rtol=1e-6, equal_nan=True)
+        else:
+            differ = _as_text(original) != _as_text(restored)
+        if differ.any():
+            mismatches[name] = int(differ.sum())
+    return mismatches
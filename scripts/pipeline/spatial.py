@@ -0,0 +1,219 @@
+"""
+Spatial Index and Nearest-Neighbour Imputation
+
+Builds a KD-tree over suburb coordinates (projected onto the unit sphere so
+straight-line distances order the same way as great-circle distances) and
+fills missing numeric fields from the k nearest suburbs that do have data,
+weighted by inverse distance.
+
+Requirements:
+- pip install scipy
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # checked when an index is built
+    cKDTree = None
+
+from pipeline import trace
+from pipeline.commute import EARTH_RADIUS_KM
+
+# Numeric fields that remove-placeholder-data.py leaves blank. transitScore,
+# walkScore and bikeScore (all Walk Score products) are excluded on purpose -
+# they are cleared pending licensing.
+DEFAULT_IMPUTE_COLUMNS = [
+    'medianPrice', 'rentalYield', 'growth1yr',
+    'parksDensity', 'childcareCenters', 'shoppingCenters',
+    'cafesRestaurants', 'medicalCenters',
+]
+
+# Count-like fields are rounded to whole numbers after imputation
+INTEGER_COLUMNS = {'childcareCenters', 'shoppingCenters', 'cafesRestaurants', 'medicalCenters', 'bikeScore'}
+
+
+def _to_unit_xyz(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """Project lat/lng degrees onto the unit sphere"""
+    lat_r = np.radians(np.asarray(lat, dtype=np.float64))
+    lng_r = np.radians(np.asarray(lng, dtype=np.float64))
+    cos_lat = np.cos(lat_r)
+    return np.column_stack([cos_lat * np.cos(lng_r), cos_lat * np.sin(lng_r), np.sin(lat_r)])
+
+
+class SpatialIndex:
+    """
+    KD-tree over a set of points given as latitude/longitude.
+
+    Points without coordinates are left out of the tree; query results use
+    positions in the original arrays, so callers never need to remap.
+    """
+
+    def __init__(self, lat: Iterable[float], lng: Iterable[float]):
+        if cKDTree is None:
+            raise ImportError("scipy is required for the spatial index: pip install scipy")
+
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        self.positions = np.flatnonzero(~(np.isnan(lat) | np.isnan(lng)))
+        self.size = len(self.positions)
+        self.tree = cKDTree(_to_unit_xyz(lat[self.positions], lng[self.positions])) if self.size else None
+
+    def query(self, lat: Iterable[float], lng: Iterable[float], k: int,
+              max_distance_km: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest indexed points for each query point.
+
+        Returns:
+            (distance_km, position) arrays of shape (n, k). Missing
+            neighbours have distance inf and position -1.
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        n = len(lat)
+        distances = np.full((n, k), np.inf)
+        positions = np.full((n, k), -1, dtype=np.int64)
+
+        valid = ~(np.isnan(lat) | np.isnan(lng))
+        if self.tree is None or not valid.any() or k <= 0:
+            return distances, positions
+
+        upper = np.inf
+        if max_distance_km is not None:
+            upper = 2.0 * np.sin(min(max_distance_km / EARTH_RADIUS_KM, np.pi) / 2.0)
+
+        chord, found = self.tree.query(_to_unit_xyz(lat[valid], lng[valid]), k=min(k, self.size),
+                                       distance_upper_bound=upper)
+        chord = chord.reshape(int(valid.sum()), -1)
+        found = found.reshape(int(valid.sum()), -1)
+        hit = found < self.size  # scipy reports misses as index == size
+
+        arc_km = np.full(chord.shape, np.inf)
+        arc_km[hit] = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord[hit] / 2.0, 0.0, 1.0))
+        mapped = np.full(found.shape, -1, dtype=np.int64)
+        mapped[hit] = self.positions[found[hit]]
+
+        distances[valid, :arc_km.shape[1]] = arc_km
+        positions[valid, :mapped.shape[1]] = mapped
+        return distances, positions
+
+
+def impute_from_neighbours(df: pd.DataFrame, columns: Optional[List[str]] = None, k: int = 5,
+                           restrict_to: Optional[str] = None, power: float = 1.0,
+                           max_distance_km: Optional[float] = None,
+                           estimated: Optional[Dict[str, np.ndarray]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Fill missing numeric fields from the k nearest suburbs that have data.
+
+    Args:
+        df: suburbs with `latitude` / `longitude` columns
+        columns: fields to impute (defaults to DEFAULT_IMPUTE_COLUMNS)
+        k: number of neighbours to average
+        restrict_to: optional column (e.g. 'lga' or 'category'); donors must
+            share the recipient's value
+        power: inverse-distance weighting exponent (0 = plain mean)
+        max_distance_km: ignore donors further away than this
+        estimated: per column, a bool mask of cells that hold an earlier
+            estimate; they are never used as donors
+
+    Returns:
+        (imputed copy of df, provenance DataFrame with one row per filled
+        cell: row, field, value, neighbours, mean_distance_km)
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    if columns is None:
+        columns = [c for c in DEFAULT_IMPUTE_COLUMNS if c in df.columns]
+
+    result = df.copy()
+    lat = pd.to_numeric(df['latitude'], errors='coerce').to_numpy(dtype=np.float64)
+    lng = pd.to_numeric(df['longitude'], errors='coerce').to_numpy(dtype=np.float64)
+
+    if restrict_to:
+        group_codes, _ = pd.factorize(df[restrict_to])
+    else:
+        group_codes = np.zeros(len(df), dtype=np.int64)
+
+    names = df['suburb'].astype(str).to_numpy() if 'suburb' in df.columns else df.index.astype(str).to_numpy()
+
+    # Columns with the same donor rows share one tree per group
+    index_cache: Dict[Tuple[bytes, int], SpatialIndex] = {}
+    provenance: List[pd.DataFrame] = []
+
+    for column in columns:
+        values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+        recipients = np.isnan(values)
+        donors = ~recipients
+        if estimated and column in estimated:
+            donors &= ~np.asarray(estimated[column], dtype=bool)
+        if not recipients.any() or not donors.any():
+            continue
+
+        donor_key = np.packbits(donors).tobytes()
+        filled = np.full(len(df), np.nan)
+        neighbour_positions = np.full((len(df), k), -1, dtype=np.int64)
+        neighbour_distances = np.full((len(df), k), np.inf)
+
+        for group in np.unique(group_codes[recipients]):
+            if group < 0:
+                continue  # recipient has no group value to match on
+            in_group = group_codes == group
+            group_donors = np.flatnonzero(donors & in_group)
+            if len(group_donors) == 0:
+                continue
+
+            cache_key = (donor_key, int(group))
+            if cache_key not in index_cache:
+                index_cache[cache_key] = SpatialIndex(lat[group_donors], lng[group_donors])
+            else:
+                trace.count('cache_hits')
+            index = index_cache[cache_key]
+
+            targets = np.flatnonzero(recipients & in_group)
+            dist, pos = index.query(lat[targets], lng[targets], k, max_distance_km=max_distance_km)
+            found = pos >= 0
+            rows = np.where(found, group_donors[np.where(found, pos, 0)], -1)
+
+            weights = np.where(found, 1.0 / np.maximum(dist, 1e-3) ** power, 0.0)
+            total = weights.sum(axis=1)
+            donor_values = np.where(found, values[np.where(found, rows, 0)], 0.0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                estimate = (weights * donor_values).sum(axis=1) / total
+
+            filled[targets] = np.where(total > 0, estimate, np.nan)
+            neighbour_positions[targets] = rows
+            neighbour_distances[targets] = dist
+
+        fill_rows = np.flatnonzero(~np.isnan(filled))
+        if len(fill_rows) == 0:
+            continue
+
+        fill_values = filled[fill_rows]
+        if column in INTEGER_COLUMNS:
+            fill_values = np.rint(fill_values)
+        elif column == 'medianPrice':
+            fill_values = np.rint(fill_values / 1000.0) * 1000.0
+        else:
+            fill_values = np.round(fill_values, 2)
+        result.loc[result.index[fill_rows], column] = fill_values
+
+        used_positions = neighbour_positions[fill_rows]
+        used = used_positions >= 0
+        used_distances = np.where(used, neighbour_distances[fill_rows], 0.0)
+        mean_distance = used_distances.sum(axis=1) / np.maximum(used.sum(axis=1), 1)
+        provenance.append(pd.DataFrame({
+            'row': fill_rows,
+            'field': column,
+            'value': fill_values,
+            'neighbours': [';'.join(names[p[u]]) for p, u in zip(used_positions, used)],
+            'mean_distance_km': np.round(mean_distance, 2),
+        }))
+
+    columns_out = ['row', 'field', 'value', 'neighbours', 'mean_distance_km']
+    if not provenance:
+        empty = pd.DataFrame(columns=columns_out)
+        return result, empty.astype({'row': np.int64, 'value': np.float64, 'mean_distance_km': np.float64})
+    return result, pd.concat(provenance, ignore_index=True)[columns_out]
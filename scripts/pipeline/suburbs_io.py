@@ -0,0 +1,72 @@
+"""
+Read and write suburbs.csv the way the pipeline scripts expect.
+
+suburbs.csv starts with `#` comment lines (licensing notes) that must be
+kept when the file is rewritten, and missing values are written as empty
+cells rather than "nan". Files are written to a temporary file and swapped
+into place, so readers (the server, a running watch-screenshots.py) never
+see a half-written file.
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from pipeline import CONFIG_JSON, SUBURBS_CSV, trace
+
+
+def read_suburbs_csv(path: Path = SUBURBS_CSV) -> pd.DataFrame:
+    """Load suburbs.csv, skipping the leading comment lines"""
+    with trace.span('load', file=str(path)):
+        return pd.read_csv(path, comment='#')
+
+
+def read_header_comments(path: Path = SUBURBS_CSV) -> List[str]:
+    """Return the leading `#` comment lines of a CSV file"""
+    header_lines = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('#'):
+                header_lines.append(line.rstrip())
+            else:
+                break
+    return header_lines
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path, mode: str = 'w'):
+    """Open a temporary file next to path; it replaces path only if the block succeeds"""
+    path = Path(path)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_suburbs_csv(df: pd.DataFrame, path: Path = SUBURBS_CSV,
+                      header_lines: List[str] = None) -> None:
+    """Write suburbs.csv, preserving the comment header of the existing file"""
+    if header_lines is None:
+        header_lines = read_header_comments(path) if Path(path).exists() else []
+
+    with trace.span('write', file=str(path), rows=len(df)):
+        with atomic_write(path) as f:
+            for line in header_lines:
+                f.write(line + '\n')
+            df.to_csv(f, index=False, lineterminator='\n', na_rep='')
+
+
+def load_config(path: Path = CONFIG_JSON) -> Dict:
+    """Load data/config.json"""
+    with open(path, 'r') as f:
+        return json.load(f)
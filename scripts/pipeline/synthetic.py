@@ -0,0 +1,150 @@
+"""
+Synthetic inputs for benchmarking the pipeline stages.
+
+Generates OCR texts in the "Suburb LGA Victoria $price yield% $rent dist km
+household%" shape of the real comparison-table screenshots, extraction
+tables like improved-extracted-suburbs.csv, and suburbs.csv-shaped tables
+with the known placeholder patterns. Suburb and LGA names are drawn from
+data/suburbs.csv so name-matching stages see realistic vocabulary.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from pipeline import SUBURBS_CSV
+
+TABLE_HEADER = ("Suburb Name Local Government Area State Median House Price "
+                "Gross Rental Yield Median Rent Distance to CBD Family Households")
+
+# OCR artifacts seen in the real screenshots (later stripped by the clean scripts)
+NOISE_TOKENS = ['Rente', 'CBD', 'CBDA Households', 'Householdse', 'e', '_', '(Vic:)']
+
+EXTRACTED_COLUMNS = ['suburb_name', 'lga', 'state', 'source_file', 'median_price',
+                     'rental_yield', 'weekly_rent', 'cbd_distance_km', 'household_percentage']
+
+
+def load_vocabulary(path=SUBURBS_CSV) -> pd.DataFrame:
+    """Suburb/LGA pairs to draw synthetic rows from"""
+    df = pd.read_csv(path, comment='#', usecols=['suburb', 'postcode', 'lga', 'category'])
+    df['lga'] = df['lga'].fillna('Melbourne')
+    return df
+
+
+def synthetic_rows(n: int, rng: np.random.Generator, vocabulary: pd.DataFrame) -> pd.DataFrame:
+    """n table rows with plausible values, as an extraction-style DataFrame"""
+    picks = vocabulary.iloc[rng.integers(0, len(vocabulary), n)].reset_index(drop=True)
+    price = (rng.lognormal(np.log(900_000), 0.35, n) // 1000 * 1000).astype(int)
+    rental_yield = np.round(rng.uniform(0.015, 0.047, n), 3)
+    weekly_rent = np.round(price * rental_yield / 52).astype(int)
+    return pd.DataFrame({
+        'suburb_name': picks['suburb'].to_numpy(),
+        'lga': picks['lga'].to_numpy(),
+        'state': 'Victoria',
+        'median_price': price,
+        'rental_yield': rental_yield,
+        'weekly_rent': weekly_rent,
+        'cbd_distance_km': rng.integers(2, 60, n),
+        'household_percentage': np.round(rng.uniform(0.45, 0.92, n), 3),
+    })
+
+
+def format_ocr_row(row, rng: np.random.Generator, noise: float) -> str:
+    """Render one table row the way EasyOCR reads it, with optional OCR noise"""
+    dollar = 'S' if rng.random() < noise else '$'
+    km = 'km' if rng.random() >= noise else 'kn'
+    parts = [
+        row.suburb_name, row.lga, 'Victoria',
+        f"{dollar}{row.median_price:,}",
+        f"{row.rental_yield * 100:.1f}%",
+        f"{dollar}{row.weekly_rent:,}",
+        f"{row.cbd_distance_km} {km}",
+        f"{row.household_percentage * 100:.1f}%",
+    ]
+    if rng.random() < noise:
+        parts.insert(0, NOISE_TOKENS[rng.integers(0, len(NOISE_TOKENS))])
+    return ' '.join(parts)
+
+
+def synthetic_ocr_corpus(n_documents: int, rows_per_document: int = 10, noise: float = 0.1,
+                         seed: int = 0, vocabulary: Optional[pd.DataFrame] = None) -> Dict[str, Dict]:
+    """
+    Generate OCR documents keyed by source file name.
+
+    Returns {source_file: {'text': str, 'rows': DataFrame of ground truth}}.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = load_vocabulary() if vocabulary is None else vocabulary
+    corpus = {}
+    for i in range(n_documents):
+        source_file = f'Screenshot synthetic {i:05d}.jpg'
+        rows = synthetic_rows(rows_per_document, rng, vocabulary)
+        rows.insert(3, 'source_file', source_file)
+        text = ' '.join([TABLE_HEADER] + [format_ocr_row(r, rng, noise) for r in rows.itertuples()])
+        corpus[source_file] = {'text': text, 'rows': rows}
+    return corpus
+
+
+def synthetic_extracted_table(corpus: Dict[str, Dict]) -> pd.DataFrame:
+    """Concatenate the ground-truth rows of a corpus (extraction table shape)"""
+    return pd.concat([doc['rows'] for doc in corpus.values()], ignore_index=True)[EXTRACTED_COLUMNS]
+
+
+def synthetic_suburbs_table(n: int, seed: int = 0, placeholder_share: float = 0.3,
+                            vocabulary: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    suburbs.csv-shaped table with n rows.
+
+    A `placeholder_share` of rows carry the known placeholder values
+    (medianPrice 0, rentalYield 4.0, commute 0, amenity pattern) so the
+    placeholder scripts have work to do.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = load_vocabulary() if vocabulary is None else vocabulary
+    picks = vocabulary.iloc[rng.integers(0, len(vocabulary), n)].reset_index(drop=True)
+    suffix = np.where(np.arange(n) < len(vocabulary), '', ' ' + (np.arange(n) // len(vocabulary)).astype(str))
+
+    df = pd.DataFrame({
+        'suburb': picks['suburb'].to_numpy() + suffix,
+        'postcode': picks['postcode'].to_numpy(),
+        'lga': picks['lga'].to_numpy(),
+        'latitude': rng.uniform(-38.5, -37.4, n),
+        'longitude': rng.uniform(144.4, 145.8, n),
+    })
+    for name in ['irsd', 'ier', 'ieo']:
+        df[f'{name}_score'] = rng.integers(850, 1150, n)
+        df[f'{name}_decile'] = rng.integers(1, 11, n)
+    df['medianPrice'] = (rng.lognormal(np.log(900_000), 0.35, n) // 1000 * 1000)
+    df['growth1yr'] = np.round(rng.normal(3, 4, n), 2)
+    df['crimeRate'] = np.round(rng.uniform(100, 900, n), 2)
+    df['schoolRating'] = 60.0
+    df['schoolCount'] = rng.integers(0, 12, n)
+    df['primarySchools'] = rng.integers(0, 8, n)
+    df['secondarySchools'] = rng.integers(0, 4, n)
+    df['primaryCommuteMinutes'] = rng.integers(10, 90, n).astype(float)
+    df['secondaryCommuteMinutes'] = rng.integers(20, 120, n).astype(float)
+    df['rentalYield'] = np.round(rng.uniform(1.5, 4.7, n), 2)
+    df['transitScore'] = np.nan
+    df['walkScore'] = np.nan
+    df['parksDensity'] = rng.integers(1, 8, n).astype(float)
+    df['childcareCenters'] = rng.integers(0, 20, n).astype(float)
+    df['shoppingCenters'] = rng.integers(0, 10, n).astype(float)
+    df['cafesRestaurants'] = rng.integers(0, 80, n).astype(float)
+    df['medicalCenters'] = rng.integers(0, 20, n).astype(float)
+    df['bikeScore'] = rng.integers(20, 90, n).astype(float)
+    df['category'] = picks['category'].to_numpy()
+
+    placeholder = rng.random(n) < placeholder_share
+    df.loc[placeholder, 'medianPrice'] = 0
+    df.loc[placeholder, 'rentalYield'] = 4.0
+    df.loc[placeholder, 'primaryCommuteMinutes'] = 0
+    df.loc[placeholder, ['parksDensity', 'childcareCenters', 'shoppingCenters',
+                         'cafesRestaurants', 'medicalCenters', 'bikeScore']] = [3, 3, 2, 10, 2, 50]
+    return df
+
+
+def synthetic_ocr_texts(corpus: Dict[str, Dict]) -> Dict[str, str]:
+    """{source_file: text}, the shape returned by the scripts' load_ocr_data()"""
+    return {source_file: doc['text'] for source_file, doc in corpus.items()}
+
@@ -0,0 +1,151 @@
+"""
+Cell-level diff between two versions of a keyed table.
+
+diff_tables() lines the two versions up by key (suburb, postcode for
+suburbs.csv) and reports inserted and deleted keys, the number of changed
+cells per column and one line per changed cell. Rows are first paired by
+key and content hash (pipeline/row_hashes.py), so only rows whose content
+differs are compared cell by cell; every comparison is a whole-column
+numpy operation. Numbers are compared with a tolerance, so 4.1 written
+back as 4.1000000000000005 is not a change:
+
+    diff = diff_tables(read_suburbs_csv(BACKUP), read_suburbs_csv(), SUBURBS_KEY)
+    diff.changes            # changed cells per column
+    diff.cells              # key columns, column, old, new
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from pipeline.row_hashes import canonical, key_hashes
+
+# Default tolerance: values closer than atol + rtol * |new| are equal
+RTOL = 1e-9
+ATOL = 1e-9
+
+
+@dataclass
+class TableDiff:
+    """Result of one diff_tables() call"""
+    key: List[str]
+    inserted: pd.DataFrame              # key columns of rows only in the new table
+    deleted: pd.DataFrame               # key columns of rows only in the old table
+    changes: pd.Series                  # changed cells per compared column
+    cells: pd.DataFrame                 # key columns, 'column', 'old', 'new'
+    rows_matched: int
+    rows_changed: int
+    added_columns: List[str] = field(default_factory=list)
+    removed_columns: List[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return (self.inserted.empty and self.deleted.empty and self.cells.empty
+                and not self.added_columns and not self.removed_columns)
+
+
+def _is_number(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _changed(old: pd.Series, new: pd.Series, rtol: float, atol: float) -> np.ndarray:
+    """
+    Bool array: which aligned cells differ (two empty cells are equal).
+    Numbers are compared with tolerance, also where only one version
+    stored the column as numbers (e.g. "N/A" flags made it text).
+    """
+    if _is_number(old) and _is_number(new):
+        a = old.to_numpy(dtype=np.float64, na_value=np.nan)
+        b = new.to_numpy(dtype=np.float64, na_value=np.nan)
+        return ~np.isclose(a, b, rtol=rtol, atol=atol, equal_nan=True)
+
+    a = canonical(old.to_frame(), [old.name])[old.name].map(str, na_action='ignore')
+    b = canonical(new.to_frame(), [new.name])[new.name].map(str, na_action='ignore')
+    a_empty, b_empty = a.isna().to_numpy(), b.isna().to_numpy()
+    changed = (a_empty != b_empty) | (~a_empty & ~b_empty & (a.to_numpy() != b.to_numpy()))
+    if not (_is_number(old) or _is_number(new)):
+        return changed
+
+    a_num = pd.to_numeric(old, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    b_num = pd.to_numeric(new, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    numbers = ~np.isnan(a_num) & ~np.isnan(b_num)
+    return np.where(numbers, ~np.isclose(a_num, b_num, rtol=rtol, atol=atol), changed)
+
+
+def diff_tables(old: pd.DataFrame, new: pd.DataFrame, key: Sequence[str],
+                columns: Optional[Sequence[str]] = None,
+                rtol: float = RTOL, atol: float = ATOL) -> TableDiff:
+    """
+    Diff old against new by key over columns (default: every non-key
+    column both tables have, in the new table's order). Raises ValueError
+    for a requested column that is a key or missing from either table.
+
+    Identical rows pair up first; the remaining repeats of a key are
+    matched occurrence by occurrence, in row order. cells is ordered by
+    row of the new table, then column.
+    """
+    key = list(key)
+    shared = [c for c in new.columns if c in old.columns and c not in key]
+    if columns is None:
+        columns = shared
+    else:
+        unknown = [c for c in columns if c not in shared]
+        if unknown:
+            raise ValueError(f"Not a non-key column of both tables: {', '.join(unknown)}")
+        columns = list(columns)
+
+    # Rows with equal key and content hashes are equal and pair up first,
+    # so repeats of a key that only moved are not changes
+    same = pd.Index(key_hashes(old, key + columns)).get_indexer(key_hashes(new, key + columns))
+    old_unmatched = np.ones(len(old), dtype=bool)
+    old_unmatched[same[same >= 0]] = False
+    new_left, old_left = np.flatnonzero(same < 0), np.flatnonzero(old_unmatched)
+
+    # The rest are matched by key and compared cell by cell
+    old_keys = key_hashes(old.iloc[old_left], key)
+    new_keys = key_hashes(new.iloc[new_left], key)
+    in_old = pd.Index(old_keys).get_indexer(new_keys)
+    matched = in_old >= 0
+    new_rows, old_rows = new_left[matched], old_left[in_old[matched]]
+    inserted = new_left[~matched]
+    deleted = old_left[pd.Index(new_keys).get_indexer(old_keys) < 0]
+
+    counts = {}
+    positions, column_ids, old_values, new_values = [], [], [], []
+    for j, name in enumerate(columns):
+        before, after = old[name].iloc[old_rows], new[name].iloc[new_rows]
+        changed = np.flatnonzero(_changed(before, after, rtol, atol))
+        counts[name] = len(changed)
+        if len(changed):
+            positions.append(new_rows[changed])
+            column_ids.append(np.full(len(changed), j))
+            old_values.append(before.to_numpy(dtype=object)[changed])
+            new_values.append(after.to_numpy(dtype=object)[changed])
+
+    if positions:
+        positions, column_ids = np.concatenate(positions), np.concatenate(column_ids)
+        order = np.lexsort((column_ids, positions))
+        positions, column_ids = positions[order], column_ids[order]
+        old_values, new_values = np.concatenate(old_values)[order], np.concatenate(new_values)[order]
+    else:
+        positions = column_ids = np.array([], dtype=int)
+        old_values = new_values = np.array([], dtype=object)
+
+    cells = new[key].iloc[positions].reset_index(drop=True)
+    cells['column'] = np.asarray(columns, dtype=object)[column_ids] if len(columns) else []
+    cells['old'] = old_values
+    cells['new'] = new_values
+
+    return TableDiff(
+        key=key,
+        inserted=new[key].iloc[inserted],
+        deleted=old[key].iloc[deleted],
+        changes=pd.Series(counts, index=columns, dtype=int),
+        cells=cells,
+        rows_matched=int((same >= 0).sum() + matched.sum()),
+        rows_changed=len(np.unique(positions)),
+        added_columns=[c for c in new.columns if c not in old.columns],
+        removed_columns=[c for c in old.columns if c not in new.columns],
+    )
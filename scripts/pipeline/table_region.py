@@ -0,0 +1,121 @@
+"""
+Locate the comparison table in a screenshot before OCR.
+
+The screenshots include browser chrome, page headers and ads around the
+table. OCR'ing them costs detector time and adds noise tokens ("Rente",
+"CBDA Households", ...) that the clean scripts later strip again.
+
+The table is found from its horizontal row rules: the image is smoothed
+along rows (so rules survive JPEG/pixel noise while text does not join
+up), thresholded, and opened with a long horizontal kernel. The largest
+evenly spaced run of rules gives the table's rows; the region is widened
+to include the header above the first rule and the last row below the
+last one. A vertical border just outside the rules widens it sideways.
+
+When fewer than MIN_RULES rules are found, find_table_region() returns
+None and callers OCR the full image.
+
+Only the largest evenly spaced group of rules is kept, so a section break
+or a header taller than HEADER_PITCHES can cut rows off. The crop has only
+been checked on synthetic screenshots and is opt-in
+(HOMESCORE_OCR_TABLE_CROP=1 in ocr-extract-suburb-data.py).
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# A rule must span at least this fraction of the image width
+MIN_RULE_FRACTION = 0.25
+MIN_RULES = 3
+# Rules further apart than this many row pitches start a new group
+MAX_RULE_GAP = 2.5
+# Region beyond the outer rules, in row pitches (header above, last row below)
+HEADER_PITCHES = 2.5
+FOOTER_PITCHES = 1.5
+MARGIN_PX = 8
+# Smoothing along rows before thresholding
+SMOOTH_PX = 15
+
+
+class Region(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+
+def _runs(mask: np.ndarray):
+    """(start, end) index pairs of the True runs in a 1-D mask"""
+    padded = np.concatenate([[False], mask, [False]])
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def rule_masks(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Binary masks of long horizontal and vertical rules"""
+    import cv2
+
+    height, width = gray.shape
+    inverted = cv2.bitwise_not(gray)
+
+    smoothed = cv2.blur(inverted, (SMOOTH_PX, 1))
+    binary = cv2.adaptiveThreshold(smoothed, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 15, -2)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(20, int(width * MIN_RULE_FRACTION)), 1))
+    horizontal = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+
+    smoothed = cv2.blur(inverted, (1, SMOOTH_PX))
+    binary = cv2.adaptiveThreshold(smoothed, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 15, -2)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(20, int(height * MIN_RULE_FRACTION))))
+    vertical = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+    return horizontal, vertical
+
+
+def find_table_region(gray: np.ndarray) -> Optional[Region]:
+    """Bounding box of the table in a grayscale screenshot, or None"""
+    height, width = gray.shape
+    horizontal, vertical = rule_masks(gray)
+
+    rules = _runs(horizontal.any(axis=1))
+    if len(rules) < MIN_RULES:
+        return None
+
+    # Split the rules into groups of evenly spaced lines; keep the largest
+    ys = np.array([start for start, _ in rules])
+    gaps = np.diff(ys)
+    pitch = float(np.median(gaps))
+    breaks = np.flatnonzero(gaps > MAX_RULE_GAP * pitch) + 1
+    groups = np.split(np.arange(len(rules)), breaks)
+    group = max(groups, key=len)
+    if len(group) < MIN_RULES:
+        return None
+    pitch = float(np.median(np.diff(ys[group])))
+
+    first, last = rules[group[0]], rules[group[-1]]
+    columns = np.flatnonzero(horizontal[first[0]:last[1]].any(axis=0))
+    left, right = int(columns[0]), int(columns[-1]) + 1
+    top = max(0, int(first[0] - HEADER_PITCHES * pitch))
+    bottom = min(height, int(last[1] + FOOTER_PITCHES * pitch))
+
+    # Vertical rules at the table's edges (an outer border) widen it
+    # sideways; rules further out belong to other page elements
+    reach = int(pitch)
+    lo, hi = max(0, left - reach), min(width, right + reach)
+    crossing = np.flatnonzero(vertical[first[0]:last[1], lo:hi].any(axis=0)) + lo
+    if len(crossing):
+        left, right = min(left, int(crossing[0])), max(right, int(crossing[-1]) + 1)
+
+    left, right = max(0, left - MARGIN_PX), min(width, right + MARGIN_PX)
+    return Region(left, top, right - left, bottom - top)
+
+
+def crop_to_table(gray: np.ndarray) -> Tuple[np.ndarray, Optional[Region]]:
+    """(cropped image, region), or (gray, None) when no table is found"""
+    region = find_table_region(gray)
+    if region is None:
+        return gray, None
+    return gray[region.y:region.y + region.height, region.x:region.x + region.width], region
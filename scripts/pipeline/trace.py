@@ -0,0 +1,213 @@
+"""
+Stage tracing and profiling for the pipeline scripts.
+
+Scripts wrap their stages in spans and bump counters:
+
+    from pipeline import trace
+
+    with trace.span('load', file='data/suburbs.csv'):
+        df = pd.read_csv(...)
+    trace.count('rows_touched', len(df))
+
+    if __name__ == "__main__":
+        trace.run(main)
+
+Tracing is off unless the script is started with `--trace PATH` (or the
+HOMESCORE_TRACE environment variable is set), so the calls cost a flag
+check in normal runs. The trace is written in Chrome trace-event format
+(load it in chrome://tracing or https://ui.perfetto.dev), or as JSON lines
+when PATH ends in `.jsonl`. Counters, regex call counts and peak RSS are
+recorded alongside the spans. `--profile [PATH]` additionally runs the
+script under cProfile and writes a .prof file (view with snakeviz or
+`python3 -m pstats`).
+
+Standard span names: load, preprocess, ocr, parse, fix, clean, write.
+"""
+
+import argparse
+import contextlib
+import cProfile
+import json
+import os
+import re
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+TRACE_ENV = 'HOMESCORE_TRACE'
+
+# Module-level re functions counted as 'regex_calls' while tracing
+_REGEX_FUNCTIONS = ['search', 'match', 'fullmatch', 'sub', 'subn', 'split', 'findall', 'finditer']
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class Tracer:
+    """Collects spans and counters for one process"""
+
+    def __init__(self):
+        self.enabled = False
+        self.events: List[Dict] = []
+        self.counters: Counter = Counter()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._original_re: Dict[str, Callable] = {}
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def enable(self):
+        self.enabled = True
+        self._origin = time.perf_counter()
+        self._patch_re()
+
+    def disable(self):
+        self.enabled = False
+        for name, fn in self._original_re.items():
+            setattr(re, name, fn)
+        self._original_re.clear()
+
+    def _patch_re(self):
+        if self._original_re:
+            return
+
+        def counted(fn):
+            def wrapper(*args, **kwargs):
+                self.counters['regex_calls'] += 1
+                return fn(*args, **kwargs)
+            return wrapper
+
+        for name in _REGEX_FUNCTIONS:
+            self._original_re[name] = getattr(re, name)
+            setattr(re, name, counted(self._original_re[name]))
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        if not self.enabled:
+            yield
+            return
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            end = self._now_us()
+            event = {'name': name, 'cat': 'stage', 'ph': 'X', 'ts': round(start, 1),
+                     'dur': round(end - start, 1), 'pid': self._pid, 'tid': threading.get_ident(),
+                     'args': {**args, 'peak_rss_mb': round(peak_rss_mb(), 1)}}
+            with self._lock:
+                self.events.append(event)
+                self.events.append(self._counter_event(end))
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            self.counters[name] += n
+
+    def _counter_event(self, ts: float) -> Dict:
+        return {'name': 'counters', 'ph': 'C', 'ts': round(ts, 1), 'pid': self._pid,
+                'args': dict(self.counters)}
+
+    def summary(self) -> Dict:
+        """Total time per span name, counters and peak RSS"""
+        totals: Dict[str, Dict] = {}
+        for event in self.events:
+            if event['ph'] != 'X':
+                continue
+            entry = totals.setdefault(event['name'], {'calls': 0, 'total_ms': 0.0})
+            entry['calls'] += 1
+            entry['total_ms'] += event['dur'] / 1000
+        return {
+            'spans': {name: {'calls': v['calls'], 'total_ms': round(v['total_ms'], 2)}
+                      for name, v in totals.items()},
+            'counters': dict(self.counters),
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+        }
+
+    def write(self, path: Path):
+        """Write the trace as Chrome trace JSON, or JSON lines for *.jsonl"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = self.events + [self._counter_event(self._now_us())]
+        summary = self.summary()
+        if path.suffix == '.jsonl':
+            with open(path, 'w') as f:
+                for event in events:
+                    f.write(json.dumps(event) + '\n')
+                f.write(json.dumps({'name': 'summary', 'ph': 'M', 'args': summary}) + '\n')
+        else:
+            with open(path, 'w') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': summary}, f)
+
+
+TRACER = Tracer()
+
+
+def span(name: str, **args):
+    """Time a stage: `with trace.span('parse', file=name): ...`"""
+    return TRACER.span(name, **args)
+
+
+def count(name: str, n: int = 1):
+    """Add n to a counter (rows_touched, cache_hits, llm_tokens, ...)"""
+    TRACER.count(name, n)
+
+
+def enabled() -> bool:
+    return TRACER.enabled
+
+
+def _parse_trace_args(argv: List[str]):
+    """Split --trace/--profile off argv so the script's own parsing never sees them"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--trace', type=Path, default=os.environ.get(TRACE_ENV) or None)
+    parser.add_argument('--profile', nargs='?', type=Path, const=True, default=None)
+    return parser.parse_known_args(argv)
+
+
+def run(main: Callable, name: Optional[str] = None):
+    """
+    Run a script's main() with optional tracing/profiling from the command line.
+
+    --trace PATH     write a trace (Chrome JSON, or JSON lines for .jsonl)
+    --profile [PATH] run under cProfile (default: <trace or script>.prof)
+    """
+    options, rest = _parse_trace_args(sys.argv[1:])
+    sys.argv[1:] = rest
+    name = name or Path(sys.argv[0]).stem
+
+    if options.trace is None and options.profile is None:
+        return main()
+
+    TRACER.enable()
+    profiler = cProfile.Profile() if options.profile is not None else None
+    try:
+        with span(name):
+            if profiler:
+                profiler.enable()
+            try:
+                return main()
+            finally:
+                if profiler:
+                    profiler.disable()
+    finally:
+        TRACER.disable()
+        if options.trace is not None:
+            TRACER.write(options.trace)
+            print(f"🧭 Trace written: {options.trace}", file=sys.stderr)
+        if profiler:
+            if options.profile is True:
+                base = options.trace if options.trace is not None else Path(f'{name}.trace')
+                options.profile = base.with_suffix('.prof')
+            profiler.dump_stats(str(options.profile))
+            print(f"🧭 Profile written: {options.profile}", file=sys.stderr)
+        summary = TRACER.summary()
+        print(f"🧭 Peak RSS {summary['peak_rss_mb']} MB, counters: {summary['counters']}", file=sys.stderr)
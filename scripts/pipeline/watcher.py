@@ -0,0 +1,143 @@
+"""
+Watch a folder for new or rewritten files.
+
+On Linux the folder is watched with inotify (through libc via ctypes, no
+extra package); elsewhere, or if inotify cannot be set up, it is polled
+by comparing (size, mtime) snapshots. Either way events are debounced: a
+file is reported once nothing has happened to it for `debounce_s`
+seconds, so a screenshot still being copied in is never picked up
+half-written, and files added together arrive as one batch.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+_EVENT = struct.Struct('iIII')
+
+
+class InotifyBackend:
+    """Names of files created, written or moved into a folder (Linux only)"""
+
+    def __init__(self, folder: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # IN_MODIFY keeps a file pending while a slow copy is still writing it
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(str(folder)), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"cannot watch {folder}")
+
+    def wait(self, timeout: float) -> Set[str]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        names = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            _, _, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            if name:
+                names.add(os.fsdecode(name))
+            offset += _EVENT.size + length
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingBackend:
+    """Names of files whose (size, mtime) changed since the last poll"""
+
+    def __init__(self, folder: Path, interval_s: float = 2.0):
+        self.folder = folder
+        self.interval_s = interval_s
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout: float) -> Set[str]:
+        time.sleep(min(timeout, self.interval_s))
+        current = self._scan()
+        changed = {name for name, state in current.items() if self.snapshot.get(name) != state}
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class FolderWatcher:
+    """
+    Iterate over batches of settled files matching `pattern` in a folder.
+
+    Files already in the folder are not reported; pass them to the
+    consumer separately if a catch-up run is wanted.
+    """
+
+    def __init__(self, folder: Path, pattern: str = '*.jpg', debounce_s: float = 5.0,
+                 poll_s: float = 2.0, use_inotify: bool = True):
+        self.folder = Path(folder)
+        self.pattern = pattern
+        self.debounce_s = debounce_s
+        self.backend = None
+        if use_inotify:
+            try:
+                self.backend = InotifyBackend(self.folder)
+            except (OSError, AttributeError):
+                self.backend = None
+        if self.backend is None:
+            self.backend = PollingBackend(self.folder, poll_s)
+
+    @property
+    def mode(self) -> str:
+        return 'inotify' if isinstance(self.backend, InotifyBackend) else 'polling'
+
+    def batches(self) -> Iterator[List[Path]]:
+        pending: Dict[str, float] = {}
+        try:
+            while True:
+                now = time.monotonic()
+                if pending:
+                    timeout = max(0.05, min(t + self.debounce_s for t in pending.values()) - now)
+                else:
+                    timeout = 1.0
+                for name in self.backend.wait(timeout):
+                    if fnmatch.fnmatch(name, self.pattern):
+                        pending[name] = time.monotonic()
+
+                now = time.monotonic()
+                settled = sorted(name for name, t in pending.items() if now - t >= self.debounce_s)
+                for name in settled:
+                    del pending[name]
+                batch = [self.folder / name for name in settled if (self.folder / name).is_file()]
+                if batch:
+                    yield batch
+        finally:
+            self.backend.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Precompute Suburb Scores
+
+Final pipeline stage: computes the normalized A-Score component scores
+(investment, location, accessibility, lifestyle) for every suburb and
+every strategy, and writes them as a compact score table together with
+the A-Score tier weights the client uses
+(react-app/src/utils/strategyWeights.json).
+
+Clients then score a suburb with a single weighted dot product:
+    total = sum(weights[strategy][c] * scores[strategy][suburb][c])
+
+Output: data/suburb-scores.json
+{
+  "version": "<sha256 prefix of suburbs.csv>",
+  "components": ["investment", ...],
+  "weights": {"investment": [0.45, 0.30, 0.15, 0.10], ...},
+  "suburb": [...], "postcode": [...],
+  "scores": {"investment": [[c1, c2, c3, c4], ...], ...}
+}
+
+Usage: python3 scripts/precompute-suburb-scores.py
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from pipeline import DATA_DIR, SUBURBS_CSV, trace
+from pipeline.scores import COMPONENTS, compute_component_scores, strategy_weights
+from pipeline.suburbs_io import read_suburbs_csv
+
+OUTPUT_JSON = DATA_DIR / 'suburb-scores.json'
+
+
+def file_version(path: Path) -> str:
+    """Short content hash used to tie the score table to its source CSV"""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute per-suburb component scores")
+    parser.add_argument('--csv', type=Path, default=SUBURBS_CSV, help="source suburbs CSV")
+    parser.add_argument('--output', type=Path, default=OUTPUT_JSON, help="score table to write")
+    args = parser.parse_args()
+
+    print("🧮 Precompute Suburb Scores")
+    print("=" * 60)
+
+    df = read_suburbs_csv(args.csv)
+    weights = strategy_weights()
+    print(f"✅ Loaded {len(df)} suburbs and {len(weights)} strategies")
+
+    start = time.perf_counter()
+    scores = {strategy: np.round(compute_component_scores(df, strategy), 1).tolist()
+              for strategy in weights}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"✅ Computed {len(df) * len(weights) * len(COMPONENTS)} component scores in {elapsed_ms:.1f} ms")
+
+    table = {
+        'version': file_version(args.csv),
+        'generated': datetime.now().isoformat(),
+        'components': COMPONENTS,
+        'weights': weights,
+        'suburb': df['suburb'].tolist(),
+        'postcode': df['postcode'].astype(str).tolist(),
+        'scores': scores,
+    }
+
+    args.output.parent.mkdir(exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(table, f, separators=(',', ':'))
+    print(f"💾 Saved score table: {args.output} ({args.output.stat().st_size / 1024:.1f} KB)")
+
+    print("\n📊 Strategy weights:")
+    for strategy, w in weights.items():
+        print(f"  {strategy:12} " + ", ".join(f"{c} {v:.0%}" for c, v in zip(COMPONENTS, w)))
+
+    print("\n✅ Score precompute complete!")
+
+
+if __name__ == "__main__":
+    trace.run(main)
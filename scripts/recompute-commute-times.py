@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Recompute commute times in suburbs.csv from latitude/longitude.
+
+Uses the geospatial commute estimator (scripts/pipeline/commute.py) to
+compute primaryCommuteMinutes / secondaryCommuteMinutes for every suburb
+against the target locations in data/config.json, in one vectorized batch.
+
+By default only empty commute cells are filled; real data is preserved.
+
+Usage:
+    python3 scripts/recompute-commute-times.py
+    python3 scripts/recompute-commute-times.py --overwrite
+    python3 scripts/recompute-commute-times.py --target "work=-37.8136,144.9631" --dry-run
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pipeline import CONFIG_JSON, SUBURBS_CSV, trace
+from pipeline.commute import apply_commute_estimates, load_target_locations
+from pipeline.suburbs_io import load_config, read_suburbs_csv, write_suburbs_csv
+
+
+def parse_target(value: str):
+    """Parse a NAME=LAT,LNG target argument"""
+    try:
+        name, coords = value.split('=', 1)
+        lat, lng = (float(part) for part in coords.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected NAME=LAT,LNG, got: {value}")
+    return name.strip(), (lat, lng)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute suburb commute times from coordinates")
+    parser.add_argument('--csv', type=Path, default=SUBURBS_CSV, help="suburbs CSV to update")
+    parser.add_argument('--config', type=Path, default=CONFIG_JSON, help="config.json with target locations")
+    parser.add_argument('--target', type=parse_target, action='append', default=[],
+                        help="extra/override target as NAME=LAT,LNG (writes <NAME>CommuteMinutes)")
+    parser.add_argument('--overwrite', action='store_true', help="replace existing commute values too")
+    parser.add_argument('--dry-run', action='store_true', help="compute and report without saving")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RECOMPUTE COMMUTE TIMES FROM COORDINATES")
+    print("=" * 70)
+    print()
+
+    df = read_suburbs_csv(args.csv)
+    targets = load_target_locations(load_config(args.config))
+    targets.update(dict(args.target))
+
+    if not targets:
+        print("❌ No target locations found in config or --target arguments")
+        sys.exit(1)
+
+    print(f"  Suburbs: {len(df)}")
+    for name, (lat, lng) in targets.items():
+        print(f"  Target {name}: ({lat:.4f}, {lng:.4f})")
+    print()
+
+    start = time.perf_counter()
+    written = apply_commute_estimates(df, targets, overwrite=args.overwrite)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Computed {len(df) * len(targets)} suburb/target pairs in {elapsed_ms:.1f} ms")
+    for column, count in written.items():
+        print(f"  {column}: {count} values written")
+    print()
+
+    if args.dry_run:
+        print("Dry run - no changes saved")
+        return
+
+    write_suburbs_csv(df, args.csv)
+    print(f"Updated file: {args.csv}")
+    print()
+    print("Done!")
+
+
+if __name__ == '__main__':
+    trace.run(main)
@@ -16,6 +16,10 @@ This script replaces placeholders with empty strings (which become empty in CSV)
 import pandas as pd
 from pathlib import Path
 
+from pipeline import trace
+from pipeline.quality import report_quality
+from pipeline.schema import SUBURBS_SCHEMA, validate
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 EXISTING_CSV = BASE_DIR / 'data' / 'suburbs.csv'
@@ -30,7 +34,8 @@ def main():
     
     # Load dataset
     print("Loading suburbs.csv...")
-    df = pd.read_csv(EXISTING_CSV, comment='#')
+    with trace.span('load'):
+        df = pd.read_csv(EXISTING_CSV, comment='#')
     
     print(f"  Total suburbs: {len(df)}")
     print()
@@ -53,28 +58,31 @@ def main():
     print("Removing placeholder data...")
     print("-" * 70)
     
+    # Placeholder values are declared in pipeline/schema.py
+    placeholders = validate(df, SUBURBS_SCHEMA).masks['placeholder']
+    
     # Remove price placeholders (0)
-    price_mask = df['medianPrice'] == 0
+    price_mask = placeholders['medianPrice']
     changes['price'] = price_mask.sum()
     df.loc[price_mask, 'medianPrice'] = pd.NA
     if changes['price'] > 0:
         print(f"  Removed {changes['price']} price placeholders (0 → empty)")
     
     # Remove yield placeholders (4.0)
-    yield_mask = df['rentalYield'] == 4.0
+    yield_mask = placeholders['rentalYield']
     changes['yield'] = yield_mask.sum()
     df.loc[yield_mask, 'rentalYield'] = pd.NA
     if changes['yield'] > 0:
         print(f"  Removed {changes['yield']} yield placeholders (4.0 → empty)")
     
     # Remove commute placeholders (0)
-    commute1_mask = df['primaryCommuteMinutes'] == 0
+    commute1_mask = placeholders['primaryCommuteMinutes']
     changes['commute1'] = commute1_mask.sum()
     df.loc[commute1_mask, 'primaryCommuteMinutes'] = pd.NA
     if changes['commute1'] > 0:
         print(f"  Removed {changes['commute1']} primary commute placeholders (0 → empty)")
     
-    commute2_mask = df['secondaryCommuteMinutes'] == 0
+    commute2_mask = placeholders['secondaryCommuteMinutes']
     changes['commute2'] = commute2_mask.sum()
     df.loc[commute2_mask, 'secondaryCommuteMinutes'] = pd.NA
     if changes['commute2'] > 0:
@@ -108,21 +116,14 @@ def main():
     print(f"  Secondary commute cleared: {changes['commute2']}")
     print(f"  Amenity patterns cleared: {changes['amenities']}")
     print(f"  Total fields cleared: {sum(changes.values())}")
+    trace.count('rows_touched', int(sum(changes.values())))
     print()
     
     # Calculate new completeness
-    print("NEW DATA COMPLETENESS:")
-    print("-" * 70)
-    total = len(df)
-    print(f"  medianPrice: {df['medianPrice'].notna().sum()}/{total} ({df['medianPrice'].notna().sum()/total*100:.1f}%)")
-    print(f"  rentalYield: {df['rentalYield'].notna().sum()}/{total} ({df['rentalYield'].notna().sum()/total*100:.1f}%)")
-    print(f"  primaryCommuteMinutes: {df['primaryCommuteMinutes'].notna().sum()}/{total} ({df['primaryCommuteMinutes'].notna().sum()/total*100:.1f}%)")
-    print(f"  secondaryCommuteMinutes: {df['secondaryCommuteMinutes'].notna().sum()}/{total} ({df['secondaryCommuteMinutes'].notna().sum()/total*100:.1f}%)")
-    print(f"  parksDensity: {df['parksDensity'].notna().sum()}/{total} ({df['parksDensity'].notna().sum()/total*100:.1f}%)")
-    print(f"  childcareCenters: {df['childcareCenters'].notna().sum()}/{total} ({df['childcareCenters'].notna().sum()/total*100:.1f}%)")
-    print(f"  shoppingCenters: {df['shoppingCenters'].notna().sum()}/{total} ({df['shoppingCenters'].notna().sum()/total*100:.1f}%)")
-    print(f"  cafesRestaurants: {df['cafesRestaurants'].notna().sum()}/{total} ({df['cafesRestaurants'].notna().sum()/total*100:.1f}%)")
-    print(f"  medicalCenters: {df['medicalCenters'].notna().sum()}/{total} ({df['medicalCenters'].notna().sum()/total*100:.1f}%)")
+    report_quality(df, 'remove-placeholders', [
+        'medianPrice', 'rentalYield', 'primaryCommuteMinutes', 'secondaryCommuteMinutes',
+        'parksDensity', 'childcareCenters', 'shoppingCenters', 'cafesRestaurants', 'medicalCenters',
+    ], title="NEW DATA COMPLETENESS:\n" + "-" * 70)
     print()
     
     # Save updated CSV
@@ -138,11 +139,12 @@ def main():
                 break
     
     # Write with header comments
-    with open(OUTPUT_CSV, 'w') as f:
-        for line in header_lines:
-            f.write(line + '\n')
-        # Write CSV with empty strings for NA values
-        df.to_csv(f, index=False, lineterminator='\n', na_rep='')
+    with trace.span('write'):
+        with open(OUTPUT_CSV, 'w') as f:
+            for line in header_lines:
+                f.write(line + '\n')
+            # Write CSV with empty strings for NA values
+            df.to_csv(f, index=False, lineterminator='\n', na_rep='')
     
     print("  File saved successfully")
     print()
@@ -152,5 +154,5 @@ def main():
     print("Done!")
 
 if __name__ == '__main__':
-    main()
+    trace.run(main)
 
@@ -2,10 +2,11 @@
 """
 Update existing suburbs.csv with extracted data, replacing ONLY placeholder values.
 
-Placeholder patterns identified:
+Placeholder patterns identified (declared in pipeline/schema.py):
 - medianPrice = 0
 - rentalYield = 4.0 (common placeholder)
-- primaryCommuteMinutes = 0 (when extracted has distance data)
+- primaryCommuteMinutes = 0 (estimated from coordinates, or from extracted
+  distance data when a suburb has no coordinates)
 - growth1yr = 0 (when other data suggests it's placeholder)
 
 This script preserves real data and only replaces clear placeholders.
@@ -14,6 +15,12 @@ This script preserves real data and only replaces clear placeholders.
 import pandas as pd
 import sys
 from pathlib import Path
+from typing import Dict
+
+from pipeline import trace
+from pipeline.commute import estimate_commute_minutes, load_target_locations
+from pipeline.schema import SUBURBS_SCHEMA, validate
+from pipeline.suburbs_io import load_config, write_suburbs_csv
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
@@ -22,61 +29,24 @@ EXTRACTED_CSV = BASE_DIR / 'data' / 'final-extracted-suburbs.csv'
 BACKUP_CSV = BASE_DIR / 'data' / 'suburbs.csv.backup'
 OUTPUT_CSV = BASE_DIR / 'data' / 'suburbs.csv'
 
-def is_placeholder_price(value):
-    """Check if price is a placeholder."""
-    return pd.isna(value) or value == 0
-
-def is_placeholder_yield(value):
-    """Check if yield is a placeholder (4.0 is common placeholder)."""
-    return pd.isna(value) or value == 4.0
-
-def is_placeholder_commute(value):
-    """Check if commute time is a placeholder."""
-    return pd.isna(value) or value == 0
-
-def is_placeholder_growth(value):
-    """Check if growth is a placeholder (0 might be real, but if other data is placeholder, likely this is too)."""
-    return pd.isna(value) or value == 0
-
 def km_to_minutes(km):
     """Convert CBD distance in km to approximate commute minutes.
-    Assumes average speed of 50km/h for mixed traffic."""
+    Assumes average speed of 50km/h for mixed traffic.
+    Only used for suburbs without coordinates (see pipeline/commute.py)."""
     if pd.isna(km) or km == 0:
         return None
     return int(km * 60 / 50)  # km * (60 min/h) / (50 km/h)
 
-def main():
-    print("=" * 70)
-    print("UPDATE SUBURBS.CSV WITH EXTRACTED DATA (Placeholders Only)")
-    print("=" * 70)
-    print()
-    
-    # Load datasets
-    print("Loading datasets...")
-    existing_df = pd.read_csv(EXISTING_CSV, comment='#')
-    extracted_df = pd.read_csv(EXTRACTED_CSV)
-    
-    print(f"  Existing suburbs: {len(existing_df)}")
-    print(f"  Extracted suburbs: {len(extracted_df)}")
-    print()
-    
-    # Normalize suburb names for matching
-    existing_df['suburb_norm'] = existing_df['suburb'].str.lower().str.strip()
-    extracted_df['suburb_norm'] = extracted_df['suburb_name'].str.lower().str.strip()
-    
-    # Find matches
-    existing_set = set(existing_df['suburb_norm'])
-    extracted_set = set(extracted_df['suburb_norm'])
-    matches = existing_set.intersection(extracted_set)
-    
-    print(f"Matched suburbs: {len(matches)}")
-    print()
-    
-    # Create backup
-    print(f"Creating backup: {BACKUP_CSV}")
-    existing_df.to_csv(BACKUP_CSV, index=False)
-    print("  Backup created successfully")
-    print()
+def update_placeholders(existing_df: pd.DataFrame, extracted_df: pd.DataFrame, matches,
+                        commute_estimates: pd.DataFrame) -> Dict[str, int]:
+    """
+    Fill placeholder values of the matched suburbs in existing_df (in
+    place) from extracted_df; both carry a suburb_norm column.
+    Empty cells and the placeholder values of SUBURBS_SCHEMA count as
+    placeholders. Returns the number of updates per field.
+    """
+    # Cells that are empty or hold a placeholder, before any update
+    no_data = validate(existing_df, SUBURBS_SCHEMA).no_data()
     
     # Track updates
     updates = {
@@ -86,10 +56,6 @@ def main():
         'growth': 0,
     }
     
-    # Update matched suburbs
-    print("Updating suburbs (placeholders only)...")
-    print("-" * 70)
-    
     for suburb_norm in sorted(matches):
         # Get rows
         existing_idx = existing_df[existing_df['suburb_norm'] == suburb_norm].index[0]
@@ -99,14 +65,14 @@ def main():
         updated_fields = []
         
         # Update medianPrice if placeholder
-        if is_placeholder_price(existing_df.loc[existing_idx, 'medianPrice']):
+        if no_data.at[existing_idx, 'medianPrice']:
             if pd.notna(extracted_row.get('median_price')):
                 existing_df.loc[existing_idx, 'medianPrice'] = int(extracted_row['median_price'])
                 updates['price'] += 1
                 updated_fields.append('price')
         
         # Update rentalYield if placeholder
-        if is_placeholder_yield(existing_df.loc[existing_idx, 'rentalYield']):
+        if no_data.at[existing_idx, 'rentalYield']:
             if pd.notna(extracted_row.get('rental_yield')):
                 # Convert to percentage (extracted is decimal like 0.034 = 3.4%)
                 yield_pct = extracted_row['rental_yield'] * 100
@@ -115,17 +81,22 @@ def main():
                 updated_fields.append('yield')
         
         # Update primaryCommuteMinutes if placeholder
-        if is_placeholder_commute(existing_df.loc[existing_idx, 'primaryCommuteMinutes']):
-            if pd.notna(extracted_row.get('cbd_distance_km')):
+        if no_data.at[existing_idx, 'primaryCommuteMinutes']:
+            commute_min = None
+            if 'primaryCommuteMinutes' in commute_estimates.columns:
+                estimate = commute_estimates.loc[existing_idx, 'primaryCommuteMinutes']
+                if pd.notna(estimate):
+                    commute_min = int(estimate)
+            if commute_min is None and pd.notna(extracted_row.get('cbd_distance_km')):
                 commute_min = km_to_minutes(extracted_row['cbd_distance_km'])
-                if commute_min:
-                    existing_df.loc[existing_idx, 'primaryCommuteMinutes'] = commute_min
-                    updates['commute'] += 1
-                    updated_fields.append('commute')
+            if commute_min:
+                existing_df.loc[existing_idx, 'primaryCommuteMinutes'] = commute_min
+                updates['commute'] += 1
+                updated_fields.append('commute')
         
         # Update growth1yr if placeholder (be more conservative here)
         # Only update if price was also a placeholder (suggests all data is placeholder)
-        if is_placeholder_growth(existing_df.loc[existing_idx, 'growth1yr']):
+        if no_data.at[existing_idx, 'growth1yr']:
             # Don't update growth from extracted data as it's not available
             # This is just for tracking
             pass
@@ -133,6 +104,52 @@ def main():
         if updated_fields:
             print(f"  {suburb_name:30} Updated: {', '.join(updated_fields)}")
     
+    return updates
+
+def main():
+    print("=" * 70)
+    print("UPDATE SUBURBS.CSV WITH EXTRACTED DATA (Placeholders Only)")
+    print("=" * 70)
+    print()
+    
+    # Load datasets
+    print("Loading datasets...")
+    with trace.span('load'):
+        existing_df = pd.read_csv(EXISTING_CSV, comment='#')
+        extracted_df = pd.read_csv(EXTRACTED_CSV)
+    
+    print(f"  Existing suburbs: {len(existing_df)}")
+    print(f"  Extracted suburbs: {len(extracted_df)}")
+    print()
+    
+    # Normalize suburb names for matching
+    existing_df['suburb_norm'] = existing_df['suburb'].str.lower().str.strip()
+    extracted_df['suburb_norm'] = extracted_df['suburb_name'].str.lower().str.strip()
+    
+    # Find matches
+    existing_set = set(existing_df['suburb_norm'])
+    extracted_set = set(extracted_df['suburb_norm'])
+    matches = existing_set.intersection(extracted_set)
+    
+    print(f"Matched suburbs: {len(matches)}")
+    print()
+    
+    # Estimate commute times to the configured primary location for all
+    # suburbs in one batch (used where the existing value is a placeholder)
+    targets = load_target_locations(load_config())
+    commute_estimates = estimate_commute_minutes(existing_df, {k: v for k, v in targets.items() if k == 'primary'})
+    
+    # Create backup
+    print(f"Creating backup: {BACKUP_CSV}")
+    existing_df.to_csv(BACKUP_CSV, index=False)
+    print("  Backup created successfully")
+    print()
+    
+    # Update matched suburbs
+    print("Updating suburbs (placeholders only)...")
+    print("-" * 70)
+    updates = update_placeholders(existing_df, extracted_df, matches, commute_estimates)
+    
     print()
     print("=" * 70)
     print("UPDATE SUMMARY")
@@ -140,6 +157,7 @@ def main():
     print(f"  Prices updated: {updates['price']}")
     print(f"  Yields updated: {updates['yield']}")
     print(f"  Commute times updated: {updates['commute']}")
+    trace.count('rows_touched', sum(updates.values()))
     print(f"  Total suburbs updated: {sum(1 for s in matches if True)}")
     print()
     
@@ -158,11 +176,8 @@ def main():
             else:
                 break
     
-    # Write with header comments
-    with open(OUTPUT_CSV, 'w') as f:
-        for line in header_lines:
-            f.write(line + '\n')
-        existing_df.to_csv(f, index=False, lineterminator='\n')
+    # Write with header comments (swapped into place atomically)
+    write_suburbs_csv(existing_df, OUTPUT_CSV, header_lines=header_lines)
     
     print("  File saved successfully")
     print()
@@ -172,5 +187,5 @@ def main():
     print("Done!")
 
 if __name__ == '__main__':
-    main()
+    trace.run(main)
 
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Watch 'extra suburb data/' and ingest new screenshots as they arrive.
+
+Re-running the whole chain (ocr-extract -> improved-extract -> fix-names-v2
+-> clean -> final-clean -> update-suburbs) for every new screenshot OCRs
+and re-parses the entire folder. Every stage of that chain works per row
+or per source file, so this daemon runs it for the new files only:
+
+1. new screenshots are checked against the perceptual-hash index (near-
+   duplicates are reported, and skipped with HOMESCORE_OCR_DEDUPE_SKIP=1) and
+   OCR'd (text goes to the OCR store, the report gains their entries);
+2. their text is parsed, name-fixed and cleaned with the stage scripts'
+   own functions, and their rows replace any earlier rows for the same
+   files in each intermediate CSV. Rows whose suburb and LGA the parser
+   found in the suburbs.csv gazetteer skip the name-fixing and cleaning
+   stages;
+3. placeholders of the matched suburbs are filled in suburbs.csv.
+
+Every file is written to a temporary file and swapped into place, so the
+server and other readers never see a half-written CSV or report.
+
+On start-up, screenshots the report does not know yet are ingested first
+(--once stops after that). The folder is then watched with inotify, or
+polled where inotify is unavailable (--poll forces polling); a file is
+ingested once it has not changed for --debounce seconds.
+
+The LLM parser (llm-parse) is not run; it needs API access and stays a
+manual step.
+
+Usage:
+    python3 scripts/watch-screenshots.py
+    python3 scripts/watch-screenshots.py --once
+    python3 scripts/watch-screenshots.py --poll --poll-interval 5 --debounce 10
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from pipeline import BASE_DIR, trace
+from pipeline.commute import estimate_commute_minutes, load_target_locations
+from pipeline.gazetteer import load_gazetteer
+from pipeline.loader import load_script
+from pipeline.ocr_store import OCRStore, entry_text
+from pipeline.suburbs_io import (atomic_write, load_config, read_header_comments,
+                                 read_suburbs_csv, write_suburbs_csv)
+from pipeline.watcher import FolderWatcher
+
+# Paths are relative to the repo root, like the stage scripts'
+GROUND_TRUTH_CSV = Path('data/grok-extracted-suburb-data.csv')
+IMPROVED_CSV = Path('data/improved-extracted-suburbs.csv')
+FIXED_CSV = Path('data/fixed-extracted-suburbs.csv')
+CLEANED_CSV = Path('data/cleaned-extracted-suburbs.csv')
+FINAL_CSV = Path('data/final-extracted-suburbs.csv')
+
+DEFAULT_DEBOUNCE_S = 5.0
+DEFAULT_POLL_S = 2.0
+
+
+def load_stages() -> SimpleNamespace:
+    """The stage scripts whose functions the daemon runs"""
+    return SimpleNamespace(
+        ocr=load_script('ocr-extract-suburb-data'),
+        improved=load_script('improved-ocr-extractor'),
+        fix=load_script('fix-suburb-names-v2'),
+        clean=load_script('clean-suburb-data'),
+        final=load_script('final-clean-suburb-data'),
+        update=load_script('update-suburbs-with-extracted'),
+    )
+
+
+def load_report(path: Path) -> Dict:
+    """The OCR extraction report, or an empty one before the first run"""
+    if not path.exists():
+        return {'results': [], 'skipped_duplicates': {}}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def pending_files(folder_files: List[Path], report: Dict) -> List[Path]:
+    """Screenshots the report has neither a result nor a duplicate entry for"""
+    known = {r['source_file'] for r in report.get('results', [])}
+    known.update(report.get('skipped_duplicates') or {})
+    return [path for path in folder_files if path.name not in known]
+
+
+def load_ground_truth(files: List[str]) -> pd.DataFrame:
+    """Ground-truth rows of the given screenshots (empty if there is no ground truth file)"""
+    if not GROUND_TRUTH_CSV.exists():
+        return pd.DataFrame(columns=['suburb_name', 'source_file', 'lga'])
+    ground_truth = pd.read_csv(GROUND_TRUTH_CSV)
+    return ground_truth[ground_truth['source_file'].isin(files)]
+
+
+def replace_file_rows(path: Path, rows: pd.DataFrame, files: List[str]) -> pd.DataFrame:
+    """Swap the rows of `files` in an intermediate CSV for `rows`; returns the new table"""
+    if path.exists():
+        table = pd.read_csv(path)
+        table = table[~table['source_file'].isin(files)]
+        table = pd.concat([table, rows], ignore_index=True) if not rows.empty else table
+    else:
+        table = rows
+    with atomic_write(path) as f:
+        table.to_csv(f, index=False)
+    return table
+
+
+def ocr_new_files(stages: SimpleNamespace, files: List[Path],
+                  folder_files: List[Path]) -> Tuple[List[Dict], Dict[str, str]]:
+    """De-duplicate and OCR new screenshots; returns (results, {duplicate: representative})"""
+    ocr = stages.ocr
+    duplicates = {}
+    if ocr.DEDUPE_DISTANCE >= 0:
+        files, duplicates = ocr.dedupe_screenshots(files, folder_files=folder_files)
+        action = 'skipped' if ocr.DEDUPE_SKIP else "OCR'd anyway"
+        for name, representative in duplicates.items():
+            print(f"🔁 {name}: near-duplicate of {representative}, {action}")
+    if not files:
+        return [], duplicates
+
+    ocr.OCR_TEXT_STORE = OCRStore(ocr.OCR_TEXT_DB)
+    try:
+        # New files arrive a few at a time, so there is nothing to overlap
+        results = ocr.process_sequential(files)
+    finally:
+        ocr.OCR_TEXT_STORE.close()
+        ocr.OCR_TEXT_STORE = None
+    return results, duplicates
+
+
+def write_ocr_outputs(stages: SimpleNamespace, report: Dict, results: List[Dict],
+                      duplicates: Dict[str, str]) -> Dict:
+    """Merge new results into the report and rewrite the OCR outputs; returns the new report"""
+    ocr = stages.ocr
+    new_names = {r['source_file'] for r in results} | set(duplicates)
+    all_results = [r for r in report.get('results', []) if r['source_file'] not in new_names]
+    all_results.extend(results)
+    earlier = {**(report.get('skipped_duplicates') or {}), **(report.get('near_duplicates') or {})}
+    all_duplicates = {name: rep for name, rep in earlier.items() if name not in new_names}
+    all_duplicates.update(duplicates)
+
+    report = ocr.generate_report(all_results, all_duplicates)
+    with trace.span('write'):
+        with atomic_write(ocr.OUTPUT_JSON) as f:
+            json.dump(ocr.group_by_suburb(all_results), f, indent=2)
+        table = ocr.results_table(all_results)
+        if not table.empty:
+            with atomic_write(ocr.OUTPUT_CSV) as f:
+                table.to_csv(f, index=False)
+        with atomic_write(ocr.REPORT_FILE) as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+def parse_and_clean(stages: SimpleNamespace, results: List[Dict]) -> pd.DataFrame:
+    """
+    Run improved-extract, fix-names-v2, clean and final-clean on the new
+    screenshots, updating each intermediate CSV; returns their final rows.
+    """
+    files = [r['source_file'] for r in results]
+    ocr_data = {}
+    for result in results:
+        text = entry_text(result)
+        if text:
+            ocr_data[result['source_file']] = text
+    ground_truth = load_ground_truth(files)
+
+    with trace.span('parse', files=len(ocr_data)):
+        rows = []
+        for source_file, text in ocr_data.items():
+            rows.extend(stages.improved.extract_suburb_data_improved(text, source_file))
+        df = stages.improved.merge_with_ground_truth(rows, ground_truth)
+    replace_file_rows(IMPROVED_CSV, df, files)
+    if df.empty:
+        for path in (FIXED_CSV, CLEANED_CSV, FINAL_CSV):
+            replace_file_rows(path, df, files)
+        return df
+
+    # Rows named from the suburbs.csv gazetteer come out of the parser
+    # clean; only the other rows go through the repair stages
+    named = df[load_gazetteer().known_rows(df)]
+    rest = df.drop(index=named.index)
+    print(f"  {len(named)} rows named from the gazetteer, {len(rest)} to repair")
+
+    if not rest.empty:
+        with trace.span('fix'):
+            rest = stages.fix.fix_all_suburb_names(rest, ocr_data, ground_truth)
+            rest = stages.fix.fix_specific_issues(rest, ocr_data)
+            rest = stages.fix.fix_lga_names_comprehensive(rest, ground_truth)
+    replace_file_rows(FIXED_CSV, pd.concat([named, rest]).sort_index(), files)
+
+    if not rest.empty:
+        with trace.span('clean'):
+            rest['suburb_name'] = rest['suburb_name'].apply(stages.clean.clean_suburb_name)
+            rest = stages.clean.fix_known_suburb_names(rest)
+            rest = stages.clean.fix_lga_names(rest)
+            rest = stages.clean.remove_invalid_names(rest)
+    replace_file_rows(CLEANED_CSV, pd.concat([named, rest]).sort_index(), files)
+
+    with trace.span('clean', step='final'):
+        if not rest.empty:
+            rest['suburb_name'] = rest['suburb_name'].apply(stages.final.clean_suburb_name_final)
+            rest = stages.final.fix_specific_suburb_names(rest)
+            rest = stages.final.fix_lga_names_final(rest)
+        # The final stage starts from a freshly read CSV (default index)
+        df = pd.concat([named, rest]).sort_index().reset_index(drop=True)
+        df = stages.final.remove_duplicates_and_clean(df)
+    replace_file_rows(FINAL_CSV, df, files)
+    return df
+
+
+def update_suburbs(stages: SimpleNamespace, final_rows: pd.DataFrame) -> Dict[str, int]:
+    """Fill suburbs.csv placeholders from the new final rows; rewrites it only if something changed"""
+    update = stages.update
+    if final_rows.empty:
+        return {}
+    existing_df = read_suburbs_csv(update.EXISTING_CSV)
+    extracted_df = final_rows.copy()
+    existing_df['suburb_norm'] = existing_df['suburb'].str.lower().str.strip()
+    extracted_df['suburb_norm'] = extracted_df['suburb_name'].str.lower().str.strip()
+    matches = set(existing_df['suburb_norm']) & set(extracted_df['suburb_norm'])
+    if not matches:
+        return {}
+
+    # Commute estimates are only needed for the matched suburbs
+    matched = existing_df[existing_df['suburb_norm'].isin(matches)]
+    targets = load_target_locations(load_config())
+    commute_estimates = estimate_commute_minutes(matched, {k: v for k, v in targets.items() if k == 'primary'})
+
+    with trace.span('fix', step='update_placeholders'):
+        updates = update.update_placeholders(existing_df, extracted_df, matches, commute_estimates)
+    if sum(updates.values()):
+        header_lines = read_header_comments(update.EXISTING_CSV)
+        shutil.copy2(update.EXISTING_CSV, update.BACKUP_CSV)
+        write_suburbs_csv(existing_df.drop(columns=['suburb_norm']), update.OUTPUT_CSV,
+                          header_lines=header_lines)
+    return updates
+
+
+def ingest(stages: SimpleNamespace, files: List[Path], report: Dict) -> Dict:
+    """Run the whole chain for a batch of new screenshots; returns the updated report"""
+    folder_files = sorted(stages.ocr.SCREENSHOT_DIR.glob("*.jpg"))
+    print(f"\n📥 Ingesting {len(files)} screenshot(s)")
+    print("=" * 60)
+    with trace.span('ingest', files=len(files)):
+        results, duplicates = ocr_new_files(stages, files, folder_files)
+        report = write_ocr_outputs(stages, report, results, duplicates)
+        final_rows = parse_and_clean(stages, results)
+        updates = update_suburbs(stages, final_rows)
+    trace.count('rows_touched', len(final_rows))
+
+    print(f"✅ {len(results)} OCR'd, {len(duplicates)} duplicate(s), {len(final_rows)} suburb rows")
+    if updates and sum(updates.values()):
+        print(f"💾 suburbs.csv: {updates['price']} price(s), {updates['yield']} yield(s), "
+              f"{updates['commute']} commute time(s) filled")
+    else:
+        print("ℹ️  suburbs.csv unchanged")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch the screenshot folder and ingest new files")
+    parser.add_argument('--once', action='store_true', help="ingest files not yet processed, then exit")
+    parser.add_argument('--poll', action='store_true', help="poll the folder instead of using inotify")
+    parser.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE_S,
+                        help="seconds a file must be unchanged before it is ingested")
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_S,
+                        help="seconds between folder scans when polling")
+    args = parser.parse_args()
+
+    # The stage scripts use paths relative to the repo root
+    os.chdir(BASE_DIR)
+    stages = load_stages()
+    ocr = stages.ocr
+    ocr.require_packages('pd')
+    folder = ocr.SCREENSHOT_DIR
+    if not folder.exists():
+        print(f"❌ Screenshot directory not found: {folder}")
+        sys.exit(1)
+
+    print("👀 Screenshot Watcher")
+    print("=" * 60)
+    with trace.span('load'):
+        ocr.load_suburb_names()
+        report = load_report(ocr.REPORT_FILE)
+
+    backlog = pending_files(sorted(folder.glob("*.jpg")), report)
+    if backlog:
+        report = ingest(stages, backlog, report)
+    else:
+        print("✅ All screenshots already ingested")
+    if args.once:
+        return
+
+    watcher = FolderWatcher(folder, debounce_s=args.debounce, poll_s=args.poll_interval,
+                            use_inotify=not args.poll)
+    print(f"\n👀 Watching {folder}/ ({watcher.mode}, {args.debounce:g}s debounce); Ctrl-C to stop")
+    try:
+        for batch in watcher.batches():
+            try:
+                report = ingest(stages, batch, report)
+            except Exception as e:
+                # Keep watching; the files are retried when they change again
+                print(f"❌ Ingest failed for {', '.join(p.name for p in batch)}: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+if __name__ == "__main__":
+    trace.run(main)
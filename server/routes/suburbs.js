@@ -1,4 +1,5 @@
 const express = require('express');
+const crypto = require('crypto');
 const fs = require('fs').promises;
 const path = require('path');
 const { authenticateToken, requirePaidAccess } = require('../middleware/auth');
@@ -8,6 +9,7 @@ const router = express.Router();
 
 // Load suburbs data (in production, this would come from database)
 let suburbsData = null;
+let suburbsVersion = null;
 
 async function loadSuburbsData() {
   if (suburbsData) return suburbsData;
@@ -15,7 +17,9 @@ async function loadSuburbsData() {
   try {
     const dataPath = path.join(__dirname, '../../data/suburbs.csv');
     const csvContent = await fs.readFile(dataPath, 'utf-8');
-    const lines = csvContent.split('\n');
+    suburbsVersion = crypto.createHash('sha256').update(csvContent).digest('hex').slice(0, 16);
+    // Skip the leading "#" licensing comments
+    const lines = csvContent.split('\n').filter(line => !line.startsWith('#'));
     const headers = lines[0].split(',');
     
     suburbsData = lines.slice(1)
@@ -36,6 +40,98 @@ async function loadSuburbsData() {
   }
 }
 
+// Static search index built by scripts/build-search-index.py
+let searchIndex = null;
+
+async function loadSearchIndex() {
+  if (searchIndex !== null) return searchIndex || null;
+
+  const suburbs = await loadSuburbsData();
+  try {
+    const indexPath = path.join(__dirname, '../../data/suburbs-search-index.json');
+    const index = JSON.parse(await fs.readFile(indexPath, 'utf-8'));
+
+    // Ignore an index built from a different suburbs.csv
+    if (index.source_version !== suburbsVersion) {
+      console.warn('Search index is stale, falling back to linear search');
+      searchIndex = false;
+      return null;
+    }
+
+    const byKey = new Map(suburbs.map(s => [`${s.suburb}|${s.postcode}`, s]));
+    index.suburbs = index.docs.map(([name, postcode]) => byKey.get(`${name}|${postcode}`));
+    searchIndex = index;
+  } catch (error) {
+    searchIndex = false;
+  }
+  return searchIndex || null;
+}
+
+function normalizeSearchText(text) {
+  return (text || '').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+}
+
+// Every document containing q, ranked: trigram intersection (all documents
+// for queries under 3 characters), then verify.
+function infixMatches(index, q) {
+  let candidates;
+  if (q.length < 3) {
+    candidates = index.docs.map((doc, id) => id);
+  } else {
+    const postings = [];
+    for (let i = 0; i + 3 <= q.length; i++) {
+      postings.push(index.trigrams[q.slice(i, i + 3)] || []);
+    }
+    postings.sort((a, b) => a.length - b.length);
+    let found = new Set(postings[0]);
+    for (const ids of postings.slice(1)) {
+      found = new Set(ids.filter(id => found.has(id)));
+      if (!found.size) break;
+    }
+    candidates = [...found];
+  }
+
+  const tierOf = ([name, postcode, lga]) => {
+    const [n, p, l] = [name, postcode, lga].map(normalizeSearchText);
+    if (n.startsWith(q)) return 0;
+    if (n.includes(q)) return 1;
+    if (p.includes(q)) return 2;
+    if (l.includes(q)) return 3;
+    return -1;
+  };
+  // Same order as SearchIndex._rank_key: tier, name length, name, postcode, id
+  const compare = (x, y) => (x < y ? -1 : x > y ? 1 : 0);
+  return candidates
+    .map(id => ({ id, tier: tierOf(index.docs[id]), name: index.docs[id][0], postcode: index.docs[id][1] }))
+    .filter(m => m.tier >= 0)
+    .sort((a, b) => a.tier - b.tier || a.name.length - b.name.length || compare(a.name, b.name)
+      || compare(a.postcode, b.postcode) || a.id - b.id)
+    .map(m => m.id);
+}
+
+// Ranked lookup: prefix posting lists first, then the documents that contain
+// the query elsewhere, up to limit. Prefix lists are capped (50 documents),
+// so a capped list shorter than the limit is skipped in favour of the
+// trigram ranking of every match.
+function searchWithIndex(index, query, limit) {
+  const q = normalizeSearchText(query);
+  if (!q || !(limit > 0)) return [];
+
+  const maxPostings = index.max_prefix_postings || 50;
+  const prefix = q.length <= index.max_prefix_length ? index.prefix[q] : undefined;
+  let docIds = [];
+  if (prefix && (prefix.length < maxPostings || limit <= prefix.length)) {
+    docIds = prefix.slice(0, limit);
+  }
+  if (docIds.length < limit) {
+    const seen = new Set(docIds);
+    const rest = infixMatches(index, q).filter(id => !seen.has(id));
+    docIds = docIds.concat(rest.slice(0, limit - docIds.length));
+  }
+
+  return docIds.map(id => index.suburbs[id]).filter(Boolean);
+}
+
 // Get all suburbs (requires paid access for full data)
 router.get('/', authenticateToken, requirePaidAccess, async (req, res) => {
   try {
@@ -57,15 +153,18 @@ router.post('/search', authenticateToken, async (req, res) => {
     }
 
     const suburbs = await loadSuburbsData();
+    const index = await loadSearchIndex();
     const searchQuery = query.toLowerCase().trim();
     
-    const results = suburbs
-      .filter(suburb => {
-        const name = (suburb.suburb || '').toLowerCase();
-        const postcode = (suburb.postcode || '').toLowerCase();
-        return name.includes(searchQuery) || postcode.includes(searchQuery);
-      })
-      .slice(0, parseInt(limit));
+    const results = index
+      ? searchWithIndex(index, searchQuery, parseInt(limit))
+      : suburbs
+        .filter(suburb => {
+          const name = (suburb.suburb || '').toLowerCase();
+          const postcode = (suburb.postcode || '').toLowerCase();
+          return name.includes(searchQuery) || postcode.includes(searchQuery);
+        })
+        .slice(0, parseInt(limit));
 
     // Log search history for paid users
     if (req.user.subscriptionStatus === 'active') {